@@ -0,0 +1,6 @@
+"""
+**Замеры производительности**
+
+Скрипты замеров запускаются из корня репозитория как модули: ``python -m benchmarks.<имя модуля>``, а все вместе (со сравнением с
+эталоном) - как пакет: ``python -m benchmarks``
+"""
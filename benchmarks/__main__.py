@@ -0,0 +1,220 @@
+"""
+**Набор замеров производительности**
+
+Запускает все (или указанные) скрипты замеров, выводит результаты таблицей или в виде JSON, сравнивает их с сохраненным эталоном и
+отмечает ухудшения больше допустимого порога. Каждый скрипт замеров возвращает из run() словарь "вариант - значение", где значение
+тем лучше, чем меньше (время на вызов, время на байт, память на экземпляр). Каждый скрипт сначала выполняется вхолостую (прогрев), а
+затем несколько раз, и для каждого варианта берется лучшее значение, а разброс значений (шум) добавляется к допустимому порогу.
+Результаты, полученные в другом окружении (интерпретатор, процессор), с эталоном не сравниваются
+
+Запуск: ``python -m benchmarks [скрипт ...] [--json ФАЙЛ|-] [--baseline ФАЙЛ] [--save] [--threshold ДОЛЯ] [--repeat N]
+[--warmup N] [--any-environment]``
+
+Код возврата - 1, если найдено хотя бы одно ухудшение (для CI)
+"""
+
+import json
+import os
+import platform
+import sys
+from argparse import ArgumentParser
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SUITE: Dict[str, Dict[str, Any]] = {
+    'message_construct': {},
+    'message_hash': {},
+    'message_decoders': {'sizes': [1]},                               # по умолчанию - только 1 МБ (наивные варианты медленные)
+    'message_memory': {},
+    'validator_construct': {},
+    'validator_validate': {},
+    'validator_schema': {},
+    'block_header': {},
+}
+""" Скрипты замеров (модули пакета benchmarks) и аргументы их функции run() """
+
+BASELINE = Path(__file__).with_name('baseline.json')
+""" Файл эталонных результатов по умолчанию """
+
+THRESHOLD = 0.25
+""" Допустимое ухудшение по умолчанию (доля от эталонного значения) """
+
+REPEAT = 5
+""" Количество запусков каждого скрипта по умолчанию """
+
+WARMUP = 1
+""" Количество запусков каждого скрипта вхолостую (до замеров) по умолчанию """
+
+Results = Dict[str, Dict[str, float]]
+""" Результаты: скрипт - вариант - значение """
+
+
+def collect(names: List[str], repeat: int = REPEAT, warmup: int = WARMUP) -> Tuple[Results, Results]:
+    """
+    Выполнение замеров
+
+    :param names: скрипты замеров
+    :param repeat: количество запусков каждого скрипта
+    :param warmup: количество запусков каждого скрипта вхолостую
+    :return: лучшие значения и разброс значений (доля от лучшего) по каждому варианту каждого скрипта
+    """
+
+    results: Results = {}
+    noise: Results = {}
+
+    for name in names:
+        run = import_module(f'{__package__}.{name}').run
+
+        for _ in range(warmup):                                       # прогрев: импорт, кеши, частота процессора
+            run(**SUITE[name])
+
+        samples: Dict[str, List[float]] = {}
+        for _ in range(repeat):
+            for case, value in run(**SUITE[name]).items():
+                samples.setdefault(case, []).append(value)
+
+        results[name] = {case: round(min(values), 3) for case, values in samples.items()}
+        noise[name] = {case: round((max(values) - min(values)) / min(values), 3) if min(values) else 0.0
+                       for case, values in samples.items()}
+
+    return results, noise
+
+
+def compare(results: Results, baseline: Results, threshold: float = THRESHOLD, noise: Optional[Results] = None,
+            baseline_noise: Optional[Results] = None) -> List[Dict[str, Any]]:
+    """
+    Сравнение результатов с эталоном (сравниваются только варианты, которые есть и там, и там). К порогу добавляется наибольший из
+    разбросов значений варианта (текущего и эталонного): шумный вариант должен ухудшиться сильнее, чтобы это считалось ухудшением
+
+    :param results: результаты
+    :param baseline: эталонные результаты
+    :param threshold: допустимое ухудшение (доля от эталонного значения)
+    :param noise: разброс текущих значений
+    :param baseline_noise: разброс эталонных значений
+    :return: ухудшения (скрипт, вариант, эталонное и текущее значения, их отношение)
+    """
+
+    regressions = []
+
+    for name, cases in results.items():
+        for case, value in cases.items():
+            expected = baseline.get(name, {}).get(case)
+            spread = max((noise or {}).get(name, {}).get(case, 0.0), (baseline_noise or {}).get(name, {}).get(case, 0.0))
+            if expected and value > expected * (1 + threshold + spread):
+                regressions.append({
+                    'benchmark': name, 'case': case, 'baseline': expected, 'current': value, 'ratio': value / expected
+                })
+
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    """
+    Сведения об окружении (результаты разных машин и версий Python между собой не сравнимы)
+
+    :return: сведения об окружении
+    """
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': str(os.cpu_count()),
+    }
+
+
+def load(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Загрузка эталона
+
+    :param path: путь к файлу
+    :return: эталон (окружение, результаты, разброс) или ``None``, если файла нет
+    """
+
+    if not path.exists():
+        return None
+
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def report(results: Results, baseline: Optional[Results], regressions: List[Dict[str, Any]]) -> None:
+    """
+    Вывод результатов таблицей (с отношением к эталону, ухудшения отмечаются)
+
+    :param results: результаты
+    :param baseline: эталонные результаты
+    :param regressions: ухудшения
+    :return: ``None``
+    """
+
+    worse = {(item['benchmark'], item['case']) for item in regressions}
+
+    for name, cases in results.items():
+        print(name)
+        for case, value in cases.items():
+            expected = (baseline or {}).get(name, {}).get(case)
+            ratio = f'{value / expected:>8.2f}x' if expected else ' ' * 9
+            mark = '  <- ухудшение' if (name, case) in worse else ''
+            print(f'  {case:<40}{value:>14.2f}{ratio}{mark}')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Запуск набора замеров из командной строки
+
+    :param argv: аргументы командной строки
+    :return: код возврата (1 - найдены ухудшения)
+    """
+
+    parser = ArgumentParser(prog='python -m benchmarks', description='Замеры производительности Message и Validator')
+    parser.add_argument('names', nargs='*', metavar='скрипт', help=f'скрипты замеров (по умолчанию - все): {", ".join(SUITE)}')
+    parser.add_argument('--json', metavar='ФАЙЛ', help='записать результаты в JSON (- для вывода вместо таблицы)')
+    parser.add_argument('--baseline', type=Path, default=BASELINE, metavar='ФАЙЛ', help='файл эталонных результатов')
+    parser.add_argument('--save', action='store_true', help='сохранить результаты как эталонные')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, metavar='ДОЛЯ', help='допустимое ухудшение (без учета шума)')
+    parser.add_argument('--repeat', type=int, default=REPEAT, metavar='N', help='количество запусков каждого скрипта')
+    parser.add_argument('--warmup', type=int, default=WARMUP, metavar='N', help='количество запусков вхолостую')
+    parser.add_argument('--any-environment', action='store_true', help='сравнивать с эталоном, полученным в другом окружении')
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in SUITE]
+    if unknown:
+        parser.error(f'неизвестные скрипты замеров: {", ".join(unknown)}')
+
+    results, noise = collect(args.names or list(SUITE), args.repeat, args.warmup)
+    stored = load(args.baseline)
+    current = environment()
+    baseline = stored and stored['results']
+    compared = bool(stored) and (args.any_environment or stored.get('environment') == current)
+
+    if stored and not compared:                                       # результаты разных окружений между собой не сравнимы
+        print(f'Предупреждение: эталон {args.baseline} получен в другом окружении ({stored.get("environment")}), сравнение '
+              f'пропущено', file=sys.stderr)
+
+    regressions = compare(results, baseline, args.threshold, noise, stored.get('noise')) if compared else []
+    document = {'environment': current, 'results': results, 'noise': noise, 'compared': compared, 'regressions': regressions}
+
+    if args.json == '-':
+        json.dump(document, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        report(results, baseline if compared else None, regressions)
+        if args.json:
+            Path(args.json).write_text(json.dumps(document, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    if args.save:                                                     # эталон хранит окружение, результаты и разброс
+        keep = stored if stored and stored.get('environment') == current else {}  # результаты другого окружения не смешиваем
+        document = {
+            'environment': current,
+            'results': dict(keep.get('results', {}), **results),      # (результаты незапущенных скриптов сохраняются)
+            'noise': dict(keep.get('noise', {}), **noise),
+        }
+        args.baseline.write_text(json.dumps(document, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
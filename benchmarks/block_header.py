@@ -0,0 +1,48 @@
+"""
+**Разбор и хеширование последовательности заголовков блоков**
+
+Синхронизация "сначала заголовки": замер времени разбора непрерывного буфера заголовков (представления без копирования против
+распаковки всех полей каждого заголовка) и пакетного хеширования (без создания заголовков против хеширования каждого заголовка)
+
+Запуск: ``python -m benchmarks.block_header [количество заголовков]``
+"""
+
+import sys
+from timeit import timeit
+from typing import Dict
+
+from shared.classes.block.header import HEADER, HEADER_SIZE, BlockHeader
+
+COUNT = 100_000
+""" Количество заголовков по умолчанию """
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество заголовков
+    :return: наносекунд на заголовок по каждому варианту
+    """
+
+    data = b''.join(HEADER.pack(1, bytes(32), bytes(32), i, 0x1D00FFFF, i) for i in range(count))
+
+    def unpack_all() -> None:
+        [HEADER.unpack_from(data, i) for i in range(0, len(data), HEADER_SIZE)]
+
+    def hash_each() -> None:
+        [header.hash() for header in BlockHeader.parse_many(data)]
+
+    return {
+        'распаковка всех полей': timeit(unpack_all, number=1) / count * 1e9,
+        'BlockHeader.parse_many': timeit(lambda: BlockHeader.parse_many(data), number=1) / count * 1e9,
+        'хеширование по одному': timeit(hash_each, number=1) / count * 1e9,
+        'BlockHeader.hash_many': timeit(lambda: BlockHeader.hash_many(data), number=1) / count * 1e9,
+    }
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, ns in run(n).items():
+        print(f'{name:<28}{ns:>10.1f} нс/заголовок')
@@ -0,0 +1,62 @@
+"""
+**Создание Message: типы исходных данных и кодировки**
+
+Замер времени создания сообщения размером с заголовок блока из данных разных типов (bytes, bytearray, memoryview), из строк в
+разных кодировках (в том числе короткой строки в кодировке по умолчанию) и из порций текста (from_text). Исходные данные создаются
+заранее и в замер не попадают
+
+Запуск: ``python -m benchmarks.message_construct [количество вызовов]``
+"""
+
+import sys
+from timeit import timeit
+from typing import Dict
+
+from shared.classes.crypto.message import Encoding, Message
+
+COUNT = 100_000
+""" Количество вызовов по умолчанию """
+
+SIZE = 80
+""" Размер данных сообщения в байтах (размер заголовка блока) """
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество вызовов
+    :return: наносекунд на создание сообщения по каждому варианту
+    """
+
+    data = bytes(range(SIZE))
+    text = 'ж' * SIZE
+    cases = {
+        'bytes': (data, Encoding.bnr),
+        'bytearray': (bytearray(data), Encoding.bnr),
+        'memoryview': (memoryview(data), Encoding.bnr),
+        'str, utf-8': (text, Encoding.utf8),
+        'str, cp1251': (text, Encoding.cp1251),
+        'str, koi8-r': (text, Encoding.koi8r),
+        'str, hex': (data.hex(), Encoding.hex),
+        'str, bin': (''.join(map('{:08b}'.format, data)), Encoding.bin),
+    }
+
+    result = {
+        name: timeit(lambda: Message(source, encoding), number=count) / count * 1e9
+        for name, (source, encoding) in cases.items()
+    }
+
+    chunks = [text[:SIZE // 2], text[SIZE // 2:]]                     # текст, поступающий порциями
+    result['str, по умолчанию (abc)'] = timeit(lambda: Message('abc'), number=count) / count * 1e9
+    result['from_text, utf-8'] = timeit(lambda: Message.from_text(chunks), number=count) / count * 1e9
+    result['from_text, cp1251'] = timeit(lambda: Message.from_text(chunks, Encoding.cp1251), number=count) / count * 1e9
+
+    return result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, ns in run(n).items():
+        print(f'{name:<28}{ns:>10.1f} нс/вызов')
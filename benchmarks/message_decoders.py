@@ -0,0 +1,105 @@
+"""
+**Декодирование строк: шестнадцатеричные и бинарные строки в Message**
+
+Сравнение декодеров Message (bytes.fromhex, преобразование бинарной строки широкими порциями) с наивным посимвольным
+декодированием на строках нескольких размеров. Исходные строки создаются заранее и в замер не попадают
+
+Запуск: ``python -m benchmarks.message_decoders [размер в МБ ...]``
+"""
+
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from shared.classes.crypto.message import Encoding, Message
+
+SIZES = [1, 10, 100]
+""" Размеры декодированных данных по умолчанию (в мегабайтах) """
+
+MB = 1_048_576
+""" Байтов в мегабайте """
+
+
+def naive_hex(data: str) -> bytearray:
+    """
+    Наивное декодирование шестнадцатеричной строки (по паре символов)
+
+    :param data: шестнадцатеричная строка
+    :return: байты
+    """
+
+    digits = ''.join(ch for ch in data if not ch.isspace())
+    return bytearray(int(digits[i:i + 2], 16) for i in range(0, len(digits), 2))
+
+
+def naive_bin(data: str) -> bytearray:
+    """
+    Наивное декодирование бинарной строки (по биту)
+
+    :param data: бинарная строка
+    :return: байты
+    """
+
+    out = bytearray()
+    byte = bits = 0
+
+    for ch in data:
+        if ch.isspace():
+            continue
+        byte = (byte << 1) | (ch == '1')
+        bits += 1
+        if bits == 8:
+            out.append(byte)
+            byte = bits = 0
+
+    return out
+
+
+def measure(func: Callable[[], object]) -> float:
+    """
+    Замер времени выполнения (лучшее из трех, в миллисекундах)
+
+    :param func: замеряемая функция
+    :return: миллисекунд
+    """
+
+    best = float('inf')
+
+    for _ in range(3):
+        started = perf_counter()
+        func()
+        best = min(best, perf_counter() - started)
+
+    return best * 1000
+
+
+def run(sizes: List[int] = SIZES) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param sizes: размеры декодированных данных (в мегабайтах)
+    :return: миллисекунд по каждому варианту
+    """
+
+    result = {}
+
+    for size in sizes:
+        data = bytes(range(256)) * (size * MB // 256)
+        text_hex = data.hex(' ', 32)                                  # с пробелами, как в дампах
+        text_bin = ''.join(map('{:08b}'.format, data))
+
+        result[f'hex, {size} МБ'] = measure(lambda: Message(text_hex, Encoding.hex))
+        result[f'bin, {size} МБ'] = measure(lambda: Message(text_bin, Encoding.bin))
+
+        if size == min(sizes):                                        # наивные варианты слишком медленные для больших размеров
+            result[f'hex (наивно), {size} МБ'] = measure(lambda: naive_hex(text_hex))
+            result[f'bin (наивно), {size} МБ'] = measure(lambda: naive_bin(text_bin))
+
+    return result
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]] or SIZES
+
+    for name, ms in run(args).items():
+        print(f'{name:<28}{ms:>12.1f} мс')
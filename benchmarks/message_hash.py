@@ -0,0 +1,73 @@
+"""
+**Скорость хеширования: реализации методов хеширования и размеры данных**
+
+Замер времени хеширования данных разного размера каждой зарегистрированной реализацией метода хеширования. Результат - наносекунд
+на байт (чем меньше, тем лучше), чтобы размеры можно было сравнивать между собой. Эталонная реализация на чистом Python
+замеряется только на небольших данных
+
+Запуск: ``python -m benchmarks.message_hash [время замера одного варианта в секундах]``
+"""
+
+import sys
+from time import perf_counter
+from typing import Dict
+
+from shared.classes.crypto.message import Message, Method, list_backends
+
+SIZES = [64, 1_024, 65_536, 1_048_576]
+""" Размеры данных в байтах """
+
+SLOW_SIZE = 1_024
+""" Наибольший размер данных для медленных (не ускоренных) реализаций """
+
+DURATION = 0.2
+""" Время замера одного варианта по умолчанию (в секундах) """
+
+
+def measure(message: Message, backend: str, duration: float) -> float:
+    """
+    Замер времени хеширования (лучшее время одного хеширования за отведенное время)
+
+    :param message: сообщение
+    :param backend: наименование реализации
+    :param duration: время замера в секундах
+    :return: секунд на одно хеширование
+    """
+
+    best = float('inf')
+    deadline = perf_counter() + duration
+
+    while True:
+        started = perf_counter()
+        message.hash(backend)                                         # явно указанная реализация хеширует заново (без кеша)
+        finished = perf_counter()
+        best = min(best, finished - started)
+        if finished > deadline:
+            return best
+
+
+def run(duration: float = DURATION) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param duration: время замера одного варианта в секундах
+    :return: наносекунд на байт по каждому варианту
+    """
+
+    result = {}
+
+    for backend in list_backends(Method.sha256):
+        for size in SIZES:
+            if not backend.accelerated and size > SLOW_SIZE:
+                continue
+            message = Message(bytes(size))
+            result[f'{backend.nme}, {size} Б'] = measure(message, backend.nme, duration) / size * 1e9
+
+    return result
+
+
+if __name__ == '__main__':
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else DURATION
+
+    for name, ns in run(seconds).items():
+        print(f'{name:<28}{ns:>10.2f} нс/байт')
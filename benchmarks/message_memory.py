@@ -0,0 +1,68 @@
+"""
+**Память на экземпляр: Message и FrozenMessage**
+
+Замер (через tracemalloc) памяти, которую занимает один экземпляр сообщения при массовом создании объектов размером с заголовок
+блока. Исходные данные создаются заранее и в замер не попадают (их одинаково хранят оба варианта)
+
+Запуск: ``python -m benchmarks.message_memory [количество экземпляров]``
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from shared.classes.crypto.message import Encoding, FrozenMessage, Message
+
+COUNT = 100_000
+""" Количество экземпляров по умолчанию """
+
+SIZE = 80
+""" Размер данных одного сообщения в байтах (размер заголовка блока) """
+
+
+def measure(factory: Callable, items: List[bytes], digest: bool = False) -> float:
+    """
+    Замер памяти, выделенной при создании экземпляров (в байтах на экземпляр)
+
+    :param factory: функция создания экземпляра по данным
+    :param items: исходные данные
+    :param digest: вычислять ли хеш каждого экземпляра (хеш, сохраняемый экземпляром, тоже учитывается)
+    :return: байтов на экземпляр
+    """
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(item) for item in items]
+
+    if digest:
+        for obj in objects:
+            obj.hash()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(items)
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество экземпляров
+    :return: байтов на экземпляр по каждому варианту
+    """
+
+    items = [i.to_bytes(SIZE, 'little') for i in range(count)]
+
+    return {
+        'Message': measure(lambda item: Message(item, Encoding.bnr), items),
+        'FrozenMessage': measure(FrozenMessage, items),
+        'FrozenMessage (с хешем)': measure(FrozenMessage, items, digest=True),
+    }
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, size in run(n).items():
+        print(f'{name:<28}{size:>10.1f} байт/экземпляр')
@@ -0,0 +1,55 @@
+"""
+**Создание Validator**
+
+Замер времени создания валидатора: с пустым реестром проверенных методов
+(проверка сигнатур и поиск raise выполняются заново) и с заполненным
+(повторное создание валидатора с теми же методами)
+
+Запуск: ``python -m benchmarks.validator_construct [количество вызовов]``
+"""
+
+import sys
+from timeit import timeit
+from typing import Any, Callable, Dict
+
+from shared.classes.basic.abstractions.validator import Validator, _registry
+
+from .validator_validate import is_bytes, is_hash
+
+COUNT = 2_000
+""" Количество вызовов по умолчанию """
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество вызовов
+    :return: наносекунд на создание валидатора по каждому варианту
+    """
+
+    methods = [is_bytes, is_hash]
+
+    def per_call(func: Callable[[], Any]) -> float:
+        return timeit(func, number=count) / count * 1e9
+
+    def cold() -> None:
+        _registry.clear()
+        Validator(methods)
+
+    result = {
+        'пустой реестр': per_call(cold),
+        'заполненный реестр': per_call(lambda: Validator(methods)),
+        'заполненный реестр (статистика)':
+            per_call(lambda: Validator(methods, instrument=True)),
+    }
+    _registry.clear()
+
+    return result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, ns in run(n).items():
+        print(f'{name:<36}{ns:>12.1f} нс/вызов')
@@ -0,0 +1,97 @@
+"""
+**Схема против отдельных методов проверки**
+
+Сравнение времени валидации записи транзакции набором отдельных методов
+проверки (по одному на ограничение, с поиском параметров в ``params``, как
+в ``examples/validation.py``) и одной функцией, сгенерированной схемой
+
+Запуск: ``python -m benchmarks.validator_schema [количество вызовов]``
+"""
+
+import sys
+from timeit import timeit
+from typing import Any, Callable, Dict
+
+from shared.classes.basic.abstractions.validator import (
+    Field, Schema, ValidationError, Validator, VParams
+)
+
+COUNT = 100_000
+""" Количество вызовов по умолчанию """
+
+RECORD = {'txid': 'ab' * 32, 'amount': 5, 'script': b'\x00' * 25}
+""" Проверяемая запись """
+
+
+def is_record(obj: Any, params: VParams) -> None:
+    """ Проверка типа записи """
+
+    if not isinstance(obj, dict):
+        raise ValidationError('не словарь')
+
+
+def txid_is_hex(obj: Any, params: VParams) -> None:
+    """ Проверка идентификатора транзакции """
+
+    txid = obj.get('txid')
+    length = params.get('txid_length', 64)
+
+    if not isinstance(txid, str) or len(txid) != length:
+        raise ValidationError('некорректный txid')
+
+
+def amount_in_range(obj: Any, params: VParams) -> None:
+    """ Проверка суммы """
+
+    amount = obj.get('amount')
+    low = params.get('min_amount', 0)
+    high = params.get('max_amount', 21 * 10 ** 14)
+
+    if not isinstance(amount, int) or not low <= amount <= high:
+        raise ValidationError('некорректная сумма')
+
+
+def script_length(obj: Any, params: VParams) -> None:
+    """ Проверка скрипта """
+
+    script = obj.get('script')
+    limit = params.get('max_script', 10_000)
+
+    if not isinstance(script, bytes) or len(script) > limit:
+        raise ValidationError('некорректный скрипт')
+
+
+SCHEMA = Schema({
+    'txid': Field(str, 64, 64),
+    'amount': Field(int, min_value=0, max_value=21 * 10 ** 14),
+    'script': Field(bytes, max_length=10_000),
+}, name='tx')
+""" Та же проверка в виде схемы """
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество вызовов
+    :return: наносекунд на вызов по каждому варианту
+    """
+
+    methods = Validator([is_record, txid_is_hex, amount_in_range,
+                         script_length]).validate
+    schema = SCHEMA.validator().validate
+
+    def per_call(func: Callable[[], Any]) -> float:
+        return timeit(func, number=count) / count * 1e9
+
+    return {
+        'отдельные методы': per_call(lambda: methods(RECORD)),
+        'схема': per_call(lambda: schema(RECORD)),
+    }
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, ns in run(n).items():
+        print(f'{name:<28}{ns:>10.1f} нс/вызов')
@@ -0,0 +1,122 @@
+"""
+**Накладные расходы Validator.validate**
+
+Сравнение времени одной валидации с временем прямого вызова тех же методов
+проверки (горячий путь: проверка каждого поля входящей транзакции). Разница -
+накладные расходы самого валидатора на вызов. Для декоратора validate_with
+сравнение ведется с вызовом недекорированной функции, которая сама вызывает
+проверки. Кеш окупается, когда проверки дороже поиска в словаре: поэтому
+попадание в кеш сравнивается и с валидацией без кеша шестнадцатеричного txid
+(проверка регулярным выражением)
+
+Запуск: ``python -m benchmarks.validator_validate [количество вызовов]``
+"""
+
+import re
+import sys
+from timeit import timeit
+from typing import Any, Callable, Dict
+
+from shared.classes.basic.abstractions.validator import (
+    Validator, ValidationError, VParams
+)
+
+COUNT = 200_000
+""" Количество вызовов по умолчанию """
+
+HEX_TXID = re.compile('[0-9a-f]{64}')
+""" Шестнадцатеричный идентификатор транзакции """
+
+
+def is_bytes(obj: Any, params: VParams) -> None:
+    """
+    Проверка типа поля
+
+    :param obj: поле
+    :param params: параметры валидации
+    :return: ``None``
+    """
+
+    if type(obj) is not bytes:
+        raise ValidationError('не bytes')
+
+
+def is_hash(obj: Any, params: VParams) -> None:
+    """
+    Проверка длины поля
+
+    :param obj: поле
+    :param params: параметры валидации
+    :return: ``None``
+    """
+
+    if len(obj) != 32:
+        raise ValidationError('не хеш')
+
+
+def is_txid(obj: Any, params: VParams) -> None:
+    """
+    Проверка шестнадцатеричного идентификатора транзакции (как в запросах RPC)
+
+    :param obj: поле
+    :param params: параметры валидации
+    :return: ``None``
+    """
+
+    if type(obj) is not str or HEX_TXID.fullmatch(obj) is None:
+        raise ValidationError('не txid')
+
+
+def run(count: int = COUNT) -> Dict[str, float]:
+    """
+    Выполнение замеров
+
+    :param count: количество вызовов
+    :return: наносекунд на вызов по каждому варианту
+    """
+
+    field = bytes(32)
+    params: Dict[str, Any] = {}
+    validate = Validator([is_bytes, is_hash]).validate
+    cached = Validator([is_bytes, is_hash], cache_size=1024).validate
+    instrumented = Validator([is_bytes, is_hash], instrument=True).validate
+    txid = 'ab' * 32
+    validate_txid = Validator([is_txid]).validate
+    cached_txid = Validator([is_txid], cache_size=1024).validate
+
+    def direct() -> None:
+        is_bytes(field, params)
+        is_hash(field, params)
+
+    def accept(txid: bytes, index: int) -> int:
+        is_bytes(txid, params)
+        is_hash(txid, params)
+        return index
+
+    @Validator([is_bytes, is_hash]).validate_with('txid')
+    def accept_decorated(txid: bytes, index: int) -> int:
+        return index
+
+    def per_call(func: Callable[[], Any]) -> float:
+        return timeit(func, number=count) / count * 1e9
+
+    return {
+        'прямой вызов проверок': per_call(direct),
+        'Validator.validate': per_call(lambda: validate(field)),
+        'Validator.validate (кеш)': per_call(lambda: cached(field)),
+        'Validator.validate (статистика)':
+            per_call(lambda: instrumented(field)),
+        'Validator.validate (txid)': per_call(lambda: validate_txid(txid)),
+        'Validator.validate (txid, кеш)': per_call(lambda: cached_txid(txid)),
+        'функция с прямым вызовом проверок':
+            per_call(lambda: accept(field, 0)),
+        'Validator.validate_with':
+            per_call(lambda: accept_decorated(field, 0)),
+    }
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    for name, ns in run(n).items():
+        print(f'{name:<36}{ns:>10.1f} нс/вызов')
@@ -1,4 +1,7 @@
 from .validator import Validator
+from .async_validator import AsyncValidator
+from .schema import Field, Schema
 from ._typing import *
 from ._errors import *
 from ._validation_error import *
+from ._report import *
@@ -0,0 +1,254 @@
+"""
+**Кеш результатов валидации**
+
+Ограниченный по размеру (вытесняются давно не использованные записи) и,
+при необходимости, по времени жизни записей кеш результатов валидации.
+Ключ - тип и значение объекта проверки вместе с типами и значениями
+параметров валидации. Хешируемость не означает неизменяемость (экземпляры
+обычных классов хешируются по идентичности, но изменяются), а равенство
+вложенных значений не различает типы (``(1,) == (True,)``), поэтому
+кешируются только значения неизменяемых скалярных типов (``IMMUTABLE``):
+для остальных валидация выполняется как обычно
+
+Поиск неудач может прекращаться на первой из них (``partial``): такие
+записи помечаются (``Partial``), и функции, которым нужны все неудачи,
+на них выполняют поиск заново (а запись дополняют)
+"""
+
+from collections import OrderedDict, namedtuple
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+from ._typing import *
+
+
+IMMUTABLE = frozenset({bool, int, float, complex, str, bytes, type(None)})
+"""
+**Типы кешируемых значений**
+
+Неизменяемые скалярные типы, строки и байты (проверяется точный тип:
+подкласс может быть изменяемым)
+"""
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+"""
+**Статистика кеша**
+
+Попадания, промахи, наибольший и текущий размер (как у
+``functools.lru_cache``)
+"""
+
+
+class Partial(tuple):
+    """
+    **Неполные неудачи**
+
+    Запись поиска, прекращенного на первой неудаче: кроме нее, неудач
+    может быть больше
+    """
+    __slots__ = ()
+
+
+def params_key(params: KWArgs) -> Optional[frozenset]:
+    """
+    **Часть ключа записи для параметров валидации**
+
+    Тип каждого значения входит в ключ, чтобы ``n=1`` и ``n=True`` не
+    смешивались
+
+    :param params: параметры валидации (непустые)
+    :return: часть ключа или ``None``, если какое-то значение не кешируется
+    """
+    for value in params.values():
+        if type(value) not in IMMUTABLE:
+            return None
+
+    return frozenset((name, type(value), value)
+                     for name, value in params.items())
+
+
+class ResultCache:
+    """
+    **Класс "Кеш результатов валидации"**
+
+    Значение записи - неудачи проверок объекта (пустой кортеж - объект
+    прошел валидацию), а при ограниченном времени жизни - пара "момент
+    устаревания - неудачи"
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        """
+        **Инициализация экземпляра**
+
+        :param maxsize: наибольшее количество записей
+        :param ttl: время жизни записи в секундах (``None`` - не ограничено)
+        :return: ``None``
+        """
+        self._data: OrderedDict = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+
+    def wrap(self, find: Callable[[VObj, KWArgs], Tuple],
+             cacheable: Callable[[Tuple], bool],
+             dispatch: Optional[Callable[[Tuple, VObj], None]] = None,
+             partial: bool = False) -> Callable[[VObj, KWArgs], Any]:
+        """
+        **Кеширование функции поиска неудач**
+
+        Ключ записи - тип и значение объекта вместе с параметрами (см.
+        ``params_key``). Тип входит в ключ, чтобы равные объекты разных типов
+        (``1`` и ``True``) не смешивались. Кеш используется, только если
+        объект и все значения параметров - неизменяемых типов (``IMMUTABLE``):
+        хешируемого объекта недостаточно, он может измениться после проверки
+
+        Попадание стоит одной сборки ключа, одного поиска в словаре и
+        ``move_to_end``: без времени жизни записи хранятся без момента
+        устаревания (и он не проверяется), а с ``dispatch`` разбор неудач
+        встраивается в ту же функцию (без лишнего вызова на попадание)
+
+        Если ``find`` прекращает поиск на первой неудаче (``partial``),
+        найденные неудачи сохраняются как ``Partial``, и ей подходит любая
+        запись. Иначе запись ``Partial`` считается промахом: неудачи ищутся
+        заново, и запись заменяется полной
+
+        :param find: функция поиска неудач (объект, параметры)
+        :param cacheable: можно ли сохранить найденные неудачи
+        :param dispatch: разбор найденных неудач (неудачи, объект)
+        :param partial: ``find`` прекращает поиск на первой неудаче
+        :return: функция поиска неудач с кешем или, если задан ``dispatch``,
+            функция валидации с кешем
+        """
+        lookup = self._data.get
+        touch = self._data.move_to_end
+        put = self.put
+        # тип записей, на которых поиск выполняется заново (для ``partial``
+        # - ни одна запись: значения записей не бывают ``None``)
+        stale = type(None) if partial else Partial
+
+        def miss(key: Hashable, obj: VObj, params: KWArgs) -> Tuple:
+            self._misses += 1
+            found = tuple(find(obj, params))
+
+            if partial and found:                       # без неудач поиск
+                found = Partial(found)                  # полный
+
+            if cacheable(found):
+                put(key, found)
+
+            return found
+
+        if self._ttl is not None:
+            def memo(obj: VObj, params: KWArgs) -> Tuple:
+                extra = params_key(params) if params else ()
+                if extra is None or type(obj) not in IMMUTABLE:
+                    return tuple(find(obj, params))     # не кешируется
+
+                key = (type(obj), obj, extra)
+                entry = lookup(key)
+
+                if (entry is None or monotonic() >= entry[0]
+                        or type(entry[1]) is stale):
+                    return miss(key, obj, params)
+
+                self._hits += 1
+                try:
+                    touch(key)
+                except KeyError:                        # удалена потоком
+                    pass
+                return entry[1]
+
+            if dispatch is None:
+                return memo
+
+            def run(obj: VObj, params: KWArgs) -> None:
+                found = memo(obj, params)
+
+                if found:
+                    dispatch(found, obj)
+
+            return run
+
+        if dispatch is None:
+            def memo(obj: VObj, params: KWArgs) -> Tuple:
+                extra = params_key(params) if params else ()
+                if extra is None or type(obj) not in IMMUTABLE:
+                    return tuple(find(obj, params))     # не кешируется
+
+                key = (type(obj), obj, extra)
+                found = lookup(key)
+
+                if found is None or type(found) is stale:
+                    return miss(key, obj, params)
+
+                self._hits += 1
+                try:
+                    touch(key)
+                except KeyError:                        # удалена потоком
+                    pass
+                return found
+
+            return memo
+
+        def run(obj: VObj, params: KWArgs) -> None:
+            extra = params_key(params) if params else ()
+
+            if extra is None or type(obj) not in IMMUTABLE:
+                found = tuple(find(obj, params))        # не кешируется
+            else:
+                key = (type(obj), obj, extra)
+                found = lookup(key)
+
+                if found is None or type(found) is stale:
+                    found = miss(key, obj, params)
+                else:
+                    self._hits += 1
+                    try:
+                        touch(key)
+                    except KeyError:                    # удалена потоком
+                        pass
+
+            if found:
+                dispatch(found, obj)
+
+        return run
+
+    def put(self, key: Hashable, value: Tuple) -> None:
+        """
+        **Сохранение записи**
+
+        :param key: ключ
+        :param value: значение
+        :return: ``None``
+        """
+        if self._ttl is None:
+            self._data[key] = value
+        else:
+            self._data[key] = (monotonic() + self._ttl, value)
+
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """
+        **Статистика кеша**
+
+        :return: попадания, промахи, наибольший и текущий размер
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize,
+                         len(self._data))
+
+    def clear(self, stats: bool = True) -> None:
+        """
+        **Очистка кеша**
+
+        :param stats: сбросить и статистику
+        :return: ``None``
+        """
+        self._data.clear()
+
+        if stats:
+            self._hits = self._misses = 0
@@ -68,3 +68,48 @@ UNKNOWN_ERR = (
 NO_OBJ = (
     '💥 Не удалось получить объект проверки'
 )
+
+NO_PARAM = (
+    '💥 Декорируемая функция не имеет параметра {}'
+)
+
+DEPENDS_UNKNOWN = (
+    '💥 Зависимости (depends) могут содержать только зарегистрированные '
+    'методы проверки (получен {})'
+)
+
+DEPENDS_CYCLE = (
+    '💥 Зависимости (depends) методов проверки не должны быть циклическими'
+)
+
+SCHEMA_NAME = (
+    '💥 Имя схемы должно быть допустимым идентификатором (получено {!r})'
+)
+
+SCHEMA_RECORD = (
+    'Запись {} должна быть словарем (фактический тип — {})'
+)
+
+SCHEMA_MISSING = (
+    'Отсутствует обязательное поле {}'
+)
+
+SCHEMA_TYPE = (
+    'Поле {} должно иметь тип {}'
+)
+
+SCHEMA_LENGTH = (
+    'Длина поля {} должна быть в пределах от {} до {} (включительно)'
+)
+
+SCHEMA_RANGE = (
+    'Значение поля {} должно быть в пределах от {} до {} (включительно)'
+)
+
+SCHEMA_PATTERN = (
+    'Поле {} не соответствует шаблону {}'
+)
+
+SCHEMA_CHOICE = (
+    'Поле {} имеет недопустимое значение'
+)
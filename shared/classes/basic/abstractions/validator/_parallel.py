@@ -0,0 +1,88 @@
+"""
+**Выполнение проверок в пуле**
+
+Функции, которые ``Validator`` передает исполнителю
+(``concurrent.futures.Executor``). Функции определены на уровне модуля, чтобы
+их можно было передать и в пул процессов, и не поднимают исключений, а
+возвращают их: решение о том, что делать с неудачей (вызвать обработчик,
+поднять исключение, записать в отчет), принимает валидатор в основном
+процессе
+"""
+
+from typing import List, Optional, Sequence, Tuple, TypeAlias
+
+from ._typing import *
+
+
+Found: TypeAlias = List[Tuple[int, Exception]]
+"""
+**Неудачи проверок одного объекта**
+
+Список пар (позиция метода проверки, исключение)
+"""
+
+
+def apply(method: VMethod, obj: VObj, params: KWArgs) -> Optional[Exception]:
+    """
+    **Применение одного метода проверки**
+
+    :param method: метод проверки
+    :param obj: объект валидации
+    :param params: параметры валидации
+    :return: исключение или ``None``, если проверка пройдена
+    """
+    try:
+        method(obj, params)
+    except Exception as er:
+        return er
+
+    return None
+
+
+def check(methods: Sequence[VMethod], obj: VObj, params: KWArgs,
+          fail_fast: bool = False) -> Found:
+    """
+    **Применение всех методов проверки к объекту**
+
+    :param methods: методы проверки
+    :param obj: объект валидации
+    :param params: параметры валидации
+    :param fail_fast: прекратить проверку на первой неудаче
+    :return: неудачи проверок
+    """
+    found = []
+
+    for position, method in enumerate(methods):
+        er = apply(method, obj, params)
+
+        if er is not None:
+            found.append((position, er))
+
+            if fail_fast:
+                break
+
+    return found
+
+
+def check_chunk(methods: Sequence[VMethod], objs: Sequence[VObj],
+                params: KWArgs, fail_fast: bool = False) -> List[Found]:
+    """
+    **Применение всех методов проверки к части пакета**
+
+    :param methods: методы проверки
+    :param objs: объекты валидации
+    :param params: параметры валидации
+    :param fail_fast: прекратить проверку на первой неудаче
+    :return: неудачи проверок по каждому объекту (в режиме ``fail_fast`` -
+        до первого объекта с неудачей включительно)
+    """
+    result = []
+
+    for obj in objs:
+        found = check(methods, obj, params, fail_fast)
+        result.append(found)
+
+        if found and fail_fast:
+            break
+
+    return result
@@ -0,0 +1,255 @@
+"""
+**Реестр проверенных методов**
+
+Результаты проверки методов проверки и обработчиков (сигнатура, наличие
+``raise``) сохраняются на уровне процесса с ключом по объекту кода, поэтому
+повторное создание валидаторов с теми же методами не требует ни
+``inspect.signature``, ни разбора исходного кода. Если исходный код
+недоступен (лямбда в REPL, замороженное приложение и т.п.), наличие
+``raise`` определяется по байт-коду
+"""
+
+from ast import Raise, parse, walk
+from dis import get_instructions
+from inspect import Signature, getsource, signature, unwrap
+from textwrap import dedent
+from types import CodeType, MethodType
+from typing import Dict, Hashable, Optional
+
+from ._errors import *
+from ._typing import *
+
+
+RAISE_OPS = frozenset({'RAISE_VARARGS', 'RERAISE'})
+"""
+**Инструкции байт-кода, поднимающие исключения**
+"""
+
+_methods: Dict[Hashable, Optional[str]] = {}
+"""
+**Результаты проверки сигнатур методов проверки**
+
+Ключ - объект кода (и признак связанного метода), значение - сообщение об
+ошибке или ``None``, если проверка пройдена
+"""
+
+_handlers: Dict[Hashable, Optional[str]] = {}
+"""
+**Результаты проверки сигнатур обработчиков**
+"""
+
+_found: Dict[CodeType, bool] = {}
+"""
+**Результаты поиска raise**
+"""
+
+
+def code_of(obj: Any) -> Optional[CodeType]:
+    """
+    **Получение объекта кода**
+
+    Проверки сигнатуры и поиска ``raise`` смотрят сквозь ``__wrapped__``
+    (``functools.wraps``), поэтому и объект кода берется у исходной
+    функции: иначе все проверки за одним декоратором делили бы объект кода
+    обертки, а с ним и результат проверки первой из них
+
+    :param obj: функция, связанный метод или иной вызываемый объект
+    :return: объект кода или ``None``, если его нет (встроенные функции,
+        ``functools.partial``, объекты с ``__call__`` и т.п.)
+    """
+    try:
+        func = unwrap(getattr(obj, '__func__', obj))
+    except ValueError:                          # цикл в цепочке __wrapped__
+        return None
+
+    code = getattr(func, '__code__', None)
+    return code if isinstance(code, CodeType) else None
+
+
+def _key(obj: Any) -> Optional[Hashable]:
+    """
+    **Ключ реестра**
+
+    Сигнатура связанного метода не содержит ``self``, поэтому для одного и
+    того же кода результат проверки зависит еще и от того, связан ли метод
+
+    :param obj: вызываемый объект
+    :return: ключ или ``None``, если объекта кода нет
+    """
+    code = code_of(obj)
+    return None if code is None else (code, isinstance(obj, MethodType))
+
+
+def _cached(cache: Dict, obj: Any, check: Callable[[Any], Optional[str]]
+            ) -> Optional[str]:
+    """
+    **Проверка с сохранением результата**
+
+    :param cache: реестр
+    :param obj: вызываемый объект
+    :param check: собственно проверка (возвращает сообщение об ошибке)
+    :return: сообщение об ошибке или ``None``
+    """
+    key = _key(obj)
+
+    if key is None:
+        return check(obj)
+
+    try:
+        return cache[key]
+    except KeyError:
+        result = cache[key] = check(obj)
+        return result
+
+
+def _method_signature(method: VMethod) -> Optional[str]:
+    """
+    **Проверка сигнатуры метода проверки**
+
+    :param method: метод проверки
+    :return: сообщение об ошибке или ``None``
+    """
+    sign = signature(method)
+    ra = sign.return_annotation
+
+    if ra is not Signature.empty and ra is not None:
+        return RET_NOT_NONE
+
+    params = list(sign.parameters.values())
+
+    if params and params[0].name == 'self':
+        params = params[1:]
+
+    if len(params) < 1:
+        return NOT_ENOUGH_PARAMS
+
+    if params[0].annotation != Any:
+        return PARAM_IS_NOT_ANY
+
+    return None
+
+
+def _handler_signature(handler: EHandler) -> Optional[str]:
+    """
+    **Проверка сигнатуры обработчика**
+
+    :param handler: обработчик
+    :return: сообщение об ошибке или ``None``
+    """
+    sign = signature(handler)
+    params = list(sign.parameters.values())
+
+    ra = sign.return_annotation
+
+    if ra is not Signature.empty and ra is not None:
+        return RET_NOT_NONE
+
+    if params and params[0].name == 'self':
+        params = params[1:]
+
+    if len(params) < 2:
+        return NOT_ENOUGH_PARAMS
+
+    if params[0].annotation != Exception:
+        return PARAM_IS_NOT_EXCEPTION
+
+    if params[1].annotation != Any:
+        return PARAM_IS_NOT_ANY
+
+    return None
+
+
+def _source_raises(method: VMethod) -> Optional[bool]:
+    """
+    **Поиск raise в исходном коде**
+
+    :param method: метод проверки
+    :return: признак наличия ``raise`` или ``None``, если исходный код
+        недоступен или не разбирается (например, лямбда посреди выражения)
+    """
+    try:
+        tree = parse(dedent(getsource(method)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+
+    return any(isinstance(node, Raise) for node in walk(tree))
+
+
+def _code_raises(code: CodeType) -> bool:
+    """
+    **Поиск raise в байт-коде**
+
+    Просматриваются и вложенные функции (как и при обходе AST)
+
+    :param code: объект кода
+    :return: признак наличия инструкции, поднимающей исключение
+    """
+    if any(i.opname in RAISE_OPS for i in get_instructions(code)):
+        return True
+
+    return any(_code_raises(const) for const in code.co_consts
+               if isinstance(const, CodeType))
+
+
+def _raises(method: VMethod) -> bool:
+    """
+    **Поиск raise**
+
+    Сначала по исходному коду (как и раньше), а если он недоступен - по
+    байт-коду. Если нет ни того, ни другого (например, функции расширений
+    на C), проверить нечего, и метод принимается
+
+    :param method: метод проверки
+    :return: признак наличия ``raise``
+    """
+    code = code_of(method)
+
+    if code is not None and code in _found:
+        return _found[code]
+
+    found = _source_raises(method)
+
+    if found is None:
+        found = _code_raises(code) if code is not None else True
+
+    if code is not None:
+        _found[code] = found
+
+    return found
+
+
+def check_method(method: VMethod, trusted: bool = False) -> Optional[str]:
+    """
+    **Проверка метода проверки**
+
+    :param method: метод проверки
+    :param trusted: доверенный режим (поиск ``raise`` не выполняется)
+    :return: сообщение об ошибке или ``None``, если проверка пройдена
+    """
+    error = _cached(_methods, method, _method_signature)
+
+    if error is None and not trusted and not _raises(method):
+        error = NOT_RAISES
+
+    return error
+
+
+def check_handler(handler: EHandler) -> Optional[str]:
+    """
+    **Проверка обработчика**
+
+    :param handler: обработчик
+    :return: сообщение об ошибке или ``None``, если проверка пройдена
+    """
+    return _cached(_handlers, handler, _handler_signature)
+
+
+def clear() -> None:
+    """
+    **Очистка реестра**
+
+    :return: ``None``
+    """
+    _methods.clear()
+    _handlers.clear()
+    _found.clear()
@@ -0,0 +1,83 @@
+"""
+**Отчет пакетной валидации**
+
+Структуры, в которые ``Validator.validate_many`` собирает неудачи проверок
+вместо того, чтобы прерываться на первой из них
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+from ._typing import *
+
+
+@dataclass(frozen=True)
+class ValidationFailure:
+    """
+    **Неудача проверки**
+
+    Одна неудача одного метода проверки на одном объекте пакета
+    """
+
+    index: int
+    """ Индекс объекта в пакете """
+
+    method: VMethod
+    """ Метод проверки """
+
+    message: str
+    """ Сообщение об ошибке """
+
+    error: Exception = field(compare=False)
+    """ Исходное исключение (не сравнивается: его копия, полученная из
+    другого процесса, - это уже другой объект) """
+
+    @property
+    def name(self) -> str:
+        """
+        **Имя метода проверки**
+
+        :return: квалифицированное имя метода (или его представление)
+        """
+        return getattr(self.method, '__qualname__', repr(self.method))
+
+
+@dataclass
+class ValidationReport:
+    """
+    **Отчет пакетной валидации**
+
+    Количество проверенных объектов и неудачи в порядке их обнаружения
+    """
+
+    total: int = 0
+    """ Количество проверенных объектов """
+
+    failures: List[ValidationFailure] = field(default_factory=list)
+    """ Неудачи проверок """
+
+    @property
+    def ok(self) -> bool:
+        """
+        **Пакет прошел валидацию**
+
+        :return: ``True``, если неудач нет
+        """
+        return not self.failures
+
+    @property
+    def invalid(self) -> List[int]:
+        """
+        **Индексы объектов, не прошедших валидацию**
+
+        :return: индексы по возрастанию (без повторов)
+        """
+        return sorted({failure.index for failure in self.failures})
+
+    def __bool__(self) -> bool:
+        """
+        **Истинность отчета**
+
+        :return: то же, что и ``ok``
+        """
+        return self.ok
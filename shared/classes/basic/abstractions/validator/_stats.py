@@ -0,0 +1,249 @@
+"""
+**Статистика валидатора**
+
+Счетчики и время выполнения (``perf_counter_ns``) каждого метода проверки и
+количество вызовов обработчика. Сбор включается при создании валидатора:
+методы проверки и обработчик оборачиваются при компиляции конвейера, поэтому
+без статистики валидация не замедляется совсем
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from math import inf
+from time import perf_counter_ns
+from typing import Optional, Sequence, Tuple
+
+from ._typing import *
+
+
+SAMPLES = 1024
+"""
+**Размер выборки**
+
+Количество последних замеров каждого метода проверки, по которым
+вычисляются процентили
+"""
+
+Sink: TypeAlias = Callable[[VMethod, int, Optional[Exception]], None]
+"""
+**Приемник замеров**
+
+Вызывается после каждого выполнения метода проверки с методом, временем
+выполнения в наносекундах и исключением (или ``None``)
+"""
+
+
+@dataclass(frozen=True)
+class CheckSnapshot:
+    """
+    **Статистика метода проверки**
+
+    Снимок счетчиков одного метода проверки
+    """
+
+    method: VMethod
+    """ Метод проверки """
+
+    calls: int
+    """ Количество вызовов """
+
+    failures: int
+    """ Количество неудач (в том числе непредвиденных исключений) """
+
+    total_ns: int
+    """ Суммарное время выполнения в наносекундах """
+
+    p50_ns: int
+    """ Медиана времени выполнения (по последним замерам) """
+
+    p90_ns: int
+    """ 90-й процентиль времени выполнения """
+
+    p99_ns: int
+    """ 99-й процентиль времени выполнения """
+
+    @property
+    def name(self) -> str:
+        """
+        **Имя метода проверки**
+
+        :return: квалифицированное имя метода (или его представление)
+        """
+        return getattr(self.method, '__qualname__', repr(self.method))
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        **Среднее время выполнения**
+
+        :return: наносекунд на вызов
+        """
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """
+    **Статистика валидатора**
+
+    Снимок счетчиков всех методов проверки (в порядке регистрации) и
+    обработчика
+    """
+
+    checks: Tuple[CheckSnapshot, ...]
+    """ Статистика методов проверки """
+
+    handler_calls: int
+    """ Количество вызовов обработчика """
+
+
+def percentile(samples: Sequence[int], q: float) -> int:
+    """
+    **Процентиль (по ближайшему рангу)**
+
+    :param samples: упорядоченная выборка
+    :param q: доля (от 0 до 1)
+    :return: значение процентиля или ``0`` для пустой выборки
+    """
+    if not samples:
+        return 0
+
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class CheckStats:
+    """
+    **Класс "Счетчики метода проверки"**
+    """
+
+    __slots__ = ('method', 'calls', 'failures', 'total_ns', 'samples')
+
+    def __init__(self, method: VMethod) -> None:
+        """
+        **Инициализация экземпляра**
+
+        :param method: метод проверки
+        :return: ``None``
+        """
+        self.method = method
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.samples = deque(maxlen=SAMPLES)
+
+    def snapshot(self) -> CheckSnapshot:
+        """
+        **Снимок счетчиков**
+
+        :return: статистика метода проверки
+        """
+        samples = sorted(self.samples)
+        return CheckSnapshot(self.method, self.calls, self.failures,
+                             self.total_ns, percentile(samples, 0.5),
+                             percentile(samples, 0.9),
+                             percentile(samples, 0.99))
+
+
+class Stats:
+    """
+    **Класс "Статистика валидатора"**
+
+    Счетчики методов проверки и обработчика вместе с обертками, которые их
+    заполняют
+    """
+
+    def __init__(self, methods: Sequence[VMethod],
+                 sink: Optional[Sink] = None) -> None:
+        """
+        **Инициализация экземпляра**
+
+        :param methods: методы проверки
+        :param sink: приемник замеров
+        :return: ``None``
+        """
+        self._checks = [CheckStats(method) for method in methods]
+        self._sink = sink
+        self._handler_calls = 0
+
+    def wrap(self, position: int) -> VMethod:
+        """
+        **Обертка метода проверки**
+
+        :param position: позиция метода проверки
+        :return: метод проверки, заполняющий счетчики
+        """
+        record = self._checks[position]
+        method = record.method
+        sample = record.samples.append
+        sink = self._sink
+        clock = perf_counter_ns
+
+        def timed(obj: VObj, params: VParams) -> None:
+            error = None
+            started = clock()
+
+            try:
+                method(obj, params)
+            except Exception as er:
+                error = er
+                raise
+            finally:
+                elapsed = clock() - started
+                record.calls += 1
+                record.total_ns += elapsed
+                sample(elapsed)
+
+                if error is not None:
+                    record.failures += 1
+
+                if sink is not None:
+                    sink(method, elapsed, error)
+
+                error = None                    # не удерживаем трассировку
+
+        return timed
+
+    def priority(self, position: int) -> float:
+        """
+        **Приоритет метода проверки**
+
+        Отношение вероятности неудачи к средней стоимости вызова: чем чаще
+        метод отклоняет объекты и чем он дешевле, тем раньше его выгодно
+        выполнять. Вероятность сглажена (по Лапласу), чтобы метод, ни разу
+        не отклонивший объект, не оказался навсегда в конце, а метод без
+        замеров получает наивысший приоритет (его нужно измерить)
+
+        :param position: позиция метода проверки
+        :return: приоритет
+        """
+        record = self._checks[position]
+
+        if not record.calls:
+            return inf
+
+        rate = (record.failures + 1) / (record.calls + 2)
+        return rate * record.calls / (record.total_ns or 1)
+
+    def wrap_handler(self, handler: EHandler) -> EHandler:
+        """
+        **Обертка обработчика**
+
+        :param handler: обработчик ошибок
+        :return: обработчик, считающий свои вызовы
+        """
+        def counted(er: Exception, obj: VObj) -> None:
+            self._handler_calls += 1
+            handler(er, obj)
+
+        return counted
+
+    def snapshot(self) -> StatsSnapshot:
+        """
+        **Снимок счетчиков**
+
+        :return: статистика валидатора
+        """
+        return StatsSnapshot(
+            tuple(record.snapshot() for record in self._checks),
+            self._handler_calls
+        )
@@ -0,0 +1,246 @@
+"""
+**Асинхронный валидатор**
+
+Валидатор для кода на ``asyncio``: методы проверки могут быть сопрограммами
+(например, запросы к хранилищу непотраченных выходов), и независимые проверки
+одного объекта выполняются одновременно, поэтому время валидации определяется
+самой медленной проверкой, а не суммой всех. К методам проверки предъявляются
+те же требования, что и в ``Validator``
+"""
+
+from asyncio import Semaphore, gather, get_running_loop
+from functools import wraps
+from inspect import isawaitable
+from typing import Awaitable, Iterable, Optional, Tuple, TypeVar
+
+from . import _parallel
+from ._errors import *
+from ._report import *
+from ._typing import *
+from ._validation_error import *
+from .validator import Validator
+
+
+A = TypeVar('A', bound='AsyncValidator')
+"""
+**Типизация self**
+
+Аннотация типа для self в классе ``AsyncValidator``
+"""
+
+LIMIT = 64
+"""
+**Ограничение по умолчанию**
+
+Наибольшее количество одновременно выполняемых методов проверки-сопрограмм
+"""
+
+
+class AsyncValidator(Validator):
+    """
+    **Класс "Асинхронный валидатор"**
+
+    Валидатор, методы ``validate``, ``validate_many`` и декоратор
+    ``validate_with`` которого являются сопрограммами. Методы проверки могут
+    быть как сопрограммами, так и обычными функциями (последние выполняются
+    сразу, без передачи управления циклу событий)
+    """
+
+    def __init__(self: A, methods: VMethods, handler: EHandler = None,
+                 trusted: bool = False, limit: int = LIMIT) -> None:
+        """
+        **Инициализация экземпляра**
+
+        :param methods: список методов проверок (сопрограммы или функции)
+        :param handler: обработчик ошибок (функция или сопрограмма)
+        :param trusted: доверенный режим (см. ``Validator``)
+        :param limit: наибольшее количество одновременно выполняемых
+            методов проверки-сопрограмм (общее для всех вызовов валидатора)
+        :return: ``None``
+        """
+        self._limit = limit
+        self._semaphore: Optional[Semaphore] = None
+        self._loop = None
+        super().__init__(methods, handler, trusted)
+
+    def _get_semaphore(self: A) -> Semaphore:
+        """
+        **Семафор текущего цикла событий**
+
+        Семафор привязывается к циклу событий, поэтому для каждого нового
+        цикла (например, при повторном ``asyncio.run``) создается свой
+
+        :return: семафор
+        """
+        loop = get_running_loop()
+
+        if self._loop is not loop:
+            self._semaphore = Semaphore(self._limit)
+            self._loop = loop
+
+        return self._semaphore
+
+    async def _await(self: A, result: Awaitable) -> Optional[Exception]:
+        """
+        **Ожидание результата метода проверки-сопрограммы**
+
+        :param result: результат вызова метода проверки (сопрограмма и т.п.)
+        :return: исключение или ``None``, если проверка пройдена
+        """
+        async with self._get_semaphore():
+            try:
+                await result
+            except Exception as er:
+                return er
+
+        return None
+
+    async def _check(self: A, obj: VObj, params: KWArgs) -> _parallel.Found:
+        """
+        **Применение всех методов проверки к объекту**
+
+        Сопрограмма метод проверки или функция, определяется по результату
+        вызова, а не по самому методу: обертка (``functools.wraps``,
+        ``partial``, объект с ``async __call__``) тоже может вернуть
+        сопрограмму, которую нужно дождаться
+
+        :param obj: объект валидации
+        :param params: параметры валидации
+        :return: неудачи проверок в порядке регистрации методов
+        """
+        results: list = []
+        pending = []
+
+        for method in self._checks:
+            try:
+                result = method(obj, params)
+            except Exception as er:
+                results.append(er)
+                continue
+
+            if isawaitable(result):
+                pending.append(len(results))
+                results.append(self._await(result))
+            else:
+                results.append(None)
+
+        if pending:
+            done = await gather(*(results[i] for i in pending))
+
+            for i, er in zip(pending, done):
+                results[i] = er
+
+        return [(position, er) for position, er in enumerate(results)
+                if er is not None]
+
+    def _compile(self: A) -> None:
+        """
+        **Компиляция конвейера проверок**
+
+        :return: ``None``
+        """
+        self._checks = tuple(self._methods)
+
+    async def validate(self: A, obj: VObj, **params: VParams) -> VObj:
+        """
+        **Метод валидации**
+
+        Все методы проверки выполняются одновременно, а неудачи разбираются в
+        порядке регистрации методов: без обработчика поднимается исключение
+        для первой из них, с обработчиком он вызывается для каждой
+
+        :param obj: объект валидации
+        :param params: параметры валидации
+        :return: объект валидации (в неизменном виде)
+        """
+        for _, er in await self._check(obj, params):
+            if not isinstance(er, ValidationError):
+                raise Exception(UNKNOWN_ERR) from er
+
+            if self._handler is None:
+                msg = er.args[0] if er.args else ''
+                raise ValidationError(
+                    INFO.format(type(er).__name__, msg)
+                ) from er
+
+            result = self._handler(er, obj)
+
+            if isawaitable(result):
+                await result
+
+        return obj
+
+    async def validate_many(self: A, objs: Iterable[VObj],
+                            fail_fast: bool = False,
+                            **params: VParams) -> ValidationReport:
+        """
+        **Пакетная валидация**
+
+        Как и ``Validator.validate_many``, но объекты пакета проверяются
+        одновременно (в режиме ``fail_fast`` - по очереди, чтобы не
+        выполнять лишних проверок)
+
+        :param objs: объекты валидации
+        :param fail_fast: прекратить валидацию на первой неудаче
+        :param params: параметры валидации (общие для всего пакета)
+        :return: отчет
+        """
+        report = ValidationReport()
+
+        if fail_fast:
+            for obj in objs:
+                if self._report(report, await self._check(obj, params)):
+                    break
+        else:
+            for found in await gather(*(self._check(obj, params)
+                                        for obj in objs)):
+                self._report(report, found)
+
+        return report
+
+    def validate_with(self: A, target: Optional[str] = None, /,
+                      **params: VParams) -> Callable:
+        """
+        **Декоратор**
+
+        Декоратор для сопрограмм (проверяемый параметр определяется так же,
+        как и в ``Validator.validate_with``)
+
+        :param target: имя проверяемого параметра
+        :param params: аргументы, необходимые для валидации
+        :return: конкретная функция валидации
+        """
+        return self._decorator(((target, params),))
+
+    def validate_args(self: A, **targets: KWArgs) -> Callable:
+        """
+        **Декоратор для нескольких параметров**
+
+        Декоратор для сопрограмм (см. ``Validator.validate_args``)
+
+        :param targets: имя параметра - параметры валидации
+        :return: конкретная функция валидации
+        """
+        return self._decorator(tuple(targets.items()))
+
+    def _decorator(self: A, targets: Tuple[Tuple[Optional[str], KWArgs], ...]
+                   ) -> Callable:
+        """
+        **Построение декоратора для сопрограмм**
+
+        :param targets: пары (имя параметра, параметры валидации)
+        :return: декоратор
+        """
+        def decorator(func: Callable[..., Awaitable]) -> Callable:
+            bindings = tuple((self._bind(func, name), dict(params))
+                             for name, params in targets)
+            get_obj = self._get_obj
+
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:      # noqa
+                for binding, params in bindings:
+                    await self.validate(get_obj(binding, args, kwargs),
+                                        **params)
+                return await func(*args, **kwargs)
+            return wrapper
+        return decorator
@@ -0,0 +1,275 @@
+"""
+**Декларативные схемы**
+
+Схема описывает поля записи (тип, границы длины и значения, регулярное
+выражение, допустимые значения, вложенные схемы) и компилируется в одну
+сгенерированную функцию проверки: вместо N методов проверки с поиском
+параметров в ``params`` валидатор вызывает одну функцию без лишних вызовов.
+Исходный код функции регистрируется в ``linecache``, поэтому он доступен
+``inspect.getsource`` (и проверкам ``Validator``) и виден в трассировках
+"""
+
+import linecache
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import EnumMeta
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from ._errors import *
+from ._typing import *
+from ._validation_error import *
+from .validator import Validator
+
+
+S = TypeVar('S', bound='Schema')
+"""
+**Типизация self**
+
+Аннотация типа для self в классе ``Schema``
+"""
+
+MISSING = object()
+"""
+**Отсутствующее поле**
+"""
+
+_counter = count()
+"""
+**Счетчик сгенерированных функций (для имен "файлов" в linecache)**
+"""
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    **Поле схемы**
+
+    Ограничения проверяются в порядке объявления атрибутов; незаданные
+    (``None``) ограничения в сгенерированный код не попадают
+    """
+
+    type: Union[Type, Tuple[Type, ...], None] = None
+    """ Тип (или кортеж типов) значения (проверяется через isinstance) """
+
+    min_length: Optional[int] = None
+    """ Наименьшая длина """
+
+    max_length: Optional[int] = None
+    """ Наибольшая длина """
+
+    min_value: Any = None
+    """ Наименьшее значение """
+
+    max_value: Any = None
+    """ Наибольшее значение """
+
+    pattern: Optional[str] = None
+    """ Регулярное выражение (значение должно соответствовать целиком) """
+
+    choices: Union[Iterable, EnumMeta, None] = None
+    """ Допустимые значения (например, перечисление ``Encoding``) """
+
+    schema: Optional['Schema'] = None
+    """ Вложенная схема """
+
+    required: bool = True
+    """ Обязательное поле """
+
+
+class Schema:
+    """
+    **Класс "Схема"**
+
+    Схема записи (словаря или, при ``attrs=True``, объекта с атрибутами),
+    скомпилированная в функцию проверки ``check``
+    """
+
+    def __init__(self: S, fields: Dict[str, Field], attrs: bool = False,
+                 name: str = 'schema') -> None:
+        """
+        **Инициализация экземпляра**
+
+        :param fields: поля (имя - описание)
+        :param attrs: поля - атрибуты объекта (а не ключи словаря)
+        :param name: имя схемы (для сгенерированной функции и трассировок)
+        :return: ``None``
+        """
+        if not name.isidentifier():
+            raise ValueError(SCHEMA_NAME.format(name))
+
+        self._fields = dict(fields)
+        self._attrs = attrs
+        self._name = name
+        self.source = ''
+        self.check = self._compile()
+
+    def _compile(self: S) -> VMethod:
+        """
+        **Компиляция схемы в функцию проверки**
+
+        :return: функция проверки
+        """
+        namespace = {
+            'Any': Any, 'VParams': VParams, 'MISSING': MISSING,
+            'ValidationError': ValidationError, 'Mapping': Mapping,
+        }
+        lines = [
+            f'def check_{self._name}(obj: Any, params: VParams) -> None:',
+        ]
+        self._emit(lines, namespace, 'obj', '', 1)
+
+        if len(lines) == 1:
+            lines.append('    pass')
+
+        self.source = '\n'.join(lines) + '\n'
+        filename = f'<{self._name}-{next(_counter)}>'
+        linecache.cache[filename] = (len(self.source), None,
+                                     self.source.splitlines(True), filename)
+
+        exec(compile(self.source, filename, 'exec'), namespace)
+        return namespace[f'check_{self._name}']
+
+    def _emit(self: S, lines: List[str], namespace: KWArgs, source: str,
+              path: str, depth: int, nesting: int = 1) -> None:
+        """
+        **Генерация кода проверки полей схемы**
+
+        :param lines: строки кода
+        :param namespace: пространство имен функции (константы проверок)
+        :param source: имя переменной с записью
+        :param path: путь к записи (для сообщений об ошибках)
+        :param depth: уровень отступа
+        :param nesting: уровень вложенности схемы (у каждого уровня своя
+            переменная для значения поля)
+        :return: ``None``
+        """
+        var = f'v{nesting}'
+
+        def put(value: Any) -> str:
+            key = f'c{len(namespace)}'
+            namespace[key] = value
+            return key
+
+        def emit(pad: str, condition: str, message: str) -> None:
+            lines.append(f'{pad}if {condition}:')
+            lines.append(f'{pad}    raise ValidationError({put(message)})')
+
+        def guard(pad: str, condition: str, message: str, safe: bool
+                  ) -> None:
+            # без подходящего объявленного типа ограничение может получить
+            # значение, для которого оно не определено (len(5), 'a' < 0):
+            # TypeError - такая же неудача ограничения, а не сбой проверки
+            if safe:
+                emit(pad, condition, message)
+                return
+
+            lines.append(f'{pad}try:')
+            lines.append(f'{pad}    bad = {condition}')
+            lines.append(f'{pad}except TypeError:')
+            lines.append(f'{pad}    bad = True')
+            emit(pad, 'bad', message)
+
+        pad = '    ' * depth
+
+        if not self._attrs:
+            record = SCHEMA_RECORD.format(path or 'obj', '{}')
+            # проверка для абстрактного Mapping на порядок дороже, поэтому
+            # словари (самый частый случай) проверяются отдельно
+            lines.append(f'{pad}if type({source}) is not dict and '
+                         f'not isinstance({source}, Mapping):')
+            lines.append(f'{pad}    raise ValidationError('
+                         f'{put(record)}.format(type({source})))')
+
+        for key, spec in self._fields.items():
+            where = f'{path}.{key}' if path else key
+
+            if self._attrs:
+                lines.append(f'{pad}{var} = getattr({source}, {key!r}, '
+                             f'MISSING)')
+            else:
+                lines.append(f'{pad}{var} = {source}.get({key!r}, MISSING)')
+
+            if spec.required:
+                emit(pad, f'{var} is MISSING', SCHEMA_MISSING.format(where))
+                level = depth
+            else:
+                lines.append(f'{pad}if {var} is not MISSING:')
+                level = depth + 1
+
+            body = '    ' * level
+            start = len(lines)
+
+            if spec.type is not None:
+                emit(body, f'not isinstance({var}, {put(spec.type)})',
+                     SCHEMA_TYPE.format(where, spec.type))
+
+            if spec.min_length is not None or spec.max_length is not None:
+                lo = spec.min_length or 0
+                hi = '∞' if spec.max_length is None else spec.max_length
+
+                if spec.max_length is None:
+                    condition = f'len({var}) < {lo}'
+                elif not lo:
+                    condition = f'len({var}) > {hi}'
+                else:
+                    condition = f'not {lo} <= len({var}) <= {hi}'
+
+                guard(body, condition, SCHEMA_LENGTH.format(where, lo, hi),
+                      spec.type is not None)
+
+            if spec.min_value is not None or spec.max_value is not None:
+                lo = '-∞' if spec.min_value is None else spec.min_value
+                hi = '∞' if spec.max_value is None else spec.max_value
+                message = SCHEMA_RANGE.format(where, lo, hi)
+
+                if spec.min_value is not None:
+                    guard(body, f'{var} < {put(spec.min_value)}', message,
+                          spec.type is not None)
+
+                if spec.max_value is not None:
+                    guard(body, f'{var} > {put(spec.max_value)}', message,
+                          spec.type is not None)
+
+            if spec.pattern is not None:
+                match = put(re.compile(spec.pattern).fullmatch)
+                text = (isinstance(spec.type, type)
+                        and issubclass(spec.type, str))
+                guard(body, f'{match}({var}) is None',
+                      SCHEMA_PATTERN.format(where, spec.pattern), text)
+
+            if spec.choices is not None:
+                # нехешируемое значение (например, список) в frozenset не
+                # найти (TypeError), поэтому его ищем перебором кортежа
+                choices = tuple(spec.choices)
+                message = SCHEMA_CHOICE.format(where)
+
+                try:
+                    hashed = frozenset(choices)
+                except TypeError:                   # нехешируемые варианты
+                    emit(body, f'{var} not in {put(choices)}', message)
+                else:
+                    lines.append(f'{body}try:')
+                    lines.append(f'{body}    found = {var} in {put(hashed)}')
+                    lines.append(f'{body}except TypeError:')
+                    lines.append(f'{body}    found = {var} in {put(choices)}')
+                    emit(body, 'not found', message)
+
+            if spec.schema is not None:
+                spec.schema._emit(lines, namespace, var, where, level,
+                                  nesting + 1)
+
+            if len(lines) == start and not spec.required:
+                lines.append(f'{body}pass')
+
+    def validator(self: S, handler: EHandler = None, **options: Any
+                  ) -> Validator:
+        """
+        **Валидатор со схемой**
+
+        :param handler: обработчик ошибок
+        :param options: прочие параметры ``Validator``
+        :return: валидатор с единственным методом проверки - функцией схемы
+        """
+        return Validator([self.check], handler, **options)
@@ -6,17 +6,37 @@
 требованиям https://clck.ru/3BUKJk
 """
 
-from ast import Raise, parse, walk
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import wraps
-from inspect import Signature, getsource, signature
-from re import search
-from typing import TypeVar
+from heapq import heapify, heappop, heappush
+from inspect import Parameter, signature
+from os import cpu_count
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
+from . import _parallel, _registry
+from ._cache import *
 from ._errors import *
+from ._report import *
+from ._stats import *
 from ._typing import *
 from ._validation_error import *
 
 
+REORDER_EVERY = 1024
+"""
+**Период перестановки**
+
+Количество проверенных объектов, после которого адаптивный валидатор
+пересматривает порядок методов проверки
+"""
+
+Binding = Tuple[Optional[int], Optional[str], Any]
+"""
+**Проверяемый параметр декорируемой функции**
+
+Позиция, имя и значение по умолчанию
+"""
+
 T = TypeVar('T', bound='Validator')
 """
 **Типизация self**
@@ -34,17 +54,65 @@ class Validator:
     исключения в случае неудач
     """
 
-    def __init__(self: T, methods: VMethods, handler: EHandler = None) -> None:
+    def __init__(self: T, methods: VMethods, handler: EHandler = None,
+                 trusted: bool = False,
+                 executor: Optional[Executor] = None, cache_size: int = 0,
+                 cache_ttl: Optional[float] = None, instrument: bool = False,
+                 sink: Optional[Sink] = None, adaptive: bool = False,
+                 reorder_every: int = REORDER_EVERY,
+                 depends: Optional[Dict[VMethod, Sequence[VMethod]]] = None
+                 ) -> None:
         """
         **Инициализация экземпляра**
 
         Инициализация и установка методов проверок и обработки ошибок
         :param methods: список методов проверок
         :param handler: обработчик ошибок
+        :param trusted: доверенный режим: методы проверки не проверяются на
+            наличие ``raise`` (сигнатуры проверяются всегда)
+        :param executor: исполнитель (пул потоков для проверок, отпускающих
+            GIL, или пул процессов для проверок на чистом Python): методы
+            проверки одного объекта и объекты пакета распределяются между
+            его исполнителями. Для пула процессов методы проверки, объекты,
+            параметры и исключения должны сериализоваться (``pickle``)
+        :param cache_size: размер кеша результатов валидации (``0`` - кеш не
+            используется). Кешируются результаты только для объектов и
+            параметров неизменяемых скалярных типов, строк и байтов (см.
+            ``IMMUTABLE``), поэтому методы проверки должны зависеть только
+            от них (а не, например, от изменяемого внешнего состояния)
+        :param cache_ttl: время жизни результата в кеше в секундах
+            (``None`` - не ограничено)
+        :param instrument: собирать статистику методов проверки и обработчика
+            (см. ``stats``). С пулом процессов статистика не собирается: она
+            осталась бы в дочерних процессах
+        :param sink: приемник замеров (вызывается после каждого выполнения
+            метода проверки; включает сбор статистики)
+        :param adaptive: адаптивный порядок методов проверки: каждые
+            ``reorder_every`` объектов методы переставляются по убыванию
+            отношения частоты неудач к стоимости (по собранной статистике),
+            чтобы некорректные объекты отклонялись как можно дешевле.
+            Включает сбор статистики
+        :param reorder_every: период перестановки (в проверенных объектах)
+        :param depends: зависимости методов проверки: метод-ключ выполняется
+            только после всех перечисленных методов (соблюдается при любом
+            порядке, в том числе и без ``adaptive``)
         :return: ``None``
         """
         self._methods = []
         self._handler = None
+        self._trusted = trusted
+        self._executor = executor
+        self._cache = None
+        self._find = None
+        self._stats = None
+        self._instrument = instrument or sink is not None or adaptive
+        self._sink = sink
+        self._adaptive = adaptive
+        self._reorder_every = reorder_every
+        self._until = reorder_every
+
+        if cache_size:
+            self._cache = ResultCache(cache_size, cache_ttl)
 
         if not isinstance(methods, list):
             tpe = type(methods)
@@ -63,94 +131,638 @@ class Validator:
         if handler:
             self._set_handler(handler)
 
+        self._set_depends(depends or {})
+        self._order = self._sorted([0.0] * len(self._methods))
+        self._compile()
+
     def validate(self: T, obj: VObj, **params: VParams) -> VObj:
         """
         **Метод валидации**
 
         Выполняется валидация (в случае неудачи проверки будет поднято
-        соответствующее исключение и вызван обработчик)
+        соответствующее исключение и вызван обработчик). Проверки выполняются
+        заранее скомпилированной функцией (см. ``_compile``)
 
         Собственно, валидация
         :param obj: объект валидации
         :param params: параметры валидации
         :return: объект валидации (в неизменном виде)
         """
-        def er_name(error_class: type[ValidationError]) -> str | None:
-            """
-            **Метод получения имени ошибки**
-
-            Позволяет получить "чистое" наименование типа ошибки из
-            строки, которую возвращает type
-
-            :param error_class: результат работы функции type(ERROR)
-            :return: строка, содержащая "чистое" наименование ошибки
-            (например, TypeError) или ничего
-            """
-            pattern = r'<class \'__main__\.(.*?)\'>'
-            match = search(pattern, str(error_class))
-            return match.group(1) if match else None
-
-        for method in self._methods:
-            try:
-                method(obj, params)
-
-            except ValidationError as er:
-                if self._handler is None:
-                    en = er_name(type(er))
-                    msg = er.args[0]
-                    # print(INFO.format(en, msg))
-                    raise ValidationError(INFO.format(en, msg))
-                else:
-                    self._handler(er, obj)
+        self._run(obj, params)
+        return obj
 
-            except Exception:
-                raise Exception(UNKNOWN_ERR)
+    def _compile(self: T) -> None:
+        """
+        **Компиляция конвейера проверок**
 
-        return obj
+        Список методов проверки и обработчик связываются в одну
+        специализированную функцию заранее (а не при каждом вызове
+        ``validate``): без обработчика все проверки выполняются внутри
+        одного ``try`` (первая же неудача прерывает валидацию), с
+        обработчиком - каждая в своем (после обработки ошибки проверки
+        продолжаются). Исходное исключение сохраняется в ``__cause__``
+
+        Если задан исполнитель или кеш, функция валидации собирается из
+        функции поиска неудач (``_compile_parallel``, ``ResultCache.wrap``) и
+        разбора найденных неудач (``_dispatch``)
+
+        :return: ``None``
+        """
+        self._checks = tuple(self._methods[i] for i in self._order)
+        methods, handler = self._instrumented()
+        self._calls = methods
+        self._handle = handler
+
+        if self._executor is None and self._cache is None:
+            self._run = self._adapt(self._compile_serial(methods, handler))
+            return
+
+        # Без обработчика поиск прекращается на первой неудаче (и с кешем:
+        # такие записи помечаются как неполные, см. ``ResultCache.wrap``)
+        fail_fast = handler is None
+        find = self._compile_find(methods, fail_fast)
+        dispatch = self._dispatch
+
+        if self._cache is not None:
+            # попадание в кеш разбирается прямо в функции кеша (без
+            # промежуточного вызова), пакетам нужны все неудачи
+            find_all = (self._compile_find(methods, False) if fail_fast
+                        else find)
+            self._find = self._cache.wrap(find_all, self._cacheable)
+            self._run = self._adapt(self._cache.wrap(
+                find, self._cacheable, dispatch, partial=fail_fast))
+            return
+
+        def run(obj: VObj, params: KWArgs) -> None:
+            found = find(obj, params)
+
+            if found:
+                dispatch(found, obj)
+
+        self._run = self._adapt(run)
+
+    def _adapt(self: T, run: Callable[[VObj, KWArgs], None]
+               ) -> Callable[[VObj, KWArgs], None]:
+        """
+        **Отсчет объектов до перестановки методов проверки**
+
+        :param run: функция валидации
+        :return: та же функция (без адаптивного порядка) или функция,
+            отсчитывающая объекты
+        """
+        if not self._adaptive or self._stats is None:
+            return run
+
+        def counted(obj: VObj, params: KWArgs) -> None:
+            self._until -= 1
+
+            if self._until <= 0:
+                self._reorder()
+
+            run(obj, params)
+
+        return counted
+
+    def _reorder(self: T) -> None:
+        """
+        **Перестановка методов проверки по собранной статистике**
+
+        Конвейер перекомпилируется (а кеш очищается: позиции методов в его
+        записях устаревают), только если порядок действительно изменился
+
+        :return: ``None``
+        """
+        self._until = self._reorder_every
+        priority = self._stats.priority
+        order = self._sorted([priority(i) for i in range(len(self._methods))])
+
+        if order != self._order:
+            self._order = order
+            self._compile()
+
+            if self._cache is not None:
+                self._cache.clear(stats=False)
+
+    def _set_depends(self: T, depends: Dict[VMethod, Sequence[VMethod]]
+                     ) -> None:
+        """
+        **Установка зависимостей методов проверки**
+
+        Циклы обнаруживаются при первой же сортировке (см. ``_sorted``)
+
+        :param depends: метод - методы, после которых он выполняется
+        :return: ``None``
+        """
+        positions = {}
+
+        for position, method in enumerate(self._methods):
+            positions.setdefault(method, position)
+
+        self._after: List[List[int]] = [[] for _ in self._methods]
+
+        for method, required in depends.items():
+            for dependency in (method, *required):
+                if dependency not in positions:
+                    raise ValueError(DEPENDS_UNKNOWN.format(dependency))
+
+            for dependency in required:
+                self._after[positions[dependency]].append(positions[method])
+
+    def _sorted(self: T, priority: Sequence[float]) -> Tuple[int, ...]:
+        """
+        **Порядок методов проверки**
+
+        Топологическая сортировка по зависимостям: из методов, все
+        зависимости которых уже выполнены, первым выбирается метод с
+        наибольшим приоритетом (при равенстве - зарегистрированный раньше)
+
+        :param priority: приоритеты методов (в порядке регистрации)
+        :return: позиции методов (в порядке регистрации) в порядке
+            выполнения
+        """
+        waiting = [0] * len(priority)
+
+        for dependents in self._after:
+            for position in dependents:
+                waiting[position] += 1
+
+        ready = [(-priority[i], i) for i in range(len(priority))
+                 if not waiting[i]]
+        heapify(ready)
+        order = []
+
+        while ready:
+            _, position = heappop(ready)
+            order.append(position)
+
+            for dependent in self._after[position]:
+                waiting[dependent] -= 1
+
+                if not waiting[dependent]:
+                    heappush(ready, (-priority[dependent], dependent))
+
+        if len(order) < len(priority):
+            raise ValueError(DEPENDS_CYCLE)
+
+        return tuple(order)
+
+    def _instrumented(self: T) -> Tuple[Tuple[VMethod, ...], EHandler]:
+        """
+        **Методы проверки и обработчик для конвейера**
+
+        Если сбор статистики включен, они оборачиваются (и только тогда)
+
+        :return: методы проверки и обработчик
+        """
+        if not self._instrument or isinstance(self._executor,
+                                              ProcessPoolExecutor):
+            return self._checks, self._handler
+
+        if self._stats is None:
+            self._stats = Stats(self._methods, self._sink)
+
+        methods = tuple(map(self._stats.wrap, self._order))
+        handler = self._handler
+
+        if handler is not None:
+            handler = self._stats.wrap_handler(handler)
+
+        return methods, handler
+
+    def stats(self: T) -> Optional[StatsSnapshot]:
+        """
+        **Статистика методов проверки и обработчика**
+
+        :return: снимок счетчиков или ``None``, если статистика не собирается
+        """
+        return None if self._stats is None else self._stats.snapshot()
+
+    @staticmethod
+    def _compile_serial(methods: VMethods, handler: EHandler
+                        ) -> Callable[[VObj, KWArgs], None]:
+        """
+        **Компиляция последовательного конвейера проверок**
+
+        :param methods: методы проверки
+        :param handler: обработчик ошибок
+        :return: функция валидации
+        """
+        if handler is None:
+            def run(obj: VObj, params: KWArgs) -> None:
+                try:
+                    for method in methods:
+                        method(obj, params)
+
+                except ValidationError as er:
+                    msg = er.args[0] if er.args else ''
+                    raise ValidationError(
+                        INFO.format(type(er).__name__, msg)
+                    ) from er
+
+                except Exception as er:
+                    raise Exception(UNKNOWN_ERR) from er
+        else:
+            def run(obj: VObj, params: KWArgs) -> None:
+                for method in methods:
+                    try:
+                        method(obj, params)
+
+                    except ValidationError as er:
+                        handler(er, obj)
+
+                    except Exception as er:
+                        raise Exception(UNKNOWN_ERR) from er
+
+        return run
+
+    def _compile_find(self: T, methods: VMethods, fail_fast: bool
+                      ) -> Callable[[VObj, KWArgs], _parallel.Found]:
+        """
+        **Компиляция поиска неудач**
+
+        :param methods: методы проверки
+        :param fail_fast: прекратить поиск на первой неудаче
+        :return: функция поиска неудач (с исполнителем - см.
+            ``_compile_parallel``)
+        """
+        if self._executor is not None:
+            return self._compile_parallel(methods, fail_fast)
+
+        check = _parallel.check
+
+        def find(obj: VObj, params: KWArgs) -> _parallel.Found:
+            return check(methods, obj, params, fail_fast)
+
+        return find
+
+    def _compile_parallel(self: T, methods: VMethods, fail_fast: bool
+                          ) -> Callable[[VObj, KWArgs], _parallel.Found]:
+        """
+        **Компиляция поиска неудач с помощью исполнителя**
+
+        Методы проверки отправляются исполнителю слоями (см. ``_layers``):
+        все методы слоя - сразу, а следующий слой - только после завершения
+        предыдущего, поэтому зависимости соблюдаются и в пуле. Результаты
+        разбираются в порядке выполнения методов. В режиме ``fail_fast``
+        после неудачи выполняются только методы, стоящие раньше нее
+
+        :param methods: методы проверки
+        :param fail_fast: прекратить поиск на первой неудаче
+        :return: функция поиска неудач
+        """
+        submit = self._executor.submit
+        apply = _parallel.apply
+        layers = self._layers()
+
+        def find(obj: VObj, params: KWArgs) -> _parallel.Found:
+            found = []
+            limit = len(methods)
+
+            for layer in layers:
+                futures = [(position, submit(apply, methods[position], obj,
+                                             params))
+                           for position in layer if position < limit]
+
+                try:
+                    for position, future in futures:
+                        if position > limit:
+                            break
+
+                        er = future.result()
+
+                        if er is not None:
+                            found.append((position, er))
+
+                            if fail_fast:
+                                limit = position
+                finally:
+                    for _, future in futures:
+                        future.cancel()
+
+            found.sort(key=lambda item: item[0])
+            return found[:1] if fail_fast else found
+
+        return find
+
+    def _layers(self: T) -> List[List[int]]:
+        """
+        **Слои методов проверки**
+
+        Слой метода - длина самой длинной цепочки его зависимостей: методы
+        одного слоя друг от друга не зависят и могут выполняться
+        одновременно (без зависимостей все методы - в одном слое)
+
+        :return: позиции методов (в порядке выполнения) по слоям
+        """
+        level = [0] * len(self._methods)
+
+        for index in self._order:
+            for dependent in self._after[index]:
+                level[dependent] = max(level[dependent], level[index] + 1)
+
+        layers: List[List[int]] = [[] for _ in range(max(level) + 1)]
 
-    def validate_with(self: T, **params: VParams) -> Callable:
+        for position, index in enumerate(self._order):
+            layers[level[index]].append(position)
+
+        return layers
+
+    @staticmethod
+    def _cacheable(found: _parallel.Found) -> bool:
+        """
+        **Можно ли сохранить неудачи в кеше**
+
+        Непредвиденные исключения (в отличие от неудач проверок) не
+        кешируются: они могут быть и временными. Трассировки сохраняемых
+        исключений отбрасываются, чтобы не удерживать кадры (и объекты)
+
+        :param found: неудачи проверок
+        :return: ``True``, если все неудачи - неудачи проверок
+        """
+        if not all(isinstance(er, ValidationError) for _, er in found):
+            return False
+
+        for _, er in found:
+            er.__traceback__ = None
+
+        return True
+
+    def _dispatch(self: T, found: _parallel.Found, obj: VObj) -> None:
+        """
+        **Разбор найденных неудач**
+
+        Без обработчика поднимается исключение для первой неудачи, с
+        обработчиком он вызывается для каждой (в порядке регистрации
+        методов проверки)
+
+        :param found: неудачи проверок
+        :param obj: объект валидации
+        :return: ``None``
+        """
+        for _, er in found:
+            if not isinstance(er, ValidationError):
+                raise Exception(UNKNOWN_ERR) from er
+
+            if self._handle is None:
+                msg = er.args[0] if er.args else ''
+                raise ValidationError(
+                    INFO.format(type(er).__name__, msg)
+                ) from er
+
+            self._handle(er, obj)
+
+    def cache_info(self: T) -> Optional[CacheInfo]:
+        """
+        **Статистика кеша результатов валидации**
+
+        :return: статистика или ``None``, если кеш не используется
+        """
+        return None if self._cache is None else self._cache.info()
+
+    def cache_clear(self: T) -> None:
+        """
+        **Очистка кеша результатов валидации**
+
+        :return: ``None``
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def validate_many(self: T, objs: Iterable[VObj], fail_fast: bool = False,
+                      chunk_size: Optional[int] = None,
+                      **params: VParams) -> ValidationReport:
+        """
+        **Пакетная валидация**
+
+        Все методы проверки применяются к каждому объекту пакета, а неудачи
+        собираются в отчет (обработчик не вызывается, исключения не
+        поднимаются), поэтому один некорректный объект не прерывает пакет и не
+        требует его повторной проверки. Непредвиденные исключения тоже
+        попадают в отчет (с сообщением ``UNKNOWN_ERR``)
+
+        Если задан исполнитель, пакет делится на части, которые проверяются
+        параллельно
+
+        :param objs: объекты валидации
+        :param fail_fast: прекратить валидацию на первой неудаче
+        :param chunk_size: размер части пакета для исполнителя (по умолчанию
+            - примерно по четыре части на каждый из его исполнителей)
+        :param params: параметры валидации (общие для всего пакета)
+        :return: отчет
+        """
+        if self._executor is not None:
+            return self._validate_chunks(list(objs), fail_fast, chunk_size,
+                                         params)
+
+        methods = self._calls
+        report = ValidationReport()
+        check = _parallel.check
+        find = self._find
+
+        for obj in objs:
+            if find is None:
+                found = check(methods, obj, params, fail_fast)
+            else:
+                found = find(obj, params)[:1 if fail_fast else None]
+
+            if self._report(report, found) and fail_fast:
+                break
+
+        if self._adaptive and self._stats is not None:
+            self._until -= report.total
+
+            if self._until <= 0:
+                self._reorder()
+
+        return report
+
+    def _validate_chunks(self: T, objs: List[VObj], fail_fast: bool,
+                         chunk_size: Optional[int], params: KWArgs
+                         ) -> ValidationReport:
+        """
+        **Пакетная валидация с помощью исполнителя**
+
+        Части пакета разбираются в исходном порядке, поэтому отчет совпадает
+        с отчетом последовательной валидации
+
+        :param objs: объекты валидации
+        :param fail_fast: прекратить валидацию на первой неудаче
+        :param chunk_size: размер части пакета
+        :param params: параметры валидации
+        :return: отчет
+        """
+        if chunk_size is None:
+            workers = getattr(self._executor, '_max_workers', None)
+            parts = 4 * (workers or cpu_count() or 1)
+            chunk_size = -(-len(objs) // parts) or 1
+
+        futures = [
+            self._executor.submit(_parallel.check_chunk, self._calls,
+                                  objs[i:i + chunk_size], params, fail_fast)
+            for i in range(0, len(objs), chunk_size)
+        ]
+        report = ValidationReport()
+
+        try:
+            for future in futures:
+                for found in future.result():
+                    if self._report(report, found) and fail_fast:
+                        return report
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return report
+
+    def _report(self: T, report: ValidationReport,
+                found: _parallel.Found) -> bool:
+        """
+        **Запись неудач проверки очередного объекта в отчет**
+
+        :param report: отчет
+        :param found: неудачи проверок объекта
+        :return: признак наличия неудач
+        """
+        index = report.total
+        report.total += 1
+
+        for position, er in found:
+            if isinstance(er, ValidationError):
+                msg = er.args[0] if er.args else ''
+            else:
+                msg = UNKNOWN_ERR
+
+            report.failures.append(
+                ValidationFailure(index, self._checks[position], msg, er)
+            )
+
+        return bool(found)
+
+    def validate_with(self: T, target: Optional[str] = None, /,
+                      **params: VParams) -> Callable:
         """
         ** Декоратор **
 
-        Декоратор (с параметрами в виде именованных аргументов)
+        Декоратор (с параметрами в виде именованных аргументов). Параметр
+        декорируемой функции, значение которого проверяется, определяется
+        один раз - при декорировании (по сигнатуре), поэтому при вызове
+        объект проверки берется из аргументов по готовому индексу (или
+        имени), а "ложные" объекты (``0``, ``b''`` и т.п.) проверяются как
+        любые другие
 
+        :param target: имя проверяемого параметра (по умолчанию - первый
+            параметр, не считая ``self`` и ``cls``)
         :param params: аргументы, необходимые для валидации
         :return: конкретная функция валидации
         """
         def decorator(func: Callable) -> Callable:
+            position, name, default = self._bind(func, target)
+            run = self.validate
+
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:            # noqa
-                if args:
-
-                    # 🚩 Проверка здесь организована плохо: мы проверяем лишь 
-                    # по числу аргументов, и это кое-как работает, но это не 
-                    # правильный подход для общего случая. В перспективе,
-                    # если валидатор будет полезен и будет активно
-                    # использоваться, этот фрагмент требуется переделать
-
-                    if len(args) == 1:
-                        # Пришел единственный аргумент: предполагаем, что это
-                        # и есть объект проверки
-                        obj = args[0]
-                    else:
-                        # Иначе считаем, что у нас метод какого-то класса,
-                        # где первым является self, а значит, наш аргумент -
-                        # следующий
-                        obj = args[1]
-                else:
-                    # Если нет позиционных аргументов, предполагаем, что obj
-                    # передан в kwargs
-                    obj = kwargs.pop('obj', None)
-
-                if obj:
-                    self.validate(obj, **params)
+                if position is not None and position < len(args):
+                    obj = args[position]
+                elif name in kwargs:
+                    obj = kwargs[name]
+                elif default is not Parameter.empty:
+                    obj = default
                 else:
                     raise ValueError(NO_OBJ)
 
+                run(obj, **params)
                 return func(*args, **kwargs)
             return wrapper
         return decorator
 
+    def validate_args(self: T, **targets: KWArgs) -> Callable:
+        """
+        **Декоратор для нескольких параметров**
+
+        Проверяются значения нескольких параметров декорируемой функции,
+        каждый - со своими параметрами валидации (в порядке перечисления)::
+
+            @validator.validate_args(name={'max_length': 10}, alias={})
+
+        :param targets: имя параметра - параметры валидации
+        :return: конкретная функция валидации
+        """
+        def decorator(func: Callable) -> Callable:
+            bindings = tuple((self._bind(func, name), dict(params))
+                             for name, params in targets.items())
+            get_obj = self._get_obj
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:            # noqa
+                for binding, params in bindings:
+                    self.validate(get_obj(binding, args, kwargs), **params)
+                return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def _bind(func: Callable, target: Optional[str]) -> Binding:
+        """
+        **Определение проверяемого параметра по сигнатуре**
+
+        :param func: декорируемая функция
+        :param target: имя параметра (``None`` - первый параметр, не считая
+            ``self`` и ``cls``)
+        :return: позиция параметра (``None``, если он передается только по
+            имени), его имя (``None``, если параметра нет: тогда ошибка
+            ``NO_OBJ`` будет поднята при вызове) и значение по умолчанию
+        """
+        params = list(signature(func).parameters.values())
+
+        if target is None:
+            named = [p for p in params
+                     if p.kind not in (Parameter.VAR_POSITIONAL,
+                                       Parameter.VAR_KEYWORD)]
+
+            if named and named[0].name in ('self', 'cls'):
+                named = named[1:]
+
+            if not named:
+                return None, None, Parameter.empty
+
+            target = named[0].name
+
+        for position, param in enumerate(params):
+            if param.name == target:
+                break
+        else:
+            raise ValueError(NO_PARAM.format(target))
+
+        if param.kind not in (Parameter.POSITIONAL_ONLY,
+                              Parameter.POSITIONAL_OR_KEYWORD):
+            position = None
+
+        name = None if param.kind is Parameter.POSITIONAL_ONLY else target
+        return position, name, param.default
+
+    @staticmethod
+    def _get_obj(binding: Binding, args: Args, kwargs: KWArgs) -> VObj:
+        """
+        **Получение объекта проверки из аргументов декорируемой функции**
+
+        :param binding: проверяемый параметр (см. ``_bind``)
+        :param args: позиционные аргументы
+        :param kwargs: именованные аргументы
+        :return: объект проверки
+        """
+        position, name, default = binding
+
+        if position is not None and position < len(args):
+            return args[position]
+
+        if name in kwargs:
+            return kwargs[name]
+
+        if default is not Parameter.empty:
+            return default
+
+        raise ValueError(NO_OBJ)
+
     def _set_method(self: T, method: VMethod) -> None:
         """
         **Установка значений конкретных методов валидации**
@@ -159,7 +771,12 @@ class Validator:
         список. Проверки осуществляются на предмет:
          - является ли вызываемым (должен);
          - не имеет ли возвращаемого значения (не должен);
-         - содержит ли внутри вызов исключения (должен).
+         - содержит ли внутри вызов исключения (должен; не проверяется в
+           доверенном режиме).
+
+        Результаты проверок сохраняются в реестре (``_registry``) по объекту
+        кода метода, поэтому для уже встречавшихся методов они не
+        повторяются.
 
         :param method: отдельный конкретный метод валидации для проверки
         :return: ``None``
@@ -168,33 +785,10 @@ class Validator:
             tpe = type(method)
             raise TypeError(NON_CALLABLE_M.format(tpe))
 
-        sign = signature(method)
-        ra = sign.return_annotation
-
-        if ra is not Signature.empty and ra is not None:
-            raise TypeError(RET_NOT_NONE)
-
-        params = list(sign.parameters.values())
-
-        if len(params) < 1:
-            raise TypeError(NOT_ENOUGH_PARAMS)
+        error = _registry.check_method(method, self._trusted)
 
-        first_param = params[0] if params[0].name != 'self' else params[1]
-
-        if first_param.annotation != Any:
-            raise TypeError(PARAM_IS_NOT_ANY)
-
-        method_source = getsource(method)
-        sem_tree = parse(method_source)
-        contains_exception = False
-
-        for node in walk(sem_tree):
-            if isinstance(node, Raise):
-                contains_exception = True
-                break
-
-        if not contains_exception:
-            raise TypeError(NOT_RAISES)
+        if error is not None:
+            raise TypeError(error)
 
         self._methods.append(method)
 
@@ -208,28 +802,14 @@ class Validator:
          - является ли первый параметр исключением;
          - является ли второй параметр Any.
 
+        Результат проверки, как и для методов проверки, сохраняется в реестре.
+
         :param handler: метод обработки исключительных ситуаций
         :return:
         """
-        sign = signature(handler)
-        params = list(sign.parameters.values())
-
-        ra = sign.return_annotation
-
-        if ra is not Signature.empty and ra is not None:
-            raise TypeError(RET_NOT_NONE)
-
-        if len(params) < 2:
-            raise TypeError(NOT_ENOUGH_PARAMS)
-
-        first_param = params[0] if params[0].name != 'self' else params[1]
-
-        if first_param.annotation != Exception:
-            raise TypeError(PARAM_IS_NOT_EXCEPTION)
-
-        second_param = params[1] if params[0].name != 'self' else params[2]
+        error = _registry.check_handler(handler)
 
-        if second_param.annotation != Any:
-            raise TypeError(PARAM_IS_NOT_ANY)
+        if error is not None:
+            raise TypeError(error)
 
         self._handler = handler
@@ -0,0 +1,3 @@
+from .header import BlockHeader
+from ._constants import *
+from ._errors import *
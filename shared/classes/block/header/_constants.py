@@ -0,0 +1,41 @@
+"""
+**Константы заголовка блока**
+
+Раскладка заголовка блока (как в биткоине): версия, хеш предыдущего блока, корень дерева Меркла, время, компактное представление цели
+(bits) и nonce - всего 80 байтов, все числа в порядке little-endian
+"""
+
+from struct import Struct
+
+HEADER = Struct('<I32s32sIII')
+""" Упаковка заголовка целиком """
+
+HEADER_SIZE = HEADER.size
+""" Размер заголовка в байтах """
+
+HASH_SIZE = 32
+""" Размер хеша (предыдущего блока, корня дерева Меркла, самого заголовка) в байтах """
+
+UINT32 = Struct('<I')
+""" Упаковка числового поля заголовка """
+
+UINT32_LIMIT = 1 << (UINT32.size * 8)
+""" Граница значений числового поля заголовка (не включается) """
+
+VERSION_OFFSET = 0
+""" Смещение версии """
+
+PREV_HASH_OFFSET = 4
+""" Смещение хеша предыдущего блока """
+
+MERKLE_ROOT_OFFSET = PREV_HASH_OFFSET + HASH_SIZE
+""" Смещение корня дерева Меркла """
+
+TIME_OFFSET = MERKLE_ROOT_OFFSET + HASH_SIZE
+""" Смещение времени (Unix time в секундах) """
+
+BITS_OFFSET = TIME_OFFSET + UINT32.size
+""" Смещение компактного представления цели """
+
+NONCE_OFFSET = BITS_OFFSET + UINT32.size
+""" Смещение nonce (все, что до него, - неизменная при переборе nonce часть заголовка) """
@@ -0,0 +1,24 @@
+"""
+**Сообщения об ошибках**
+
+Сообщения об ошибках, используемые классом ``BlockHeader``
+"""
+
+E_HEADER_TYPE = ('🚨 Ошибочный тип данных {} при указании заголовка блока. Ожидается объект, поддерживающий протокол буфера '
+                 '(последовательность или массив байтов, memoryview и т.п.)')
+""" Сообщение об ошибке при получении данных заголовка некорректного типа """
+
+E_HEADER_SIZE = '🚨 Ошибочная длина заголовка блока {} (в байтах). Заголовок должен иметь длину {} байтов'
+""" Сообщение об ошибке при получении данных заголовка некорректной длины """
+
+E_HEADERS_SIZE = '🚨 Ошибочная длина последовательности заголовков {} (в байтах). Длина должна быть кратна {} байтам'
+""" Сообщение об ошибке при получении последовательности заголовков, длина которой не кратна размеру заголовка """
+
+E_HASH_SIZE = '🚨 Ошибочная длина хеша {} (в байтах) в поле {}. Хеш должен иметь длину {} байтов'
+""" Сообщение об ошибке при попытке записать в поле заголовка хеш некорректной длины """
+
+E_FIELD_TYPE = '🚨 Ошибочный тип данных {} значения поля {}. Ожидается целое число'
+""" Сообщение об ошибке при попытке записать в числовое поле заголовка значение некорректного типа """
+
+E_FIELD_VALUE = '🚨 Ошибочное значение {} поля {}. Значение должно лежать в пределах [0, 2^32)'
+""" Сообщение об ошибке при попытке записать в числовое поле заголовка значение вне диапазона """
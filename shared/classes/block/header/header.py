@@ -0,0 +1,442 @@
+"""
+**Заголовок блока**
+
+Заголовок блока фиксированной раскладки (см. ``HEADER``) хранится одним непрерывным буфером, а поля читаются и записываются через
+struct прямо в нем (без промежуточного объекта на каждое поле). Последовательность заголовков (например, при синхронизации
+"сначала заголовки") разбирается на представления без копирования данных, а хешируется вообще без создания заголовков
+"""
+
+from typing import Any, List, Optional, Tuple, Union
+
+from shared.classes.crypto.message import OUT_LIST, Encoding, Message, TData
+from shared.classes.crypto.miner import NONCE_LIMIT, Miner, MiningResult, bits_to_target
+
+from ._constants import *
+from ._errors import *
+
+
+class BlockHeader:
+    """
+    Заголовок блока поверх буфера из HEADER_SIZE байтов. Источник данных, переданный при создании, никогда не изменяется: при первой
+    записи любого поля данные копируются в собственный массив байтов заголовка (копирование при записи), и дальше поля (в том числе
+    nonce при переборе) записываются прямо в него
+    """
+
+    __slots__ = ('_data', '_buffer')
+
+    def __init__(self, data: TData) -> None:
+        """
+        Метод создания экземпляра класса (данные не копируются)
+
+        :param data: данные заголовка (любой объект, поддерживающий протокол буфера, длиной HEADER_SIZE байтов)
+        :return: ``None``
+        """
+
+        view = self._view(data)
+
+        if view.nbytes != HEADER_SIZE:
+            raise ValueError(E_HEADER_SIZE.format(view.nbytes, HEADER_SIZE))
+
+        self._data: memoryview = view                                 # представление данных только для чтения
+        self._buffer: Optional[memoryview] = None                     # собственная изменяемая копия данных (создается при записи)
+
+    @staticmethod
+    def _view(data: TData) -> memoryview:
+        """
+        Получение одномерного представления байтов только для чтения (разрывные буферы копируются)
+
+        :param data: данные (любой объект, поддерживающий протокол буфера)
+        :return: представление данных
+        """
+
+        try:
+            view = memoryview(data)
+        except TypeError:
+            raise TypeError(E_HEADER_TYPE.format(type(data))) from None
+
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        elif view.ndim != 1 or view.format != 'B':
+            view = view.cast('B')
+
+        return view if view.readonly else view.toreadonly()
+
+    @classmethod
+    def _from_view(cls, view: memoryview) -> 'BlockHeader':
+        """
+        Создание заголовка из уже проверенного представления (без повторных проверок)
+
+        :param view: представление данных заголовка только для чтения
+        :return: заголовок
+        """
+
+        header = cls.__new__(cls)
+        header._data = view
+        header._buffer = None
+        return header
+
+    @classmethod
+    def from_fields(cls, version: int, prev_hash: TData, merkle_root: TData, time: int, bits: int, nonce: int = 0) -> 'BlockHeader':
+        """
+        Создание заголовка из значений полей
+
+        :param version: версия
+        :param prev_hash: хеш предыдущего блока
+        :param merkle_root: корень дерева Меркла
+        :param time: время (Unix time в секундах)
+        :param bits: компактное представление цели
+        :param nonce: nonce
+        :return: заголовок
+        """
+
+        header = cls.__new__(cls)
+        header._buffer = memoryview(bytearray(HEADER_SIZE))           # данные сразу собственные: поля записываются прямо в них
+        header._data = header._buffer.toreadonly()
+        header.version = version
+        header.prev_hash = prev_hash
+        header.merkle_root = merkle_root
+        header.time = time
+        header.bits = bits
+        header.nonce = nonce
+        return header
+
+    @classmethod
+    def parse_many(cls, data: TData) -> List['BlockHeader']:
+        """
+        Разбор непрерывной последовательности заголовков: каждый заголовок - представление своего участка общего буфера (без копирования)
+
+        :param data: последовательность заголовков (длина кратна HEADER_SIZE)
+        :return: заголовки
+        """
+
+        view = cls._views(data)
+        return [cls._from_view(view[i:i + HEADER_SIZE]) for i in range(0, view.nbytes, HEADER_SIZE)]
+
+    @classmethod
+    def hash_many(cls, data: TData, out: str = OUT_LIST, backend: Optional[str] = None) -> Union[List[bytes], bytes, Any]:
+        """
+        Двойное хеширование непрерывной последовательности заголовков без создания заголовков (см. Message.hash_many())
+
+        :param data: последовательность заголовков (длина кратна HEADER_SIZE)
+        :param out: форма результата (см. Message.hash_many())
+        :param backend: наименование реализации метода хеширования
+        :return: хеши заголовков в запрошенной форме
+        """
+
+        view = cls._views(data)
+        headers = (view[i:i + HEADER_SIZE] for i in range(0, view.nbytes, HEADER_SIZE))
+        return Message.hash_many(Message.hash_many(headers, backend=backend), out=out, backend=backend)
+
+    @classmethod
+    def _views(cls, data: TData) -> memoryview:
+        """
+        Получение представления последовательности заголовков с проверкой длины
+
+        :param data: последовательность заголовков
+        :return: представление данных
+        """
+
+        view = cls._view(data)
+
+        if view.nbytes % HEADER_SIZE:
+            raise ValueError(E_HEADERS_SIZE.format(view.nbytes, HEADER_SIZE))
+
+        return view
+
+    def _writable(self) -> memoryview:
+        """
+        Получение изменяемого представления данных (при первом вызове данные копируются в собственный массив байтов заголовка)
+
+        :return: изменяемое представление данных
+        """
+
+        if self._buffer is None:
+            self._buffer = memoryview(bytearray(self._data))
+            self._data = self._buffer.toreadonly()
+
+        return self._buffer
+
+    def _get_uint(self, offset: int) -> int:
+        """
+        Чтение числового поля
+
+        :param offset: смещение поля
+        :return: значение
+        """
+
+        return UINT32.unpack_from(self._data, offset)[0]
+
+    def _set_uint(self, offset: int, name: str, value: int) -> None:
+        """
+        Запись числового поля (прямо в буфер заголовка)
+
+        :param offset: смещение поля
+        :param name: наименование поля (для сообщения об ошибке)
+        :param value: значение
+        :return: ``None``
+        """
+
+        if type(value) is not int:                                    # проверяем до копирования данных
+            raise TypeError(E_FIELD_TYPE.format(type(value), name))
+
+        if not 0 <= value < UINT32_LIMIT:
+            raise ValueError(E_FIELD_VALUE.format(value, name))
+
+        UINT32.pack_into(self._writable(), offset, value)
+
+    def _set_hash(self, offset: int, name: str, value: TData) -> None:
+        """
+        Запись поля-хеша (прямо в буфер заголовка)
+
+        :param offset: смещение поля
+        :param name: наименование поля (для сообщения об ошибке)
+        :param value: хеш
+        :return: ``None``
+        """
+
+        view = self._view(value)
+
+        if view.nbytes != HASH_SIZE:
+            raise ValueError(E_HASH_SIZE.format(view.nbytes, name, HASH_SIZE))
+
+        self._writable()[offset:offset + HASH_SIZE] = view
+
+    @property
+    def version(self) -> int:
+        """
+        Свойство "Версия"
+
+        :return: версия
+        """
+
+        return self._get_uint(VERSION_OFFSET)
+
+    @version.setter
+    def version(self, version: int) -> None:
+        """
+        Сеттер свойства "Версия"
+
+        :param version: версия
+        :return: ``None``
+        """
+
+        self._set_uint(VERSION_OFFSET, 'version', version)
+
+    @property
+    def prev_hash(self) -> memoryview:
+        """
+        Свойство "Хеш предыдущего блока" (представление без копирования)
+
+        :return: хеш предыдущего блока
+        """
+
+        return self._data[PREV_HASH_OFFSET:PREV_HASH_OFFSET + HASH_SIZE]
+
+    @prev_hash.setter
+    def prev_hash(self, prev_hash: TData) -> None:
+        """
+        Сеттер свойства "Хеш предыдущего блока"
+
+        :param prev_hash: хеш предыдущего блока
+        :return: ``None``
+        """
+
+        self._set_hash(PREV_HASH_OFFSET, 'prev_hash', prev_hash)
+
+    @property
+    def merkle_root(self) -> memoryview:
+        """
+        Свойство "Корень дерева Меркла" (представление без копирования)
+
+        :return: корень дерева Меркла
+        """
+
+        return self._data[MERKLE_ROOT_OFFSET:MERKLE_ROOT_OFFSET + HASH_SIZE]
+
+    @merkle_root.setter
+    def merkle_root(self, merkle_root: TData) -> None:
+        """
+        Сеттер свойства "Корень дерева Меркла"
+
+        :param merkle_root: корень дерева Меркла
+        :return: ``None``
+        """
+
+        self._set_hash(MERKLE_ROOT_OFFSET, 'merkle_root', merkle_root)
+
+    @property
+    def time(self) -> int:
+        """
+        Свойство "Время" (Unix time в секундах)
+
+        :return: время
+        """
+
+        return self._get_uint(TIME_OFFSET)
+
+    @time.setter
+    def time(self, time: int) -> None:
+        """
+        Сеттер свойства "Время"
+
+        :param time: время (Unix time в секундах)
+        :return: ``None``
+        """
+
+        self._set_uint(TIME_OFFSET, 'time', time)
+
+    @property
+    def bits(self) -> int:
+        """
+        Свойство "Компактное представление цели"
+
+        :return: bits
+        """
+
+        return self._get_uint(BITS_OFFSET)
+
+    @bits.setter
+    def bits(self, bits: int) -> None:
+        """
+        Сеттер свойства "Компактное представление цели"
+
+        :param bits: компактное представление цели
+        :return: ``None``
+        """
+
+        self._set_uint(BITS_OFFSET, 'bits', bits)
+
+    @property
+    def nonce(self) -> int:
+        """
+        Свойство "Nonce"
+
+        :return: nonce
+        """
+
+        return self._get_uint(NONCE_OFFSET)
+
+    @nonce.setter
+    def nonce(self, nonce: int) -> None:
+        """
+        Сеттер свойства "Nonce" (записывается прямо в буфер заголовка, без пересборки заголовка)
+
+        :param nonce: nonce
+        :return: ``None``
+        """
+
+        self._set_uint(NONCE_OFFSET, 'nonce', nonce)
+
+    def fields(self) -> Tuple[int, bytes, bytes, int, int, int]:
+        """
+        Получение значений всех полей за один вызов
+
+        :return: версия, хеш предыдущего блока, корень дерева Меркла, время, bits, nonce
+        """
+
+        return HEADER.unpack_from(self._data)
+
+    @property
+    def data(self) -> memoryview:
+        """
+        Свойство "Данные" (представление данных заголовка только для чтения, без копирования)
+
+        :return: данные
+        """
+
+        return self._data
+
+    @property
+    def prefix(self) -> memoryview:
+        """
+        Свойство "Неизменная часть заголовка" (все, что предшествует nonce; представление без копирования)
+
+        :return: неизменная часть заголовка
+        """
+
+        return self._data[:NONCE_OFFSET]
+
+    def hash(self, backend: Optional[str] = None) -> bytes:
+        """
+        Двойное хеширование заголовка (через Message, методом sha-256)
+
+        :param backend: наименование реализации метода хеширования
+        :return: хеш заголовка
+        """
+
+        digest = Message(self._data, Encoding.bnr).hash(backend)
+        return Message(digest, Encoding.bnr).hash(backend)
+
+    def check(self, backend: Optional[str] = None) -> bool:
+        """
+        Проверка доказательства выполнения работы
+
+        :param backend: наименование реализации метода хеширования
+        :return: ``True``, если хеш заголовка (как число little-endian) не больше цели
+        """
+
+        return int.from_bytes(self.hash(backend), 'little') <= bits_to_target(self.bits)
+
+    def miner(self, backend: Optional[str] = None) -> Miner:
+        """
+        Получение майнера для неизменной части заголовка (ее состояние хеширования вычисляется один раз)
+
+        :param backend: наименование реализации метода хеширования
+        :return: майнер
+        """
+
+        return Miner(self.prefix, self.bits, backend=backend)
+
+    def mine(self, start: int = 0, stop: int = NONCE_LIMIT, timeout: Optional[float] = None,
+             backend: Optional[str] = None) -> MiningResult:
+        """
+        Перебор nonce (см. Miner.mine()). Найденный nonce записывается в заголовок
+
+        :param start: первый nonce
+        :param stop: граница диапазона (не включается)
+        :param timeout: ограничение по времени в секундах
+        :param backend: наименование реализации метода хеширования
+        :return: результат поиска
+        """
+
+        result = self.miner(backend).mine(start, stop, timeout)
+
+        if result.found:
+            self.nonce = result.nonce
+
+        return result
+
+    def __bytes__(self) -> bytes:
+        """
+        Данные заголовка в виде последовательности байтов (копия)
+
+        :return: данные
+        """
+
+        return self._data.tobytes()
+
+    def __len__(self) -> int:
+        """
+        Длина заголовка в байтах
+
+        :return: длина
+        """
+
+        return HEADER_SIZE
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Сравнение заголовков (по данным)
+
+        :param other: другой заголовок
+        :return: ``True``, если заголовки равны
+        """
+
+        if not isinstance(other, BlockHeader):
+            return NotImplemented
+
+        return self._data == other._data
+
+    __hash__ = None
+    """ Заголовок изменяем (поля, перебор nonce), поэтому, как и bytearray, не хешируется: ключом словаря или элементом множества
+    служит bytes(header) """
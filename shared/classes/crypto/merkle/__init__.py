@@ -0,0 +1,2 @@
+from .merkle import MerkleTree
+from ._errors import *
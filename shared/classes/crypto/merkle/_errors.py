@@ -0,0 +1,18 @@
+"""
+**Сообщения об ошибках**
+
+Сообщения об ошибках, используемые классом ``MerkleTree``
+"""
+
+E_LEAF_TYPE = ('🚨 Ошибочный тип данных {} при указании листа дерева. Ожидается объект, поддерживающий протокол буфера '
+               '(последовательность или массив байтов, memoryview и т.п.)')
+""" Сообщение об ошибке при получении листа некорректного типа """
+
+E_LEAF_SIZE = '🚨 Ошибочная длина листа {} (в байтах). Лист должен быть хешем длиной {} байтов'
+""" Сообщение об ошибке при получении листа (хеша) некорректной длины """
+
+E_INDEX = '🚨 Ошибочный индекс листа {}. Индекс должен лежать в пределах [0, {})'
+""" Сообщение об ошибке при обращении к несуществующему листу """
+
+E_EMPTY = '🚨 Дерево не содержит ни одного листа, поэтому корень не определен'
+""" Сообщение об ошибке при попытке получить корень пустого дерева """
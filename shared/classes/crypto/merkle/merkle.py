@@ -0,0 +1,278 @@
+"""
+**Дерево Меркла**
+
+Дерево Меркла по правилам биткоина: листья - хеши (например, идентификаторы транзакций), каждый узел - двойной хеш конкатенации двух
+дочерних узлов, а при нечетном количестве узлов на уровне последний узел объединяется сам с собой. Каждый уровень хранится одним
+непрерывным массивом байтов, поэтому добавление или замена листа требует пересчета только пути от листа до корня (O(log n))
+"""
+
+from typing import Iterable, List, Optional
+
+from shared.classes.crypto.message import Message, Method, TData, TMethod, get_backend
+
+from ._errors import *
+
+
+class MerkleTree:
+    """ Дерево Меркла с инкрементальным пересчетом корня и доказательствами включения """
+
+    def __init__(self, leaves: Iterable[TData] = (), method: TMethod = Method.sha256, backend: Optional[str] = None) -> None:
+        """
+        Метод создания экземпляра класса и построения дерева (все уровни строятся за один проход каждый)
+
+        :param leaves: листья (хеши)
+        :param method: метод хеширования, ENum или строка (узлы вычисляются двойным хешированием)
+        :param backend: наименование реализации метода хеширования
+        :return: ``None``
+        """
+
+        self._factory = get_backend(method, backend).factory
+        self._size = self._factory().digest_size                      # размер узла (хеша) в байтах
+
+        level = bytearray()
+        for leaf in leaves:
+            level += self._check_leaf(leaf)
+
+        self._levels: List[bytearray] = [level]                       # уровни от листьев к корню
+        self._build(0)
+
+    @classmethod
+    def from_data(cls, items: Iterable[TData], method: TMethod = Method.sha256, backend: Optional[str] = None) -> 'MerkleTree':
+        """
+        Построение дерева по исходным данным (например, сериализованным транзакциям): листьями становятся их двойные хеши
+
+        :param items: исходные данные
+        :param method: метод хеширования (ENum или строка)
+        :param backend: наименование реализации метода хеширования
+        :return: дерево
+        """
+
+        digests = Message.hash_many(items, method, backend=backend)
+        return cls(Message.hash_many(digests, method, backend=backend), method, backend)
+
+    def _check_leaf(self, leaf: TData) -> memoryview:
+        """
+        Проверка листа (должен быть хешем соответствующей длины)
+
+        :param leaf: лист
+        :return: представление листа в виде байтов
+        """
+
+        try:
+            view = memoryview(leaf).cast('B')
+        except TypeError:
+            raise TypeError(E_LEAF_TYPE.format(type(leaf))) from None
+
+        if view.nbytes != self._size:
+            raise ValueError(E_LEAF_SIZE.format(view.nbytes, self._size))
+
+        return view
+
+    def _node(self, left: memoryview, right: memoryview) -> bytes:
+        """
+        Вычисление узла по двум дочерним
+
+        :param left: левый дочерний узел
+        :param right: правый дочерний узел
+        :return: двойной хеш конкатенации
+        """
+
+        state = self._factory(left)
+        state.update(right)
+        return self._factory(state.digest()).digest()
+
+    def _build(self, start: int) -> None:
+        """
+        Пересчет всех узлов, зависящих от листьев, начиная с индекса start (уровень за уровнем, каждый - одним проходом)
+
+        :param start: индекс первого измененного листа
+        :return: ``None``
+        """
+
+        size = self._size
+        depth = 0
+
+        while len(self._levels[depth]) > size:                        # пока на уровне больше одного узла
+            view = memoryview(self._levels[depth])
+            count = len(view) // size
+            start -= start % 2                                        # пересчет начинается с левого узла пары
+
+            if depth + 1 == len(self._levels):
+                self._levels.append(bytearray())
+
+            parents = self._levels[depth + 1]
+            del parents[start // 2 * size:]                           # родители, начиная с первого затронутого, пересчитываются
+
+            for i in range(start, count, 2):
+                left = view[i * size:(i + 1) * size]
+                right = view[(i + 1) * size:(i + 2) * size] if i + 1 < count else left
+                parents += self._node(left, right)
+
+            view.release()
+            start //= 2
+            depth += 1
+
+        del self._levels[depth + 1:]                                  # уровни выше корня (если остались) не нужны
+
+    def _update(self, index: int) -> None:
+        """
+        Пересчет пути от листа до корня (только по одному узлу на каждом уровне)
+
+        :param index: индекс измененного листа
+        :return: ``None``
+        """
+
+        size = self._size
+        depth = 0
+
+        while len(self._levels[depth]) > size:
+            level = self._levels[depth]
+            count = len(level) // size
+            left = index - index % 2
+            right = left + 1 if left + 1 < count else left
+
+            view = memoryview(level)
+            node = self._node(view[left * size:(left + 1) * size], view[right * size:(right + 1) * size])
+            view.release()                                            # иначе массив уровня нельзя будет расширить
+
+            if depth + 1 == len(self._levels):
+                self._levels.append(bytearray())
+
+            parents = self._levels[depth + 1]
+            parent = index // 2
+
+            if parent * size == len(parents):                         # у уровня появился новый узел
+                parents += node
+            else:
+                parents[parent * size:(parent + 1) * size] = node
+
+            index = parent
+            depth += 1
+
+    def append(self, leaf: TData) -> None:
+        """
+        Добавление листа с пересчетом только пути от него до корня
+
+        :param leaf: лист (хеш)
+        :return: ``None``
+        """
+
+        self._levels[0] += self._check_leaf(leaf)
+        self._update(len(self) - 1)
+
+    def extend(self, leaves: Iterable[TData]) -> None:
+        """
+        Добавление нескольких листьев (пересчитываются только узлы, зависящие от новых листьев)
+
+        :param leaves: листья (хеши)
+        :return: ``None``
+        """
+
+        start = len(self)
+        for leaf in leaves:
+            self._levels[0] += self._check_leaf(leaf)
+
+        if len(self) > start:
+            self._build(start)
+
+    def replace(self, index: int, leaf: TData) -> None:
+        """
+        Замена листа с пересчетом только пути от него до корня
+
+        :param index: индекс листа
+        :param leaf: новый лист (хеш)
+        :return: ``None``
+        """
+
+        self._check_index(index)
+        self._levels[0][index * self._size:(index + 1) * self._size] = self._check_leaf(leaf)
+        self._update(index)
+
+    def _check_index(self, index: int) -> None:
+        """
+        Проверка индекса листа
+
+        :param index: индекс листа
+        :return: ``None``
+        """
+
+        if not 0 <= index < len(self):
+            raise IndexError(E_INDEX.format(index, len(self)))
+
+    def __len__(self) -> int:
+        """
+        Количество листьев
+
+        :return: количество листьев
+        """
+
+        return len(self._levels[0]) // self._size
+
+    def leaf(self, index: int) -> bytes:
+        """
+        Получение листа по индексу
+
+        :param index: индекс листа
+        :return: лист (хеш)
+        """
+
+        self._check_index(index)
+        return bytes(self._levels[0][index * self._size:(index + 1) * self._size])
+
+    @property
+    def root(self) -> bytes:
+        """
+        Свойство "Корень дерева"
+
+        :return: корень (хеш)
+        """
+
+        if not self._levels[0]:
+            raise ValueError(E_EMPTY)
+
+        return bytes(self._levels[-1])
+
+    def proof(self, index: int) -> List[bytes]:
+        """
+        Доказательство включения листа: соседние узлы на пути от листа до корня (снизу вверх)
+
+        :param index: индекс листа
+        :return: список соседних узлов
+        """
+
+        self._check_index(index)
+        size = self._size
+        path = []
+
+        for level in self._levels[:-1]:                               # на уровне корня соседа нет
+            count = len(level) // size
+            sibling = index ^ 1 if index ^ 1 < count else index       # последний узел нечетного уровня - сам себе сосед
+            path.append(bytes(level[sibling * size:(sibling + 1) * size]))
+            index //= 2
+
+        return path
+
+    @staticmethod
+    def verify(leaf: TData, index: int, proof: List[bytes], root: bytes, method: TMethod = Method.sha256,
+               backend: Optional[str] = None) -> bool:
+        """
+        Проверка доказательства включения листа
+
+        :param leaf: лист (хеш)
+        :param index: индекс листа
+        :param proof: доказательство включения (см. proof())
+        :param root: ожидаемый корень
+        :param method: метод хеширования (ENum или строка)
+        :param backend: наименование реализации метода хеширования
+        :return: ``True``, если доказательство приводит к ожидаемому корню
+        """
+
+        factory = get_backend(method, backend).factory
+        node = bytes(leaf)
+
+        for sibling in proof:
+            pair = node + sibling if index % 2 == 0 else sibling + node
+            node = factory(factory(pair).digest()).digest()
+            index //= 2
+
+        return index == 0 and node == root                            # индекс должен был исчерпаться ровно на корне
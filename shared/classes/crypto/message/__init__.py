@@ -0,0 +1,6 @@
+from .message import Message
+from .frozen import FrozenMessage
+from ._backends import *
+from ._constants import *
+from ._errors import *
+from ._typing import *
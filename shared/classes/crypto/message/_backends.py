@@ -0,0 +1,188 @@
+"""
+**Реестр реализаций методов хеширования (backends)**
+
+Для каждого метода хеширования (``Method``) может быть зарегистрировано несколько реализаций: аппаратно ускоренная (OpenSSL через
+``hashlib``, использующая Intel® SHA Extensions, если процессор их поддерживает) и эталонная на чистом Python (для перекрестной
+проверки). При импорте модуля для каждого метода выбирается самая быстрая из доступных реализаций
+"""
+
+import hashlib
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from ._errors import *
+from ._sha256 import Sha256
+from ._typing import *
+
+PROBE = bytes(1024)
+""" Образец данных, на котором при импорте сравнивается скорость доступных реализаций """
+
+PROBE_ROUNDS = 3
+""" Количество замеров на каждую реализацию (берется лучший) """
+
+
+@dataclass
+class Backend:
+    """ Сведения о реализации метода хеширования """
+
+    nme: str                                                          # наименование реализации
+    method: Method                                                    # реализуемый метод хеширования
+    factory: THasherFactory                                           # фабрика объектов хеширования
+    accelerated: bool                                                 # признак аппаратного ускорения
+
+
+_registry: Dict[Method, Dict[str, Backend]] = {}
+""" Зарегистрированные реализации (метод -> наименование -> реализация) """
+
+_defaults: Dict[Method, Backend] = {}
+""" Реализации, используемые по умолчанию (метод -> реализация) """
+
+
+def find_method(method: TMethod) -> Method:
+    """
+    Получение метода хеширования (элемента ENum-а) с проверкой типа данных, а если поступила строка, то и значения. Строка ищется
+    сначала по наименованию, а затем по псевдониму (без учета регистра, дефисов и подчеркиваний)
+
+    :param method: метод хеширования (ENum или строка)
+    :return: метод хеширования (ENum)
+    """
+
+    t = type(method)                                                  # получаем тип
+
+    if t is Method:                                                   # если пришел ENum, то...
+        return method                                                 # ... проверять нечего
+
+    if t is str:                                                      # если пришла строка, то...
+        found = METHODS.get(method) or METHOD_ALIASES.get(alias(method))  # ... ищем по наименованию, затем по псевдониму
+
+        if found is None:                                             # ... если не найдено совпадений, то...
+            raise ValueError(E_METHOD_NAME.format(method))            # ... ... поднимаем исключение (ошибочное значение)
+
+        return found                                                  # ... если пришли сюда, значит, значение найдено (ENum)
+
+    raise TypeError(E_METHOD_TYPE.format(t))                          # ... если пришли сюда, значит поднимаем исключение (ошибка типа)
+
+
+def register_backend(method: TMethod, nme: str, factory: THasherFactory, accelerated: bool = False) -> Backend:
+    """
+    Регистрация реализации метода хеширования. Если для метода еще нет реализации по умолчанию, ею становится зарегистрированная
+
+    :param method: метод хеширования (ENum или строка)
+    :param nme: наименование реализации (уникально в рамках метода)
+    :param factory: фабрика объектов хеширования
+    :param accelerated: признак аппаратного ускорения
+    :return: зарегистрированная реализация
+    """
+
+    method = find_method(method)
+    backend = Backend(nme, method, factory, accelerated)
+    _registry.setdefault(method, {})[nme] = backend
+    _defaults.setdefault(method, backend)
+    return backend
+
+
+def get_backend(method: TMethod, nme: Optional[str] = None) -> Backend:
+    """
+    Получение реализации метода хеширования по наименованию (если наименование не указано - реализации по умолчанию)
+
+    :param method: метод хеширования (ENum или строка)
+    :param nme: наименование реализации
+    :return: реализация
+    """
+
+    if type(method) is not Method:                                    # строка ищется так же, как и при создании сообщения
+        method = find_method(method)
+
+    if nme is None:
+        backend = _defaults.get(method)
+        if backend is None:
+            raise ValueError(E_BACKEND_METHOD.format(method.nme))
+        return backend
+
+    backend = _registry.get(method, {}).get(nme)
+    if backend is None:
+        raise ValueError(E_BACKEND_NAME.format(method.nme, nme))
+    return backend
+
+
+def list_backends(method: TMethod) -> List[Backend]:
+    """
+    Получение всех зарегистрированных реализаций метода хеширования
+
+    :param method: метод хеширования (ENum или строка)
+    :return: список реализаций (в порядке регистрации)
+    """
+
+    return list(_registry.get(find_method(method), {}).values())
+
+
+def set_default_backend(method: TMethod, nme: str) -> Backend:
+    """
+    Явная установка реализации по умолчанию (например, чтобы принудительно использовать эталонную реализацию)
+
+    :param method: метод хеширования (ENum или строка)
+    :param nme: наименование реализации
+    :return: реализация, ставшая реализацией по умолчанию
+    """
+
+    backend = get_backend(method, nme)
+    _defaults[backend.method] = backend
+    return backend
+
+
+def select_backend(method: TMethod) -> Backend:
+    """
+    Выбор самой быстрой реализации метода хеширования (по результатам замера на образце PROBE) и установка ее по умолчанию
+
+    :param method: метод хеширования (ENum или строка)
+    :return: выбранная реализация
+    """
+
+    method = find_method(method)
+
+    best, best_time = None, None
+
+    for backend in list_backends(method):
+        elapsed = None
+        for _ in range(PROBE_ROUNDS):                                 # берем лучший из нескольких замеров (меньше шума)
+            started = perf_counter()
+            backend.factory(PROBE).digest()
+            spent = perf_counter() - started
+            elapsed = spent if elapsed is None else min(elapsed, spent)
+
+        if best_time is None or elapsed < best_time:
+            best, best_time = backend, elapsed
+
+    if best is None:
+        raise ValueError(E_BACKEND_METHOD.format(method.nme))
+
+    _defaults[method] = best
+    return best
+
+
+def _openssl_sha256() -> Optional[THasherFactory]:
+    """
+    Получение фабрики SHA-256 из ``hashlib`` (при сборке с OpenSSL используется аппаратное ускорение Intel® SHA Extensions)
+
+    :return: фабрика или ``None``, если в текущей сборке Python метод недоступен
+    """
+
+    try:
+        hashlib.sha256(b'').digest()                                  # в некоторых сборках (FIPS и т.п.) метод может быть недоступен
+    except ValueError:
+        return None
+
+    return hashlib.sha256
+
+
+_factory = _openssl_sha256()
+
+if _factory is not None:
+    _accelerated = Method.sha256.acceleration and _factory.__module__ == '_hashlib'
+    register_backend(Method.sha256, 'hashlib', _factory, _accelerated)
+
+register_backend(Method.sha256, 'python', Sha256, False)
+
+for _method in _registry:                                             # выбираем самую быструю реализацию для каждого метода
+    select_backend(_method)
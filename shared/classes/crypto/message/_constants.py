@@ -0,0 +1,56 @@
+"""
+**Константы общего назначения**
+
+Константы, используемые классом ``Message`` согласно требованиям, описанным в wiki: https://github.com/hmxustin/pybchain/wiki/Message
+"""
+
+BITS_IN_BYTE = 8
+""" Количество битов в байте """
+
+MIN_LENGTH = 0
+""" Минимальная длина сообщения в битах """
+
+MAX_LENGTH_IN_BITS = 8_589_934_592
+""" Максимальная длина сообщения в битах """
+
+MAX_LENGTH = MAX_LENGTH_IN_BITS // BITS_IN_BYTE
+""" Максимальная длина сообщения в байтах (всё-таки данные хранятся в байтах) """
+
+LENGTH_SIZE = 64
+""" Размер в битах слова (QWord), представляющего собой значение длины сообщения в битах """
+
+DEF_ENCODING = 'utf-8'
+""" Кодировка строки по умолчанию """
+
+DEF_METHOD = 'sha256'
+""" Метод хеширования по умолчанию """
+
+CHUNK_SIZE = 1_048_576
+""" Размер порции (в байтах) при чтении потока в инкрементальном режиме """
+
+OUT_LIST = 'list'
+""" Форма результата пакетного хеширования: список хешей """
+
+OUT_BYTES = 'bytes'
+""" Форма результата пакетного хеширования: все хеши подряд в одной последовательности байтов """
+
+OUT_NUMPY = 'numpy'
+""" Форма результата пакетного хеширования: массив NumPy размерности (n, размер хеша) """
+
+WHITESPACE = ' \t\n\r\v\f'
+""" Пробельные символы, удаляемые из шестнадцатеричных и бинарных строк """
+
+WHITESPACE_TABLE = str.maketrans('', '', WHITESPACE)
+""" Таблица для удаления пробельных символов за один проход (str.translate) """
+
+BIN_DIGITS = b'01'
+""" Допустимые символы бинарной строки """
+
+BIN_CHUNK = 65_536
+""" Количество битов, декодируемых из бинарной строки за один раз (кратно BITS_IN_BYTE) """
+
+EMPTY_MESSAGE = bytearray([])
+""" Пустое сообщение """
+
+EMPTY_VIEW = memoryview(b'')
+""" Представление пустого сообщения (не удерживает никакого внешнего буфера) """
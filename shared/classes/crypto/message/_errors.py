@@ -0,0 +1,74 @@
+"""
+**Сообщения об ошибках**
+
+Сообщения об ошибках, используемые в классе ``Message`` согласно требованиям, описанным в wiki:
+https://github.com/hmxustin/pybchain/wiki/Message
+"""
+
+E_METHOD_TYPE = '🚨 Ошибочный тип данных {} при указании метода хеширования. Ожидается строка или перечисление "Method"'
+""" Сообщение об ошибке при получении некорректного типа данных при установке метода хеширования """
+
+E_METHOD_NAME = '🚨 Ошибочное наименование {} при указании метода хеширования. Ожидается строка, перечисленная в "Method.*.nme"'
+""" Сообщение об ошибке при попытке указать некорректное наименование для метода хеширования (указание через строку) """
+
+E_ENCODING_TYPE = ('🚨 Ошибочный тип данных {} при указании кодовой таблицы (способа интерпретации данных). Ожидается строка или '
+                   'перечисление "Encoding"')
+""" Сообщение об ошибке при получении некорректного типа данных при установке кодировки """
+
+E_ENCODING_NAME = ('🚨 Ошибочное наименование {} при указании кодовой таблицы (способа интерпретации данных). Ожидается строка, '
+                   'перечисленная в "Encoding.*.nme"')
+""" Сообщение об ошибке при попытке указать некорректное наименование для кодировки (при указании через строку) """
+
+E_DATA_TYPE = ('🚨 Ошибочный тип данных {} при указании исходной совокупности данных. Ожидается строка или объект, '
+               'поддерживающий протокол буфера (последовательность или массив байтов, memoryview, mmap и т.п.)')
+""" Сообщение об ошибке при получении некорректного типа данных при установке исходных данных """
+
+E_DATA_LENGTH = ('🚨 Слишком большой массив (фактическая длина в байтах: {}) для хеширования. Максимальная длина в байтах не должна '
+                 'превышать {}')
+""" Сообщение об ошибке при получении некорректного типа данных при установке исходных данных """
+
+E_BACKEND_NAME = '🚨 Для метода хеширования {} не зарегистрирована реализация (backend) с наименованием {}'
+""" Сообщение об ошибке при попытке получить незарегистрированную реализацию метода хеширования """
+
+E_BACKEND_METHOD = '🚨 Для метода хеширования {} не зарегистрировано ни одной реализации (backend)'
+""" Сообщение об ошибке при попытке хешировать методом, для которого нет ни одной реализации """
+
+E_STREAM_LENGTH = ('🚨 Слишком большой объем данных в инкрементальном режиме (длина в битах с учетом очередной порции: {}). Максимальная '
+                   'длина в битах не должна превышать {}')
+""" Сообщение об ошибке при превышении максимальной длины сообщения в инкрементальном режиме """
+
+E_STREAM_METHOD = ('🚨 Метод хеширования нельзя изменить в инкрементальном режиме: полученные порции данных не сохраняются, поэтому '
+                   'пересчитать хеш другим методом невозможно')
+""" Сообщение об ошибке при попытке изменить метод хеширования в инкрементальном режиме """
+
+E_STREAM_BACKEND = ('🚨 В инкрементальном режиме хеш вычисляется реализацией {}, выбранной при первом вызове update(). Другую '
+                    'реализацию указать нельзя')
+""" Сообщение об ошибке при попытке получить хеш другой реализацией в инкрементальном режиме """
+
+E_OUT = '🚨 Ошибочная форма результата пакетного хеширования {}. Ожидается одно из значений: OUT_LIST, OUT_BYTES, OUT_NUMPY'
+""" Сообщение об ошибке при указании некорректной формы результата пакетного хеширования """
+
+E_BATCH_TYPE = '🚨 Каждый элемент пакета должен поддерживать протокол буфера (последовательность или массив байтов, memoryview и т.п.)'
+""" Сообщение об ошибке при получении в пакете элемента некорректного типа """
+
+E_NUMPY = '🚨 Для получения результата в виде массива NumPy требуется установить пакет numpy'
+""" Сообщение об ошибке при отсутствии необязательной зависимости NumPy """
+
+E_HEX_STRING = '🚨 Строка не является шестнадцатеричной: допускаются только пары шестнадцатеричных цифр и пробельные символы ({})'
+""" Сообщение об ошибке при получении некорректной шестнадцатеричной строки """
+
+E_BIN_STRING = ('🚨 Строка не является бинарной: допускаются только символы 0 и 1 (количество которых должно быть кратно 8) и '
+                'пробельные символы')
+""" Сообщение об ошибке при получении некорректной бинарной строки """
+
+E_TEXT_STRING = '🚨 Строку нельзя представить в кодировке {}: {}'
+""" Сообщение об ошибке при получении строки с символами, отсутствующими в кодовой таблице """
+
+E_TEXT_ENCODING = '🚨 Кодировка {} не является текстовой: потоковое кодирование возможно только для кодировок из "TEXT_CODECS"'
+""" Сообщение об ошибке при попытке потокового кодирования текста в бинарную или шестнадцатеричную строку """
+
+E_TEXT_TYPE = '🚨 Ошибочный тип данных {} порции текста. Ожидается строка'
+""" Сообщение об ошибке при получении порции текста, не являющейся строкой """
+
+E_FROZEN = '🚨 Сообщение FrozenMessage неизменяемо: атрибут {} нельзя установить или удалить'
+""" Сообщение об ошибке при попытке изменить или удалить атрибут неизменяемого сообщения """
@@ -0,0 +1,162 @@
+"""
+**Эталонная реализация SHA-256 на чистом Python**
+
+Реализация алгоритма SHA-256 (FIPS 180-4) без обращения к OpenSSL. Работает на порядки медленнее аппаратно ускоренной реализации из
+``hashlib``, поэтому используется только для перекрестной проверки результатов и в окружениях, где ``hashlib.sha256`` недоступен
+"""
+
+from struct import Struct
+
+from ._constants import BITS_IN_BYTE, LENGTH_SIZE
+
+BLOCK_SIZE = 64
+""" Размер блока (в байтах), которыми алгоритм обрабатывает сообщение """
+
+DIGEST_SIZE = 32
+""" Размер хеша (в байтах) """
+
+LENGTH_BYTES = LENGTH_SIZE // BITS_IN_BYTE
+""" Размер в байтах слова, в которое при дополнении (padding) записывается длина сообщения в битах """
+
+MASK = 0xFFFFFFFF
+""" Маска 32-битного слова """
+
+H0 = (
+    0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19
+)
+""" Начальное состояние (дробные части квадратных корней первых восьми простых чисел) """
+
+K = (
+    0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+    0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+    0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+    0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7, 0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+    0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+    0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+    0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+    0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2
+)
+""" Раундовые константы (дробные части кубических корней первых 64 простых чисел) """
+
+_WORDS = Struct('>16L')
+""" Разбор блока на 16 слов (big-endian) """
+
+_STATE = Struct('>8L')
+""" Упаковка состояния в итоговый хеш (big-endian) """
+
+_LENGTH = Struct('>Q')
+""" Упаковка длины сообщения в битах (слово размером LENGTH_SIZE) """
+
+
+def _compress(state: tuple, block: bytes) -> tuple:
+    """
+    Функция сжатия: обработка одного блока размером BLOCK_SIZE
+
+    :param state: текущее состояние (восемь 32-битных слов)
+    :param block: блок данных
+    :return: новое состояние
+    """
+
+    w = list(_WORDS.unpack(block))                                    # первые 16 слов расписания берем из блока как есть
+    for i in range(16, 64):                                           # остальные слова расписания вычисляем
+        x = w[i - 15]
+        y = w[i - 2]
+        s0 = ((x >> 7 | x << 25) ^ (x >> 18 | x << 14) ^ (x >> 3)) & MASK
+        s1 = ((y >> 17 | y << 15) ^ (y >> 19 | y << 13) ^ (y >> 10)) & MASK
+        w.append((w[i - 16] + s0 + w[i - 7] + s1) & MASK)
+
+    a, b, c, d, e, f, g, h = state
+
+    for i in range(64):                                               # 64 раунда сжатия
+        s1 = ((e >> 6 | e << 26) ^ (e >> 11 | e << 21) ^ (e >> 25 | e << 7)) & MASK
+        ch = (e & f) ^ (~e & g)
+        t1 = (h + s1 + ch + K[i] + w[i]) & MASK
+        s0 = ((a >> 2 | a << 30) ^ (a >> 13 | a << 19) ^ (a >> 22 | a << 10)) & MASK
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        t2 = (s0 + maj) & MASK
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & MASK, c, b, a, (t1 + t2) & MASK
+
+    return tuple((x + y) & MASK for x, y in zip(state, (a, b, c, d, e, f, g, h)))
+
+
+class Sha256:
+    """ Объект хеширования SHA-256 с тем же интерфейсом, что и у объектов ``hashlib`` (update, digest, hexdigest, copy) """
+
+    name = 'sha256'
+    digest_size = DIGEST_SIZE
+    block_size = BLOCK_SIZE
+
+    def __init__(self, data: bytes = b'') -> None:
+        """
+        Метод создания экземпляра класса и установки начального состояния
+
+        :param data: данные, которые следует сразу же добавить к хешируемой последовательности
+        :return: ``None``
+        """
+
+        self._state = H0                                              # текущее состояние (после всех обработанных блоков)
+        self._buffer = b''                                            # хвост, не набравший целого блока
+        self._length = 0                                              # общее количество полученных байтов
+
+        if data:
+            self.update(data)
+
+    def update(self, data: bytes) -> None:
+        """
+        Добавление очередной порции данных к хешируемой последовательности
+
+        :param data: очередная порция данных (любой объект, поддерживающий протокол буфера)
+        :return: ``None``
+        """
+
+        data = bytes(data)                                            # нам нужны неизменяемые байты (в т.ч. из memoryview)
+        self._length += len(data)
+
+        buffer = self._buffer + data if self._buffer else data
+        state = self._state
+        end = len(buffer) - len(buffer) % BLOCK_SIZE                  # граница последнего целого блока
+
+        for i in range(0, end, BLOCK_SIZE):                           # сжимаем все целые блоки
+            state = _compress(state, buffer[i:i + BLOCK_SIZE])
+
+        self._state = state
+        self._buffer = buffer[end:]                                   # остаток дождется следующей порции (или дополнения)
+
+    def digest(self) -> bytes:
+        """
+        Получение хеша. Состояние объекта не меняется, поэтому после вызова можно продолжать добавлять данные
+
+        :return: хеш в виде последовательности байтов
+        """
+
+        tail = self._buffer + b'\x80'                                 # единичный бит сразу за данными
+        tail += b'\x00' * ((BLOCK_SIZE - LENGTH_BYTES - len(tail)) % BLOCK_SIZE)
+        tail += _LENGTH.pack(self._length * BITS_IN_BYTE)             # длина сообщения в битах (слово размером LENGTH_SIZE)
+
+        state = self._state
+        for i in range(0, len(tail), BLOCK_SIZE):
+            state = _compress(state, tail[i:i + BLOCK_SIZE])
+
+        return _STATE.pack(*state)
+
+    def hexdigest(self) -> str:
+        """
+        Получение хеша в виде шестнадцатеричной строки
+
+        :return: шестнадцатеричная строка
+        """
+
+        return self.digest().hex()
+
+    def copy(self) -> 'Sha256':
+        """
+        Получение копии объекта хеширования вместе с промежуточным состоянием
+
+        :return: независимая копия
+        """
+
+        other = Sha256.__new__(Sha256)
+        other._state = self._state
+        other._buffer = self._buffer
+        other._length = self._length
+        return other
@@ -0,0 +1,111 @@
+"""
+**Типы и перечисления для "Сообщения"**
+
+Модуль содержит перечисления (кодировки, методы хеширования) и аннотации допустимых типов для класса ``Message``
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from os import PathLike
+from typing import Any, Callable, Dict, Iterable, Union
+
+
+@dataclass(unsafe_hash=True)
+class EncodingInfo:
+    """ Сведения о кодировке сообщения (как следует интерпретировать совокупность данных) """
+
+    idx: int                                                          # индекс
+    nme: str                                                          # наименование
+    readable: bool                                                    # признак читаемости (с точки зрения человека)
+
+
+class Encoding(EncodingInfo, Enum):
+    """ Перечисление всех доступных кодировок сообщения (способов интерпретации совокупности данных) """
+
+    bnr = 100, 'bnr', False                                           # просто бинарные данные, не для чтения (binary non-readable)
+    bin = 200, 'bin', True                                            # данные должны интерпретироваться как бинарная строка
+    hex = 201, 'hex', True                                            # данные должны интерпретироваться как шестнадцатеричная строка
+    utf8 = 300, 'utf-8', True                                         # стандартная кодировка (человеко-читаемый текст)
+    cp1251 = 301, 'cp1251', True                                      # может быть реализовано при необходимости в процессе...
+    cp866 = 302, 'cp866', True                                        # ... функционального развития проекта
+    koi8r = 303, 'koi8-r', True                                       # ...
+
+    # todo Добавьте ниже дополнительную кодировку при необходимости в формате: идентификатор = индекс, 'наименование', признак читаемости
+
+
+@dataclass(unsafe_hash=True)
+class MethodInfo:
+    """ Сведения о методе хеширования (какой метод следует применить к совокупности данных при вызове hash()) """
+
+    idx: int                                                          # индекс
+    nme: str                                                          # наименование
+    acceleration: bool                                                # доступно ли аппаратное ускорение
+
+
+class Method(MethodInfo, Enum):
+    """ Перечисление всех доступных методов хеширования """
+
+    sha256 = 10, 'sha-256', True                                      # метод sha-256 с ускорением на уровне CPU (Intel® SHA Extensions)
+
+    # todo Добавьте ниже дополнительный метод хеширования в формате: идентификатор = индекс, 'наименование', имеет ли аппаратное ускорение
+
+
+def alias(nme: str) -> str:
+    """
+    Приведение наименования к псевдониму: без учета регистра, дефисов и подчеркиваний (например, 'SHA-256' -> 'sha256')
+
+    :param nme: наименование
+    :return: псевдоним
+    """
+
+    return nme.lower().replace('-', '').replace('_', '')
+
+
+METHODS: Dict[str, Method] = {i.nme: i for i in Method}
+""" Методы хеширования по наименованию (Method.*.nme) """
+
+METHODS_BY_IDX: Dict[int, Method] = {i.idx: i for i in Method}
+""" Методы хеширования по индексу (Method.*.idx) """
+
+METHOD_ALIASES: Dict[str, Method] = {alias(nme): i for i in Method for nme in (i.nme, i.name)}
+""" Методы хеширования по псевдониму наименования или идентификатора (например, 'sha256') """
+
+ENCODINGS: Dict[str, Encoding] = {i.nme: i for i in Encoding}
+""" Кодировки по наименованию (Encoding.*.nme) """
+
+ENCODINGS_BY_IDX: Dict[int, Encoding] = {i.idx: i for i in Encoding}
+""" Кодировки по индексу (Encoding.*.idx) """
+
+ENCODING_ALIASES: Dict[str, Encoding] = {alias(nme): i for i in Encoding for nme in (i.nme, i.name)}
+""" Кодировки по псевдониму наименования или идентификатора (например, 'utf8', 'KOI8-R') """
+
+TEXT_CODECS: Dict[Encoding, str] = {
+    Encoding.bnr: 'utf-8',                                            # строка без указания текстовой кодировки кодируется в utf-8
+    Encoding.utf8: 'utf-8',
+    Encoding.cp1251: 'cp1251',
+    Encoding.cp866: 'cp866',
+    Encoding.koi8r: 'koi8-r',
+}
+""" Кодеки (наименования для модуля codecs) кодировок, в которых строка кодируется как текст (а не декодируется как bin или hex) """
+
+
+TData = Union[str, bytes, bytearray, memoryview]
+""" Допустимые типы входящих (исходных) данных для сообщения (а также любые другие объекты, поддерживающие протокол буфера) """
+
+TPath = Union[str, bytes, PathLike]
+""" Допустимые типы для указания пути к файлу """
+
+TText = Union[str, Iterable[str]]
+""" Допустимые типы текста для потокового кодирования: строка или последовательность порций-строк (генератор, файл и т.п.) """
+
+TEncoding = Union[Encoding, str]
+""" Допустимые типы для установки кодировки """
+
+TMethod = Union[Method, str]
+""" Допустимые типы для установки метода хеширования """
+
+THasher = Any
+""" Объект хеширования с интерфейсом ``hashlib`` (update, digest, hexdigest, copy) """
+
+THasherFactory = Callable[..., THasher]
+""" Фабрика объектов хеширования: принимает (необязательно) начальную порцию данных и возвращает объект хеширования """
@@ -0,0 +1,163 @@
+"""
+Определен класс FrozenMessage: компактное неизменяемое сообщение для массовых объектов (транзакции, заголовки блоков в мемпуле и т.п.)
+"""
+
+from ._backends import *
+from ._constants import *
+from ._errors import *
+from ._typing import *
+from .message import Message
+
+
+class FrozenMessage:
+    """
+    Неизменяемое сообщение без словаря атрибутов (__slots__): хранит только неизменяемые байты, ссылку на элемент перечисления Method
+    (элементы перечисления - единственные экземпляры, поэтому ссылка не создает копий) и хеш, вычисляемый при первом обращении.
+    Атрибуты после создания нельзя ни установить, ни удалить (иначе сохраненный хеш перестал бы соответствовать данным)
+    """
+
+    __slots__ = ('_data', '_method', '_digest')
+
+    def __init__(self, data: TData, method: TMethod = Method.sha256) -> None:
+        """
+        Метод создания экземпляра класса и установки значений
+
+        :param data: исходные данные (любой объект, поддерживающий протокол буфера; bytes сохраняются без копирования)
+        :param method: метод хеширования
+        :return: ``None``
+        """
+
+        if type(data) is not bytes:                                   # храним только неизменяемые байты (для bytes - без копирования)
+            try:
+                data = memoryview(data).tobytes()
+            except TypeError:
+                t = type(data)
+                raise TypeError(E_DATA_TYPE.format(t)) from None
+
+        if len(data) > MAX_LENGTH:
+            raise ValueError(E_DATA_LENGTH.format(str(len(data)), str(MAX_LENGTH)))
+
+        _set_data(self, data)                                         # запись в слоты в обход запрета (см. __setattr__)
+        _set_method(self, method if type(method) is Method else Message._find_method(method))  # проверки те же, что и у Message
+        # слот _digest остается пустым до первого обращения к хешу (на одну запись в обход запрета меньше)
+
+    @property
+    def data(self) -> bytes:
+        """
+        Свойство "Данные"
+
+        :return: данные
+        """
+
+        return self._data
+
+    @property
+    def method(self) -> Method:
+        """
+        Свойство "Метод"
+
+        :return: метод (хеширования)
+        """
+
+        return self._method
+
+    @property
+    def cached(self) -> bool:
+        """
+        Свойство "Хеш уже вычислен"
+
+        :return: ``True``, если хеш вычислен и сохранен
+        """
+
+        return hasattr(self, '_digest')
+
+    def hash(self) -> bytes:
+        """
+        Хеширование данных (вычисляется один раз, далее возвращается сохраненное значение)
+
+        :return: хеш в виде последовательности байтов
+        """
+
+        try:
+            return self._digest
+        except AttributeError:                                        # хеш еще не вычислен (слот пуст)
+            digest = get_backend(self._method).factory(self._data).digest()
+            _set_digest(self, digest)
+            return digest
+
+    def digest(self) -> bytes:
+        """
+        Получение хеша в виде последовательности байтов (синоним hash())
+
+        :return: хеш в виде последовательности байтов
+        """
+
+        return self.hash()
+
+    def hexdigest(self) -> str:
+        """
+        Получение хеша в виде шестнадцатеричной строки
+
+        :return: хеш в виде шестнадцатеричной строки
+        """
+
+        return self.hash().hex()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Запрет установки атрибутов
+
+        :param name: наименование атрибута
+        :param value: значение
+        :return: ``None``
+        """
+
+        raise AttributeError(E_FROZEN.format(name))
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Запрет удаления атрибутов
+
+        :param name: наименование атрибута
+        :return: ``None``
+        """
+
+        raise AttributeError(E_FROZEN.format(name))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Сравнение сообщений (по методу хеширования и данным)
+
+        :param other: другое сообщение
+        :return: ``True``, если сообщения равны
+        """
+
+        if type(other) is not FrozenMessage:
+            return NotImplemented
+
+        return self._method is other._method and self._data == other._data
+
+    def __hash__(self) -> int:
+        """
+        Хеш для использования в множествах и в качестве ключа словаря (хеш bytes кешируется самим Python)
+
+        :return: хеш
+        """
+
+        return hash(self._data)
+
+    def __len__(self) -> int:
+        """
+        Длина данных в байтах
+
+        :return: длина
+        """
+
+        return len(self._data)
+
+
+_set_data = FrozenMessage._data.__set__
+_set_method = FrozenMessage._method.__set__
+_set_digest = FrozenMessage._digest.__set__
+""" Запись в слоты через их дескрипторы в обход запрета (только внутри класса: при создании и для хеша). Это та же запись, что и
+object.__setattr__, но без поиска атрибута по имени (примерно вдвое быстрее) """
@@ -0,0 +1,761 @@
+"""
+Определен класс Message (согласно требованиям, описанным в wiki: https://github.com/hmxustin/pybchain/wiki/Message)
+"""
+
+import codecs
+import mmap
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from ._backends import *
+from ._constants import *
+from ._errors import *
+from ._typing import *
+
+
+class Message:
+    """ Сообщение, подлежащее хешированию (совокупность данных, описанная в спецификации) """
+
+    def __init__(self, data: TData = EMPTY_MESSAGE, encoding: TEncoding = Encoding.utf8, method: TMethod = Method.sha256) -> None:
+        """
+        Метод создания экземпляра класса и установки начальных значений
+
+        :param data: исходная совокупность данных
+        :param encoding: кодировка (способ интерпретации исходной совокупности данных)
+        :param method: метод хеширования, который требуется применить к исходной совокупности данных при вызове hash()
+        :return: ``None``
+        """
+        ...
+
+        self._method: Method                                          # инициация метода хеширования (ENum принимаем без проверок)
+        self._method = method if type(method) is Method else self._find_method(method)
+
+        self._encoding: Encoding                                      # инициализация кодировки (ENum принимаем без проверок)
+        self._encoding = encoding if type(encoding) is Encoding else self._find_encoding(encoding)
+
+        self._data: memoryview                                        # инициализация совокупности данных (представление только для чтения)
+        self._buffer: Optional[memoryview] = None                     # собственная изменяемая копия данных (создается только по запросу)
+        self._mapping: Optional[mmap.mmap] = None                     # отображение файла в память (только для from_file())
+        self._state: Optional[THasher] = None                         # состояние хеширования в инкрементальном режиме (см. update())
+        self._backend: Optional[Backend] = None                       # реализация метода хеширования в инкрементальном режиме
+        self._length = 0                                              # общая длина данных в байтах в инкрементальном режиме
+        self._digests: Dict[Method, bytes] = {}                       # вычисленные хеши неизменяемых данных (по методу хеширования)
+        self._immutable = False                                       # признак неизменяемости данных (только их хеши можно сохранять)
+        self._set_data(data)                                          # фактическая установка данных с проверками и преобразованиями
+
+    def _set_method(self, method: Method) -> None:
+        """
+        Установка метода хеширования исходной совокупности данных. Перед установкой производится проверка: на корректность типа данных, а
+        в случае, если поступила строка, проверяется еще и значение (на предмет соответствия одному из значений ENum-а)
+
+        :param method: метод хеширования, который требуется применить к исходной совокупности данных при вызове hash()
+        :return: ``None``
+        """
+
+        self._method = self._find_method(method)                      # устанавливаем значение (ENum), найденное с проверками
+
+    @staticmethod
+    def _find_method(method: TMethod) -> Method:
+        """
+        Получение метода хеширования (элемента ENum-а) с проверками (см. find_method())
+
+        :param method: метод хеширования (ENum или строка)
+        :return: метод хеширования (ENum)
+        """
+
+        return find_method(method)                                    # та же проверка, что и при выборе реализации хеширования
+
+    def _set_encoding(self, encoding: Encoding) -> None:
+        """
+        Установка кодировки (способа интерпретации данных). Перед установкой производится проверка на корректность типа данных, а если
+        поступила строка, дополнительно проверяется ее значение (на предмет соответствия одному из допустимых значений ENum-a)
+
+        :param encoding: кодировка (способ интерпретации данных)
+        :return: ``None``
+        """
+
+        self._encoding = self._find_encoding(encoding)                # устанавливаем значение (ENum), найденное с проверками
+
+    @staticmethod
+    def _find_encoding(encoding: TEncoding) -> Encoding:
+        """
+        Получение кодировки (элемента ENum-а) с проверкой типа данных, а если поступила строка, то и значения. Строка ищется сначала
+        по наименованию, а затем по псевдониму (без учета регистра, дефисов и подчеркиваний)
+
+        :param encoding: кодировка (ENum или строка)
+        :return: кодировка (ENum)
+        """
+
+        t = type(encoding)                                            # получаем тип
+
+        if t is Encoding:                                             # если получили ENum, то...
+            return encoding                                           # ... проверять нечего
+
+        if t is str:                                                  # если пришла строка, то...
+            found = ENCODINGS.get(encoding) or ENCODING_ALIASES.get(alias(encoding))  # ... ищем по наименованию, затем по псевдониму
+
+            if found is None:                                         # ... если не найдено совпадений, то...
+                raise ValueError(E_ENCODING_NAME.format(encoding))    # ... ... поднимаем исключение (ошибочное значение)
+
+            return found                                              # ... если уж нашли, то возвращаем значение
+
+        raise TypeError(E_ENCODING_TYPE.format(t))                    # ... если пришли сюда, значит получен некорректный тип данных
+
+    def _set_data(self, data: TData) -> None:
+        """
+        Фактическая установка данных с соответствующими предварительными проверками и преобразованиями. Кроме строки принимается любой
+        объект, поддерживающий протокол буфера (bytes, bytearray, memoryview, mmap, массивы NumPy и т.п.): данные при этом не копируются
+
+        :param data: исходные данные (в том виде, как они поступили)
+        :return: ``None``
+        """
+
+        if type(data) is str:                                         # строку сначала нужно интерпретировать согласно кодировке
+            self._set_data_from_str(data)
+            return
+
+        try:
+            view = memoryview(data)                                   # представление данных без копирования
+        except TypeError:                                             # если объект не поддерживает протокол буфера, то...
+            t = type(data)                                            # ... получаем тип
+            raise TypeError(E_DATA_TYPE.format(t)) from None          # ... поднимаем исключение
+
+        self._set_data_from_buffer(view)                              # вызываем метод установки значения
+
+    def _set_data_from_str(self, data: str) -> None:
+        """
+        Фактическая установка данных из исходной строки с соответствующими предварительными проверками и преобразованиями
+
+        :param data: исходные данные (в виде строки)
+        :return: ``None``
+        """
+
+        setter = self._STR_SETTERS[self._encoding.idx]                # таблица строится один раз (см. _STR_SETTERS)
+        setter(self, data)                                            # noqa вызываем конкретный актуальный сеттер
+
+    def _set_data_from_str_as_utf8(self, data: str) -> None:
+        """
+        Установка значений из строки, которую следует интерпретировать как обычную человеко-читаемую строку в кодировке utf-8
+
+        :param data: исходная строка
+        :return: ``None``
+        """
+
+        self._set_data_from_bytes(data.encode('utf-8'))
+
+    def _set_data_from_str_as_text(self, data: str) -> None:
+        """
+        Установка значений из строки, которую следует закодировать в кодовую таблицу сообщения (cp1251, cp866, koi8-r)
+
+        :param data: исходная строка
+        :return: ``None``
+        """
+
+        try:
+            out = data.encode(TEXT_CODECS[self._encoding])
+        except UnicodeEncodeError as er:                              # в кодовой таблице есть далеко не все символы
+            raise ValueError(E_TEXT_STRING.format(self._encoding.nme, er)) from None
+
+        self._set_data_from_bytes(out)
+
+    def _set_data_from_str_as_bin(self, data: str) -> None:
+        """
+        Установка значений из строки, которую следует интерпретировать как бинарную строку (то есть, строку из нулей, единиц и пробелов
+        (все пробелы будут удалены))
+
+        :param data: исходная бинарная строка
+        :return: ``None``
+        """
+
+        try:
+            raw = data.translate(WHITESPACE_TABLE).encode('ascii')     # пробелы удаляются за один проход, ...
+        except UnicodeEncodeError:
+            raise ValueError(E_BIN_STRING) from None
+
+        if raw.translate(None, BIN_DIGITS) or len(raw) % BITS_IN_BYTE:  # ... а проверка алфавита - еще один проход на уровне C
+            raise ValueError(E_BIN_STRING)
+
+        out = bytearray(len(raw) // BITS_IN_BYTE)                      # результат выделяется один раз, ...
+        step = BIN_CHUNK // BITS_IN_BYTE
+
+        for i in range(0, len(out), step):                            # ... и заполняется широкими порциями (а не по битам)
+            chunk = raw[i * BITS_IN_BYTE:(i + step) * BITS_IN_BYTE]
+            out[i:i + step] = int(chunk, 2).to_bytes(len(chunk) // BITS_IN_BYTE, 'big')
+
+        self._set_data_from_bytearray(out)
+
+    def _set_data_from_str_as_hex(self, data: str) -> None:
+        """
+        Установка значений из строки, которую следует интерпретировать как шестнадцатеричную строку (то есть, строку из символов
+        шестнадцатеричного алфавита и пробелов (все пробелы будут удалены))
+
+        :param data: исходная шестнадцатеричная строка
+        :return: ``None``
+        """
+
+        try:
+            out = bytes.fromhex(data)                                 # пробелы между байтами fromhex пропускает сам, ...
+        except ValueError:
+            try:
+                out = bytes.fromhex(data.translate(WHITESPACE_TABLE))  # ... а пробелы внутри байтов удаляются за один проход
+            except ValueError as er:
+                raise ValueError(E_HEX_STRING.format(er)) from None
+
+        self._set_data_from_bytes(out)
+
+    _STR_SETTERS: Dict[int, Callable[['Message', str], None]] = {
+        Encoding.bnr.idx: _set_data_from_str_as_utf8,
+        Encoding.bin.idx: _set_data_from_str_as_bin,
+        Encoding.hex.idx: _set_data_from_str_as_hex,
+        Encoding.utf8.idx: _set_data_from_str_as_utf8,
+        Encoding.cp1251.idx: _set_data_from_str_as_text,
+        Encoding.cp866.idx: _set_data_from_str_as_text,
+        Encoding.koi8r.idx: _set_data_from_str_as_text,
+    }
+    """ Сеттеры строки по индексу кодировки (Encoding.*.idx): ключ - число, а не ENum, чтобы не вызывать его __hash__ на Python """
+
+    def _set_data_from_bytes(self, data: bytes) -> None:
+        """
+        Фактическая установка данных из последовательности байтов с соответствующими предварительными проверками и преобразованиями
+
+        :param data: исходные данные (в виде последовательности байтов)
+        :return: ``None``
+        """
+
+        self._set_data_from_buffer(memoryview(data))                  # байты неизменяемы, поэтому копировать их незачем
+
+    def _set_data_from_bytearray(self, data: bytearray) -> None:
+        """
+        Фактическая установка данных из собственного массива байтов сообщения (собранного при разборе строки или текста). Ссылок на
+        массив снаружи нет, поэтому данные неизменяемы и их хеши можно сохранять
+
+        :param data: исходные данные (в виде массива байтов)
+        :return: ``None``
+        """
+
+        self._set_data_from_buffer(memoryview(data), owned=True)      # сохраняем представление массива, а не его копию
+
+    def _set_data_from_buffer(self, view: memoryview, owned: bool = False) -> None:
+        """
+        Фактическая установка данных из представления буфера. Данные хранятся в виде одномерного представления байтов только для чтения,
+        поэтому даже для изменяемого источника сообщение само ничего в нем не изменит (для изменения см. mutable())
+
+        :param view: представление исходных данных (memoryview)
+        :param owned: источник данных принадлежит только сообщению (снаружи его не изменить, даже если он изменяемый)
+        :return: ``None``
+        """
+
+        if view.c_contiguous:                                         # непрерывный буфер можно просто представить как байты, ...
+            view = view.cast('B') if view.ndim != 1 or view.format != 'B' else view
+        else:                                                         # ... а разрывный (срезы с шагом и т.п.) придется скопировать
+            view = memoryview(view.tobytes())
+
+        ln = view.nbytes                                              # получаем фактическую длину массива в байтах
+        self._check_length(ln)                                        # проверяем, что длина допустима
+
+        if not ln:                                                    # пустые данные не должны удерживать источник (нечего хранить)
+            view = EMPTY_VIEW
+
+        self._data = view if view.readonly else view.toreadonly()     # все ок -> устанавливаем данные (только для чтения)
+        self._buffer = None                                           # собственной копии данных пока нет
+        self._state = None                                            # новые данные - новое сообщение: инкрементальный режим сброшен
+        self._backend = None
+        self._digests = {}                                            # ... и ранее вычисленные хеши больше не действительны
+        self._immutable = owned or self._is_immutable(view)
+
+    @staticmethod
+    def _is_immutable(view: memoryview) -> bool:
+        """
+        Проверка неизменяемости источника данных. Сообщение хранит представление источника без копирования, поэтому изменяемый источник
+        (bytearray, массив NumPy и т.п.) может измениться снаружи в любой момент, и сохранять хеш его данных нельзя
+
+        :param view: представление данных
+        :return: ``True``, если источник данных неизменяем (bytes, отображение файла только для чтения и т.п.)
+        """
+
+        source = view.obj
+
+        if source is None or type(source) is bytes:                   # самый частый случай проверяем без создания представления
+            return True
+
+        with memoryview(source) as probe:                             # представление сразу освобождаем (иначе не закрыть mmap)
+            return probe.readonly
+
+    @staticmethod
+    def _check_length(ln: int) -> None:
+        """
+        Проверка длины данных (в байтах) на предмет превышения максимально допустимой длины сообщения
+
+        :param ln: длина данных в байтах
+        :return: ``None``
+        """
+
+        if ln > MAX_LENGTH:                                           # если длина больше, чем нужно, ...
+            args = (str(ln), str(MAX_LENGTH))                         # ... формируем сообщение
+            raise ValueError(E_DATA_LENGTH.format(*args))             # ... поднимаем исключение
+
+    @classmethod
+    def from_file(cls, path: TPath, encoding: TEncoding = Encoding.bnr, method: TMethod = Method.sha256) -> 'Message':
+        """
+        Создание сообщения из файла, отображенного в память (mmap). Файл не читается в память процесса: данные остаются в единственном
+        экземпляре в страничном кеше ОС и хешируются прямо из отображения. Отображение освобождается методом close() (или по выходу из
+        блока with)
+
+        :param path: путь к файлу
+        :param encoding: кодировка (способ интерпретации данных файла)
+        :param method: метод хеширования
+        :return: сообщение
+        """
+
+        ln = os.stat(path).st_size                                    # длину проверяем еще до отображения файла
+        cls._check_length(ln)
+
+        message = cls(EMPTY_VIEW, encoding, method)                   # создаем пустое сообщение с проверенными кодировкой и методом
+
+        if not ln:                                                    # пустой файл отобразить в память нельзя (да и незачем)
+            return message
+
+        with open(path, 'rb') as file:                                # отображение остается валидным и после закрытия файла
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hasattr(mapping, 'madvise'):                               # подсказываем ОС, что читать будем последовательно
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+
+        message._set_data_from_buffer(memoryview(mapping))            # устанавливаем данные без копирования
+        message._mapping = mapping                                    # отображение освободим в close()
+        return message
+
+    @classmethod
+    def from_text(cls, text: TText, encoding: TEncoding = Encoding.utf8, method: TMethod = Method.sha256, keep: bool = True,
+                  backend: Optional[str] = None) -> 'Message':
+        """
+        Создание сообщения из текста, поступающего порциями (генератор строк, текстовый поток и т.п.). Каждая порция кодируется
+        инкрементальным кодировщиком (codecs) и сразу же попадает в сообщение, поэтому в памяти никогда не находятся одновременно весь
+        текст в виде строки и все данные в виде байтов
+
+        :param text: строка или последовательность порций-строк
+        :param encoding: кодировка текста (одна из TEXT_CODECS)
+        :param method: метод хеширования
+        :param keep: сохранять ли данные в сообщении (иначе порции сразу попадают в состояние хеширования, см. update())
+        :param backend: наименование реализации метода хеширования (только при keep=False)
+        :return: сообщение
+        """
+
+        message = cls(EMPTY_VIEW, encoding, method)                   # создаем пустое сообщение с проверенными кодировкой и методом
+        chunks = message._encode_text(text)
+
+        if not keep:                                                  # данные не храним: хешируем в постоянном объеме памяти
+            for chunk in chunks:
+                message.update(chunk, backend)
+            return message
+
+        data = bytearray()                                            # данные храним: накапливаем байты в собственном массиве
+        for chunk in chunks:
+            cls._check_length(len(data) + len(chunk))                 # длину проверяем до того, как массив вырастет
+            data += chunk
+
+        message._set_data_from_bytearray(data)
+        return message
+
+    @classmethod
+    def from_text_file(cls, path: TPath, encoding: TEncoding = Encoding.utf8, method: TMethod = Method.sha256, keep: bool = True,
+                       source: Optional[str] = None, chunk_size: int = CHUNK_SIZE, backend: Optional[str] = None) -> 'Message':
+        """
+        Создание сообщения из текстового файла: файл читается порциями и перекодируется в кодировку сообщения (см. from_text()).
+        Переводы строк сохраняются такими, как в файле
+
+        :param path: путь к файлу
+        :param encoding: кодировка сообщения (одна из TEXT_CODECS)
+        :param method: метод хеширования
+        :param keep: сохранять ли данные в сообщении (см. from_text())
+        :param source: кодировка файла (наименование для модуля codecs; по умолчанию совпадает с кодировкой сообщения)
+        :param chunk_size: размер порции в символах
+        :param backend: наименование реализации метода хеширования (только при keep=False)
+        :return: сообщение
+        """
+
+        codec = cls._text_codec(cls._find_encoding(encoding))        # кодировку проверяем еще до открытия файла
+
+        with open(path, encoding=source or codec, newline='') as file:
+            return cls.from_text(iter(lambda: file.read(chunk_size), ''), encoding, method, keep, backend)
+
+    @staticmethod
+    def _text_codec(encoding: Encoding) -> str:
+        """
+        Получение кодека (наименования для модуля codecs) текстовой кодировки
+
+        :param encoding: кодировка
+        :return: наименование кодека
+        """
+
+        codec = TEXT_CODECS.get(encoding)
+
+        if codec is None:                                             # bin и hex - не кодовые таблицы, а способы записи байтов
+            raise ValueError(E_TEXT_ENCODING.format(encoding.nme))
+
+        return codec
+
+    def _encode_text(self, text: TText) -> Iterator[bytes]:
+        """
+        Инкрементальное кодирование текста в кодировку сообщения
+
+        :param text: строка или последовательность порций-строк
+        :return: итератор порций байтов
+        """
+
+        encode = codecs.getincrementalencoder(self._text_codec(self._encoding))().encode
+        chunks = (text,) if isinstance(text, str) else text           # строка - это одна порция, а не последовательность символов
+
+        def generate() -> Iterator[bytes]:
+            for chunk in chunks:
+                if not isinstance(chunk, str):
+                    raise TypeError(E_TEXT_TYPE.format(type(chunk)))
+                try:
+                    out = encode(chunk)
+                except UnicodeEncodeError as er:
+                    raise ValueError(E_TEXT_STRING.format(self._encoding.nme, er)) from None
+                if out:
+                    yield out
+
+            if out := encode('', True):                               # остаток состояния кодировщика
+                yield out
+
+        return generate()
+
+    def close(self) -> None:
+        """
+        Освобождение отображения файла в память (для сообщений, созданных через from_file()). После закрытия данные сообщения пусты.
+        Если снаружи еще остаются представления данных (полученные, например, через свойство data, или копии сообщения), будет поднято
+        исключение BufferError, а сообщение останется открытым
+
+        :return: ``None``
+        """
+
+        if self._mapping is None:                                     # если отображения нет, то и освобождать нечего
+            return
+
+        view, self._data = self._data, EMPTY_VIEW                     # сообщение больше не ссылается на отображение
+        view.release()                                                # освобождаем собственное представление
+
+        try:
+            self._mapping.close()                                     # закрываем отображение
+        except BufferError:                                           # отображение еще используется (например, копией сообщения)
+            self._data = memoryview(self._mapping)                    # ... поэтому сообщение остается открытым
+            raise
+
+        self._mapping = None
+        self._digests = {}
+
+    def __enter__(self) -> 'Message':
+        """
+        Вход в блок with
+
+        :return: сообщение
+        """
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Выход из блока with (освобождение отображения файла в память)
+
+        :param args: сведения об исключении (не используются)
+        :return: ``None``
+        """
+
+        self.close()
+
+    def mutable(self) -> memoryview:
+        """
+        Получение изменяемого представления данных. Копирование при записи: при первом вызове данные копируются в собственный массив
+        байтов сообщения (источник, переданный при создании, никогда не изменяется), последующие вызовы копий не создают
+
+        :return: изменяемое представление данных сообщения
+        """
+
+        if self._buffer is None:                                      # если собственной копии еще нет, то...
+            self._buffer = memoryview(bytearray(self._data))          # ... копируем данные (единственный раз)
+            self._digests = {}                                        # ... данные теперь можно изменять, поэтому хеши не сохраняются
+            self._immutable = False
+            self._data = self._buffer.toreadonly()                    # ... и дальше читаем уже из копии
+
+        return self._buffer
+
+    @property
+    def data(self) -> memoryview:
+        """
+        Свойство "Данные" (представление исходной совокупности данных только для чтения, без копирования)
+
+        :return: данные
+        """
+
+        return self._data                                             # возвращаем хранимое значение
+
+    @property
+    def method(self) -> Method:
+        """
+        Свойство: "Метод"
+
+        :return: метод (хеширования)
+        """
+
+        return self._method                                           # возвращаем хранимое значение
+
+    @method.setter
+    def method(self, method: Method) -> None:
+        """
+        Сеттер свойства "Метод"
+
+        :param method: устанавливаемый метод хеширования (алгоритм)
+        :return: ``None``
+        """
+
+        if self._state is None:                                       # пока не начат инкрементальный режим, метод можно менять свободно
+            self._set_method(method)                                  # вызываем внутренний метод установки значения
+            return
+
+        previous = self._method                                       # в инкрементальном режиме данные не хранятся, поэтому...
+        self._set_method(method)
+        if self._method is not previous:                              # ... пересчитать хеш другим методом невозможно
+            self._method = previous
+            raise ValueError(E_STREAM_METHOD)
+
+    @property
+    def encoding(self) -> Encoding:
+        """
+        Свойство "Кодировка" (кодовая таблица или способ интерпретации данных)
+
+        :return: кодировка
+        """
+
+        return self._encoding                                         # возвращаем хранимое значение
+
+    @encoding.setter
+    def encoding(self, encoding) -> None:
+        """
+        Сеттер свойства "Кодировка"
+
+        :param encoding: устанавливаемая кодировка (способ интерпретации данных)
+        :return: ``None``
+        """
+        self._set_encoding(encoding)                                  # вызываем внутренний метод установки значения
+        self._digests = {}                                            # сброс сохраненных хешей вместе со сменой интерпретации данных
+
+    def hash(self, backend: Optional[str] = None) -> bytes:
+        """
+        Хеширование исходной совокупности данных установленным методом хеширования (в инкрементальном режиме - всех данных, полученных
+        сообщением, включая порции, переданные через update()). Хеш неизменяемых данных вычисляется один раз для каждого метода
+        хеширования и далее возвращается сохраненное значение (см. is_cached())
+
+        :param backend: наименование реализации метода хеширования (по умолчанию - самая быстрая из доступных, выбранная при импорте);
+            при явном указании реализации хеш всегда вычисляется заново
+        :return: хеш в виде последовательности байтов
+        """
+
+        if self._state is not None:                                   # в инкрементальном режиме хеш берем из текущего состояния
+            if backend is not None and backend != self._backend.nme:
+                raise ValueError(E_STREAM_BACKEND.format(self._backend.nme))
+            return self._state.digest()                               # состояние при этом не меняется (можно продолжать update())
+
+        if backend is None:                                           # сохраненный хеш (если есть) - за один поиск в словаре
+            digest = self._digests.get(self._method)
+            if digest is not None:
+                return digest
+
+        factory = get_backend(self._method, backend).factory          # выбираем реализацию метода хеширования
+        digest = factory(self._data).digest()                         # хешируем все данные за один вызов
+
+        if backend is None and self._immutable:                       # хеш изменяемых данных сохранять нельзя (он может устареть)
+            self._digests[self._method] = digest
+
+        return digest
+
+    def is_cached(self, method: Optional[TMethod] = None) -> bool:
+        """
+        Проверка наличия сохраненного хеша
+
+        :param method: метод хеширования (по умолчанию - установленный в сообщении)
+        :return: ``True``, если хеш данных этим методом уже вычислен и сохранен
+        """
+
+        method = self._method if method is None else self._find_method(method)
+        return self._state is None and method in self._digests
+
+    @staticmethod
+    def hash_many(buffers: Iterable[TData], method: TMethod = Method.sha256, out: str = OUT_LIST,
+                  backend: Optional[str] = None) -> Union[List[bytes], bytes, Any]:
+        """
+        Пакетное хеширование множества небольших сообщений (идентификаторы транзакций, листья дерева Меркла и т.п.) без создания
+        экземпляра Message на каждое: метод хеширования проверяется и реализация выбирается один раз на весь пакет
+
+        :param buffers: последовательность данных (каждый элемент - объект, поддерживающий протокол буфера)
+        :param method: метод хеширования
+        :param out: форма результата: OUT_LIST - список хешей, OUT_BYTES - все хеши подряд в одной последовательности байтов,
+            OUT_NUMPY - массив NumPy размерности (n, размер хеша)
+        :param backend: наименование реализации метода хеширования
+        :return: хеши в запрошенной форме
+        """
+
+        if out not in (OUT_LIST, OUT_BYTES, OUT_NUMPY):               # форму результата проверяем до хеширования
+            raise ValueError(E_OUT.format(out))
+
+        factory = get_backend(Message._find_method(method), backend).factory
+
+        digests: List[bytes] = []
+        append = digests.append
+
+        try:
+            for buffer in buffers:
+                try:
+                    append(factory(buffer).digest())
+                except BufferError:                                   # разрывный буфер (срез с шагом и т.п.) придется скопировать
+                    append(factory(memoryview(buffer).tobytes()).digest())
+        except TypeError as er:                                       # какой-то элемент не поддерживает протокол буфера
+            raise TypeError(E_BATCH_TYPE) from er
+
+        if out == OUT_LIST:
+            return digests
+
+        joined = b''.join(digests)                                    # один непрерывный блок вместо n объектов
+
+        if out == OUT_BYTES:
+            return joined
+
+        try:
+            import numpy                                              # NumPy - необязательная зависимость
+        except ImportError:
+            raise ImportError(E_NUMPY) from None
+
+        return numpy.frombuffer(joined, dtype=numpy.uint8).reshape(len(digests), factory().digest_size)
+
+    def update(self, chunk: TData, backend: Optional[str] = None) -> None:
+        """
+        Добавление очередной порции данных (инкрементальный режим). Порции не сохраняются: сообщение хранит только состояние хеширования,
+        поэтому потоки (сетевые, дисковые) хешируются в постоянном объеме памяти. Первый вызов переводит сообщение в инкрементальный
+        режим: в состояние хеширования сразу попадают данные, установленные при создании сообщения
+
+        :param chunk: очередная порция данных (любой объект, поддерживающий протокол буфера)
+        :param backend: наименование реализации метода хеширования (учитывается только при первом вызове)
+        :return: ``None``
+        """
+
+        try:
+            view = memoryview(chunk)                                  # представление порции без копирования
+        except TypeError:                                             # если объект не поддерживает протокол буфера, то...
+            t = type(chunk)                                           # ... получаем тип
+            raise TypeError(E_DATA_TYPE.format(t)) from None          # ... поднимаем исключение
+
+        if not view.c_contiguous:                                     # реализации хеширования принимают только непрерывные буферы
+            view = memoryview(view.tobytes())
+
+        ln = view.nbytes
+
+        if self._state is None:                                       # при первом вызове начинаем с данных самого сообщения
+            self._digests = {}
+            self._backend = get_backend(self._method, backend)
+            self._state = self._backend.factory(self._data)
+            self._length = self._data.nbytes
+
+        bits = (self._length + ln) * BITS_IN_BYTE                     # длина в битах, которая будет записана в слово размером LENGTH_SIZE
+        if bits > MAX_LENGTH_IN_BITS:                                 # если длина больше, чем нужно, ...
+            raise ValueError(E_STREAM_LENGTH.format(bits, MAX_LENGTH_IN_BITS))
+
+        self._state.update(view)                                      # добавляем порцию к состоянию хеширования
+        self._length += ln
+
+    def update_from(self, reader: Any, chunk_size: int = CHUNK_SIZE, backend: Optional[str] = None) -> int:
+        """
+        Добавление всех данных из потока (файла, сокета и т.п.) порциями фиксированного размера. Если поток поддерживает readinto(), все
+        порции читаются в один и тот же буфер (дополнительная память не выделяется)
+
+        :param reader: поток, открытый в двоичном режиме (объект с методом readinto() или read())
+        :param chunk_size: размер порции в байтах
+        :param backend: наименование реализации метода хеширования (учитывается только при первом обращении к update())
+        :return: количество добавленных байтов
+        """
+
+        total = 0
+
+        if hasattr(reader, 'readinto'):                               # читаем в переиспользуемый буфер
+            buffer = memoryview(bytearray(chunk_size))
+            while ln := reader.readinto(buffer):
+                self.update(buffer[:ln], backend)
+                total += ln
+            return total
+
+        while chunk := reader.read(chunk_size):                       # иначе - обычным чтением порциями
+            self.update(chunk, backend)
+            total += len(chunk)
+        return total
+
+    def hasher(self, backend: Optional[str] = None) -> THasher:
+        """
+        Получение объекта хеширования (с интерфейсом ``hashlib``), уже содержащего все данные сообщения. Объект независим от сообщения:
+        его можно копировать и дополнять (например, вычислить состояние после префикса один раз и затем хешировать только хвосты)
+
+        :param backend: наименование реализации метода хеширования (в инкрементальном режиме - только та, что выбрана при первом update())
+        :return: объект хеширования
+        """
+
+        if self._state is not None:                                   # в инкрементальном режиме отдаем копию текущего состояния
+            if backend is not None and backend != self._backend.nme:
+                raise ValueError(E_STREAM_BACKEND.format(self._backend.nme))
+            return self._state.copy()
+
+        return get_backend(self._method, backend).factory(self._data)
+
+    def copy(self) -> 'Message':
+        """
+        Получение копии сообщения вместе с промежуточным состоянием хеширования. Позволяет один раз хешировать общий префикс (например,
+        заголовок блока без nonce) и затем продолжать хеширование нескольких копий независимо. Неизменяемые данные копией разделяются
+        (в т.ч. отображение файла: исходное сообщение нельзя закрыть, пока жива копия), изменяемые - копируются
+
+        :return: независимая копия сообщения
+        """
+
+        other = self.__class__.__new__(self.__class__)                # создаем экземпляр без повторных проверок
+        other.__dict__.update(self.__dict__)                          # переносим все значения как есть, ...
+        other._digests = dict(self._digests)                          # ... кроме сохраненных хешей (у копии они свои), ...
+
+        if self._buffer is not None:                                  # ... собственной изменяемой копии данных, ...
+            other._data = memoryview(self._data.tobytes())
+            other._buffer = None
+            other._immutable = True
+        else:                                                         # ... представления данных (у копии оно свое, и пока оно
+            other._data = self._data[:]                               # живо, отображение файла закрыть нельзя), ...
+
+        if self._state is not None:                                   # ... состояния хеширования ...
+            other._state = self._state.copy()
+
+        other._mapping = None                                         # ... и отображения файла (его закрывает только владелец)
+        return other
+
+    @property
+    def length(self) -> int:
+        """
+        Свойство "Длина" (общая длина хешируемых данных в байтах, в т.ч. всех порций, переданных в инкрементальном режиме)
+
+        :return: длина в байтах
+        """
+
+        return self._length if self._state is not None else self._data.nbytes
+
+    def digest(self, backend: Optional[str] = None) -> bytes:
+        """
+        Получение хеша в виде последовательности байтов (синоним hash(), совместимый по наименованию с ``hashlib``)
+
+        :param backend: наименование реализации метода хеширования
+        :return: хеш в виде последовательности байтов
+        """
+
+        return self.hash(backend)
+
+    def hexdigest(self, backend: Optional[str] = None) -> str:
+        """
+        Получение хеша в виде шестнадцатеричной строки
+
+        :param backend: наименование реализации метода хеширования
+        :return: хеш в виде шестнадцатеричной строки
+        """
+
+        return self.hash(backend).hex()
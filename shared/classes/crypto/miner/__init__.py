@@ -0,0 +1,4 @@
+from .miner import Miner, MiningResult, bits_to_target, target_to_bits
+from .pool import MinerPool, PoolResult
+from ._constants import *
+from ._errors import *
@@ -0,0 +1,23 @@
+"""
+**Константы майнера**
+
+Константы, используемые при поиске nonce (доказательство выполнения работы, Proof of Work)
+"""
+
+NONCE_SIZE = 4
+""" Размер nonce в байтах (nonce дописывается в конец заголовка в порядке little-endian) """
+
+NONCE_LIMIT = 1 << (NONCE_SIZE * 8)
+""" Граница пространства nonce (не включается) """
+
+BATCH_SIZE = 16_384
+""" Количество nonce, перебираемых за одну пачку (между пачками проверяются ограничения по времени и признак остановки) """
+
+MAX_TARGET = (1 << 256) - 1
+""" Максимально возможная цель (любой хеш ей удовлетворяет) """
+
+COMPACT_SIGN = 0x00800000
+""" Бит знака мантиссы в компактном представлении цели (bits) """
+
+COMPACT_MANTISSA = 0x007FFFFF
+""" Маска мантиссы в компактном представлении цели (bits) """
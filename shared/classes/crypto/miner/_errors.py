@@ -0,0 +1,28 @@
+"""
+**Сообщения об ошибках**
+
+Сообщения об ошибках, используемые классом ``Miner``
+"""
+
+E_PREFIX_TYPE = ('🚨 Ошибочный тип данных {} при указании неизменной части заголовка. Ожидается объект, поддерживающий протокол буфера '
+                 '(последовательность или массив байтов, memoryview и т.п.)')
+""" Сообщение об ошибке при получении некорректного типа данных в качестве неизменной части заголовка """
+
+E_BITS = '🚨 Ошибочное компактное представление цели {}. Цель должна быть положительной и не превышать 256 бит'
+""" Сообщение об ошибке при получении некорректного компактного представления цели (bits) """
+
+E_TARGET = '🚨 Ошибочная цель {}. Цель должна быть положительной и не превышать 256 бит'
+""" Сообщение об ошибке при получении некорректной цели """
+
+E_NONCE_RANGE = '🚨 Ошибочный диапазон nonce [{}, {}). Диапазон должен лежать в пределах [0, {}]'
+""" Сообщение об ошибке при получении некорректного диапазона перебора nonce """
+
+E_BATCH = '🚨 Ошибочный размер пачки перебора {}. Размер пачки должен быть не меньше 1'
+""" Сообщение об ошибке при получении некорректного размера пачки перебора nonce """
+
+E_EXTRA_NONCE_OFFSET = '🚨 Ошибочное смещение extra-nonce {}. Смещение должно лежать в пределах [0, {}]'
+""" Сообщение об ошибке при получении смещения extra-nonce, выходящего за пределы шаблона заголовка """
+
+E_EXTRA_NONCE_RANGE = ('🚨 Ошибочный диапазон extra-nonce [{}, {}). Без смещения extra-nonce (extra_nonce_offset) в шаблон ничего не '
+                       'записывается, поэтому диапазон может содержать только одно значение')
+""" Сообщение об ошибке при получении диапазона extra-nonce из нескольких значений без смещения extra-nonce """
@@ -0,0 +1,223 @@
+"""
+**Майнер (поиск nonce, Proof of Work)**
+
+Перебор nonce, при котором двойной хеш заголовка (неизменная часть + nonce) должен оказаться не больше цели, заданной в компактном
+представлении (bits). Состояние хеширования после неизменной части заголовка (midstate) вычисляется один раз, поэтому на каждый nonce
+сжимается только последний блок заголовка (и один блок второго хеширования)
+"""
+
+from dataclasses import dataclass
+from struct import Struct
+from time import perf_counter
+from typing import Callable, Optional
+
+from shared.classes.crypto.message import Encoding, Message, Method, TData, TMethod, find_method, get_backend
+
+from ._constants import *
+from ._errors import *
+
+_NONCE = Struct('<I')
+""" Упаковка nonce (little-endian, NONCE_SIZE байтов) """
+
+
+def bits_to_target(bits: int) -> int:
+    """
+    Преобразование компактного представления цели (bits) в саму цель. Старший байт - порядок (количество байтов цели), остальные три -
+    мантисса (старшие байты цели)
+
+    :param bits: компактное представление цели
+    :return: цель
+    """
+
+    if not 0 <= bits < 1 << 32 or bits & COMPACT_SIGN:                # отрицательная цель смысла не имеет
+        raise ValueError(E_BITS.format(hex(bits)))
+
+    exponent = bits >> 24
+    mantissa = bits & COMPACT_MANTISSA
+
+    if exponent <= 3:
+        target = mantissa >> 8 * (3 - exponent)
+    else:
+        target = mantissa << 8 * (exponent - 3)
+
+    if not 0 < target <= MAX_TARGET:
+        raise ValueError(E_BITS.format(hex(bits)))
+
+    return target
+
+
+def target_to_bits(target: int) -> int:
+    """
+    Преобразование цели в компактное представление (bits). Младшие байты цели, не попавшие в мантиссу, отбрасываются
+
+    :param target: цель
+    :return: компактное представление цели
+    """
+
+    if not 0 < target <= MAX_TARGET:
+        raise ValueError(E_TARGET.format(hex(target)))
+
+    size = (target.bit_length() + 7) // 8                             # количество значимых байтов цели
+
+    if size <= 3:
+        mantissa = target << 8 * (3 - size)
+    else:
+        mantissa = target >> 8 * (size - 3)
+
+    if mantissa & COMPACT_SIGN:                                       # старший бит мантиссы занят знаком: сдвигаем на байт
+        mantissa >>= 8
+        size += 1
+
+    return size << 24 | mantissa
+
+
+@dataclass
+class MiningResult:
+    """ Результат поиска nonce """
+
+    nonce: Optional[int]                                              # найденный nonce (None, если не найден)
+    digest: Optional[bytes]                                           # двойной хеш заголовка с найденным nonce
+    hashes: int                                                       # количество проверенных nonce
+    elapsed: float                                                    # затраченное время в секундах
+
+    @property
+    def found(self) -> bool:
+        """
+        Свойство "Найден ли nonce"
+
+        :return: ``True``, если nonce найден
+        """
+
+        return self.nonce is not None
+
+    @property
+    def hashrate(self) -> float:
+        """
+        Свойство "Скорость перебора" (количество хешей в секунду)
+
+        :return: хешей в секунду
+        """
+
+        return self.hashes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Miner:
+    """ Перебор nonce для неизменной части заголовка с сохраненным состоянием хеширования (midstate) """
+
+    def __init__(self, prefix: TData, bits: int, method: TMethod = Method.sha256, backend: Optional[str] = None,
+                 batch: int = BATCH_SIZE) -> None:
+        """
+        Метод создания экземпляра класса: неизменная часть заголовка хешируется один раз
+
+        :param prefix: неизменная часть заголовка (все, что предшествует nonce)
+        :param bits: компактное представление цели
+        :param method: метод хеширования (ENum или строка)
+        :param backend: наименование реализации метода хеширования (по умолчанию - самая быстрая из доступных)
+        :param batch: количество nonce в одной пачке перебора
+        :return: ``None``
+        """
+
+        try:
+            prefix = memoryview(prefix)                               # представление неизменной части без копирования
+        except TypeError:
+            raise TypeError(E_PREFIX_TYPE.format(type(prefix))) from None
+
+        if batch < 1:                                                 # иначе перебор упадет посередине (0) или ничего не переберет (< 0)
+            raise ValueError(E_BATCH.format(batch))
+
+        method = find_method(method)                                  # строка ищется один раз (как при создании сообщения)
+        self._bits = bits
+        self._target = bits_to_target(bits)                           # цель вычисляем один раз
+        self._batch = batch
+        self._factory = get_backend(method, backend).factory          # для второго хеширования
+        self._midstate = Message(prefix, Encoding.bnr, method).hasher(backend)
+
+    @property
+    def bits(self) -> int:
+        """
+        Свойство "Компактное представление цели"
+
+        :return: bits
+        """
+
+        return self._bits
+
+    @property
+    def target(self) -> int:
+        """
+        Свойство "Цель"
+
+        :return: цель
+        """
+
+        return self._target
+
+    def hash(self, nonce: int) -> bytes:
+        """
+        Двойной хеш заголовка с указанным nonce
+
+        :param nonce: nonce
+        :return: двойной хеш
+        """
+
+        state = self._midstate.copy()                                 # начинаем с сохраненного состояния, ...
+        state.update(_NONCE.pack(nonce))                              # ... дописываем только nonce
+        return self._factory(state.digest()).digest()
+
+    def check(self, nonce: int) -> bool:
+        """
+        Проверка, удовлетворяет ли nonce цели
+
+        :param nonce: nonce
+        :return: ``True``, если двойной хеш (как число little-endian) не больше цели
+        """
+
+        return int.from_bytes(self.hash(nonce), 'little') <= self._target
+
+    def mine(self, start: int = 0, stop: int = NONCE_LIMIT, timeout: Optional[float] = None,
+             should_stop: Optional[Callable[[], bool]] = None) -> MiningResult:
+        """
+        Перебор nonce в диапазоне [start, stop) пачками. Ограничение по времени и признак остановки проверяются только между пачками,
+        чтобы не замедлять сам перебор
+
+        :param start: первый nonce
+        :param stop: граница диапазона (не включается)
+        :param timeout: ограничение по времени в секундах
+        :param should_stop: функция, возвращающая ``True``, если перебор нужно прекратить (например, nonce найден другим процессом)
+        :return: результат поиска
+        """
+
+        if not 0 <= start <= stop <= NONCE_LIMIT:
+            raise ValueError(E_NONCE_RANGE.format(start, stop, NONCE_LIMIT))
+
+        copy = self._midstate.copy                                    # связываем все, что нужно в цикле, с локальными именами
+        factory = self._factory
+        pack = _NONCE.pack
+        from_bytes = int.from_bytes
+        target = self._target
+
+        started = perf_counter()
+        deadline = None if timeout is None else started + timeout
+        hashes = 0
+
+        for first in range(start, stop, self._batch):
+            last = min(first + self._batch, stop)
+
+            for nonce in range(first, last):
+                state = copy()
+                state.update(pack(nonce))
+                digest = factory(state.digest()).digest()
+
+                if from_bytes(digest, 'little') <= target:            # nonce найден
+                    hashes += nonce - first + 1
+                    return MiningResult(nonce, digest, hashes, perf_counter() - started)
+
+            hashes += last - first
+
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+            if should_stop is not None and should_stop():
+                break
+
+        return MiningResult(None, None, hashes, perf_counter() - started)
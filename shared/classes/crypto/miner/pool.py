@@ -0,0 +1,184 @@
+"""
+**Многопроцессный майнер**
+
+Пространство nonce делится на непрерывные диапазоны по числу процессов, а пространство extra-nonce (дополнительный nonce, записываемый
+внутрь неизменной части заголовка) перебирается всеми процессами синхронно. Шаблон заголовка передается процессам через разделяемую
+память, а как только один из процессов находит решение, остальные прекращают перебор (между пачками nonce)
+"""
+
+import multiprocessing
+import os
+from dataclasses import dataclass
+from queue import Empty
+from struct import Struct
+from time import perf_counter
+from typing import Any, Optional
+
+from shared.classes.crypto.message import Method, TData, TMethod, find_method
+
+from ._constants import *
+from ._errors import *
+from .miner import Miner, MiningResult
+
+_EXTRA_NONCE = Struct('<I')
+""" Упаковка extra-nonce (little-endian, NONCE_SIZE байтов) """
+
+POLL_INTERVAL = 0.05
+""" Интервал (в секундах), с которым основной процесс проверяет результаты и состояние процессов """
+
+
+@dataclass
+class PoolResult(MiningResult):
+    """ Результат поиска nonce несколькими процессами """
+
+    extra_nonce: Optional[int]                                        # extra-nonce, при котором найден nonce
+    workers: int                                                      # количество процессов
+
+
+def _work(template: Any, bits: int, method: Method, index: int, workers: int, extra_start: int, extra_stop: int,
+          offset: Optional[int], stop: Any, results: Any, counters: Any) -> None:
+    """
+    Процесс перебора: свой диапазон nonce для каждого extra-nonce по очереди
+
+    :param template: шаблон заголовка в разделяемой памяти
+    :param bits: компактное представление цели
+    :param method: метод хеширования
+    :param index: номер процесса
+    :param workers: количество процессов
+    :param extra_start: первый extra-nonce
+    :param extra_stop: граница диапазона extra-nonce (не включается)
+    :param offset: смещение extra-nonce внутри шаблона (None - extra-nonce не используется)
+    :param stop: признак остановки (общий для всех процессов)
+    :param results: очередь найденных решений
+    :param counters: счетчики проверенных nonce (по одному на процесс)
+    :return: ``None``
+    """
+
+    prefix = bytearray(template)                                      # собственная копия шаблона (в нее пишется extra-nonce)
+    start = NONCE_LIMIT * index // workers                            # свой непрерывный диапазон nonce
+    stop_nonce = NONCE_LIMIT * (index + 1) // workers
+
+    for extra_nonce in range(extra_start, extra_stop):
+        if stop.is_set():
+            return
+
+        if offset is not None:
+            _EXTRA_NONCE.pack_into(prefix, offset, extra_nonce)
+
+        result = Miner(prefix, bits, method).mine(start, stop_nonce, should_stop=stop.is_set)
+        counters[index] += result.hashes
+
+        if result.found:
+            results.put((extra_nonce, result.nonce, result.digest))
+            stop.set()                                                # остальные процессы прекратят перебор после текущей пачки
+            return
+
+
+class MinerPool:
+    """ Перебор nonce (и extra-nonce) несколькими процессами """
+
+    def __init__(self, prefix: TData, bits: int, method: TMethod = Method.sha256, workers: Optional[int] = None,
+                 extra_nonce_offset: Optional[int] = None) -> None:
+        """
+        Метод создания экземпляра класса
+
+        :param prefix: шаблон неизменной части заголовка (все, что предшествует nonce)
+        :param bits: компактное представление цели
+        :param method: метод хеширования (ENum или строка)
+        :param workers: количество процессов (по умолчанию - по числу процессоров)
+        :param extra_nonce_offset: смещение внутри шаблона, по которому записывается extra-nonce (None - extra-nonce не используется)
+        :return: ``None``
+        """
+
+        try:
+            prefix = memoryview(prefix).cast('B')
+        except TypeError:
+            raise TypeError(E_PREFIX_TYPE.format(type(prefix))) from None
+
+        if extra_nonce_offset is not None and not 0 <= extra_nonce_offset <= prefix.nbytes - NONCE_SIZE:
+            raise ValueError(E_EXTRA_NONCE_OFFSET.format(extra_nonce_offset, prefix.nbytes - NONCE_SIZE))
+
+        Miner(prefix, bits, method)                                   # проверяем цель и метод сразу, а не в дочерних процессах
+
+        self._prefix = bytes(prefix)
+        self._bits = bits
+        self._method = find_method(method)                            # в дочерние процессы передается ENum
+        self._workers = workers or os.cpu_count() or 1
+        self._offset = extra_nonce_offset
+
+    def mine(self, extra_start: int = 0, extra_stop: Optional[int] = None, timeout: Optional[float] = None) -> PoolResult:
+        """
+        Перебор всего пространства nonce для каждого extra-nonce из диапазона [extra_start, extra_stop)
+
+        :param extra_start: первый extra-nonce
+        :param extra_stop: граница диапазона extra-nonce (по умолчанию - все пространство, если extra-nonce используется, иначе -
+            единственное значение; без смещения extra-nonce диапазон из нескольких значений недопустим)
+        :param timeout: ограничение по времени в секундах
+        :return: результат поиска
+        """
+
+        if extra_stop is None:
+            extra_stop = NONCE_LIMIT if self._offset is not None else extra_start + 1
+
+        if not 0 <= extra_start <= extra_stop <= NONCE_LIMIT:
+            raise ValueError(E_NONCE_RANGE.format(extra_start, extra_stop, NONCE_LIMIT))
+
+        if self._offset is None and extra_stop > extra_start + 1:     # иначе каждый процесс повторял бы одно и то же пространство nonce
+            raise ValueError(E_EXTRA_NONCE_RANGE.format(extra_start, extra_stop))
+
+        context = multiprocessing.get_context()
+        template = context.Array('B', self._prefix, lock=False)       # шаблон заголовка в разделяемой памяти
+        counters = context.Array('Q', self._workers, lock=False)      # каждый процесс пишет только в свой счетчик
+        stop = context.Event()
+        results = context.Queue()
+
+        processes = [
+            context.Process(target=_work, daemon=True, args=(template, self._bits, self._method, index, self._workers, extra_start,
+                                                             extra_stop, self._offset, stop, results, counters))
+            for index in range(self._workers)
+        ]
+
+        started = perf_counter()
+        deadline = None if timeout is None else started + timeout
+
+        for process in processes:
+            process.start()
+
+        found = None
+        try:
+            while found is None:
+                try:
+                    found = results.get(timeout=POLL_INTERVAL)
+                except Empty:
+                    if not any(process.is_alive() for process in processes):
+                        found = self._poll(results)                   # решение могло попасть в очередь перед самым завершением
+                        break
+                    if deadline is not None and perf_counter() >= deadline:
+                        break
+        finally:
+            stop.set()                                                # отменяем перебор во всех процессах
+            for process in processes:
+                process.join()
+
+        elapsed = perf_counter() - started
+        hashes = sum(counters)
+
+        if found is None:
+            return PoolResult(None, None, hashes, elapsed, None, self._workers)
+
+        extra_nonce, nonce, digest = found
+        return PoolResult(nonce, digest, hashes, elapsed, extra_nonce if self._offset is not None else None, self._workers)
+
+    @staticmethod
+    def _poll(results: Any) -> Optional[tuple]:
+        """
+        Неблокирующее получение решения из очереди
+
+        :param results: очередь найденных решений
+        :return: решение или ``None``
+        """
+
+        try:
+            return results.get(timeout=POLL_INTERVAL)
+        except Empty:
+            return None
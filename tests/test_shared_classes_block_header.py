@@ -0,0 +1,107 @@
+from hashlib import sha256
+
+from pytest import raises as _
+
+from shared.classes.block.header.header import *
+from shared.classes.crypto.miner import Miner
+
+EASY_BITS = 0x1F00FFFF                                                # простая цель: подходит примерно каждый 65 536-й хеш
+PREV_HASH = bytes(range(32))
+MERKLE_ROOT = bytes(range(32, 64))
+
+
+def hash2(data: bytes) -> bytes:
+    return sha256(sha256(data).digest()).digest()
+
+
+def testp_header():
+    # поля упаковываются в 80 байтов по раскладке HEADER и читаются обратно
+    header = BlockHeader.from_fields(2, PREV_HASH, MERKLE_ROOT, 1_700_000_000, EASY_BITS, 7)
+    data = bytes(header)
+    assert len(data) == len(header) == HEADER_SIZE == 80
+    assert data == HEADER.pack(2, PREV_HASH, MERKLE_ROOT, 1_700_000_000, EASY_BITS, 7)
+    assert header.fields() == (2, PREV_HASH, MERKLE_ROOT, 1_700_000_000, EASY_BITS, 7)
+    assert (header.version, header.time, header.bits, header.nonce) == (2, 1_700_000_000, EASY_BITS, 7)
+    assert header.prev_hash == PREV_HASH and header.merkle_root == MERKLE_ROOT
+    assert header.prefix == data[:76]                                 # неизменная при переборе nonce часть заголовка
+
+    # хеш заголовка - двойной sha-256 его данных (в том числе эталонной реализацией)
+    assert header.hash() == header.hash('python') == hash2(data)
+
+    # источник данных не изменяется: nonce записывается в собственную копию заголовка
+    source = bytearray(data)
+    header = BlockHeader(source)
+    assert header.data.obj is source                                  # без копирования
+    header.nonce = 8
+    assert header.nonce == 8 and source == data
+    buffer = header._buffer
+    header.nonce = 9
+    assert header._buffer is buffer                                   # повторная запись - прямо в тот же буфер
+
+    # майнер перебирает nonce для неизменной части заголовка, а найденный nonce записывается в заголовок
+    result = header.mine()
+    assert result.found and header.nonce == result.nonce
+    assert header.check() and header.hash() == result.digest
+    assert Miner(data[:76], EASY_BITS).hash(result.nonce) == result.digest
+
+
+def testn_header():
+    # данные должны поддерживать протокол буфера (несоответствие типов) и иметь длину 80 байтов (ошибочное значение)
+    with _(TypeError):
+        BlockHeader('заголовок')                                      # noqa тестируем попытку передать строку
+    with _(ValueError):
+        BlockHeader(bytes(79))
+
+    header = BlockHeader(bytes(80))
+
+    # хеши - ровно 32 байта
+    with _(ValueError):
+        header.prev_hash = bytes(31)
+    with _(ValueError):
+        BlockHeader.from_fields(1, PREV_HASH, bytes(33), 0, EASY_BITS)
+
+    # числовые поля - целые числа в пределах [0, 2^32)
+    with _(ValueError):
+        header.nonce = 1 << 32
+    with _(ValueError):
+        header.time = -1
+    with _(TypeError):
+        header.bits = 1.5                                             # noqa тестируем попытку записать вещественное число
+
+    assert header._buffer is None                                     # при ошибке данные не копировались
+
+    # заголовок изменяем и потому не хешируется (ключ - bytes(header))
+    with _(TypeError):
+        {header}                                                      # noqa тестируем попытку добавить заголовок в множество
+    assert bytes(header) in {bytes(BlockHeader(bytes(80)))}
+
+
+def testp_parse_many():
+    # последовательность заголовков разбирается на представления общего буфера без копирования
+    headers = [BlockHeader.from_fields(1, PREV_HASH, MERKLE_ROOT, i, EASY_BITS, i) for i in range(100)]
+    data = b''.join(bytes(header) for header in headers)
+    parsed = BlockHeader.parse_many(data)
+    assert parsed == headers
+    assert all(header.data.obj is data for header in parsed)
+    assert [header.nonce for header in parsed] == list(range(100))
+
+    # пакетное хеширование дает те же хеши без создания заголовков
+    assert BlockHeader.hash_many(data) == [header.hash() for header in headers]
+    assert BlockHeader.hash_many(memoryview(data)[:160], 'bytes') == headers[0].hash() + headers[1].hash()
+    assert BlockHeader.parse_many(b'') == [] and BlockHeader.hash_many(b'') == []
+
+    # изменение разобранного заголовка не затрагивает общий буфер
+    parsed[5].nonce = 0
+    assert BlockHeader.parse_many(data)[5].nonce == 5
+
+
+def testn_parse_many():
+    # длина последовательности должна быть кратна размеру заголовка (ошибочное значение)
+    with _(ValueError):
+        BlockHeader.parse_many(bytes(81))
+    with _(ValueError):
+        BlockHeader.hash_many(bytes(159))
+
+    # последовательность должна поддерживать протокол буфера (несоответствие типов)
+    with _(TypeError):
+        BlockHeader.parse_many([bytes(80)])                           # noqa тестируем попытку передать список
@@ -4,8 +4,16 @@
 Тестирование Валидатора в различных условиях
 """
 
+import time
+from asyncio import run, sleep
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import wraps
+
 from pytest import raises as _
 
+from shared.classes.basic.abstractions.validator.async_validator import (
+    AsyncValidator
+)
 from shared.classes.basic.abstractions.validator.validator import *
 
 
@@ -303,12 +311,704 @@ def testn_validation_via_decorator_in_class() -> None:
         def __init__(self):
             self._value = None
 
-    # 🚩 Выпадает не ошибка "Объект не найден", а "Непредвиденная ошибка".
-    # Это не очень-то правильно, но пока работает. Это происходит потому,
-    # что когда у нас отправляется единственный аргумент, то мы считаем,
-    # что это и есть объект, подлежащий валидации. А далее уже на этапе самой
-    # валидации выпадает "Непредвиденная ошибка", поскольку пытаемся
-    # проверить self, а не реальный объект (реального объекта тут нет).
+    # Проверяемый параметр определяется по сигнатуре (self пропускается), а
+    # других параметров у метода нет. Поэтому должна появиться ошибка NO_OBJ
 
-    with _(Exception):
+    with _(ValueError):
         u_name = UserName()
+
+
+def testp_validator_registry() -> None:
+    """
+    **Реестр проверенных методов**
+
+    1. Результаты проверки методов сохраняются по объекту кода, и повторное
+       создание валидатора их использует.
+    2. Методы без исходного кода (созданные через exec) проверяются по
+       байт-коду.
+    3. Методы, определенные внутри класса (с отступом), тоже проверяются.
+    4. В доверенном режиме поиск raise не выполняется.
+
+    :return: ``None``
+    """
+    from shared.classes.basic.abstractions.validator import _registry
+
+    Validator([real_length_validation])
+    key = (real_length_validation.__code__, False)
+    assert _registry._methods[key] is None                            # noqa
+    # из реестра
+    Validator([real_length_validation])
+
+    namespace = {'Any': Any, 'VParams': VParams,
+                 'ValidationError': ValidationError}
+    exec(
+        'def no_source(obj: Any, params: VParams) -> None:\n'
+        '    if obj is None:\n'
+        '        raise ValidationError("пусто")\n',
+        namespace
+    )
+    validator = Validator([namespace['no_source']])
+    with _(ValidationError):
+        validator.validate(None)
+
+    class Checks:
+        @staticmethod
+        def indented(obj: Any, params: VParams) -> None:              # noqa
+            if obj is None:
+                raise ValidationError('пусто')
+
+    Validator([Checks.indented])
+
+    Validator([method_without_raise], trusted=True)
+
+
+def testn_validator_registry() -> None:
+    """
+    **Реестр проверенных методов (некорректные методы)**
+
+    Метод без исходного кода и без raise отклоняется (по байт-коду), а
+    отрицательный результат проверки тоже сохраняется.
+
+    :return: ``None``
+    """
+    namespace = {'Any': Any, 'VParams': VParams}
+    exec('def no_raise(obj: Any, params: VParams) -> None:\n    pass\n',
+         namespace)
+
+    with _(TypeError):
+        Validator([namespace['no_raise']])
+
+    with _(TypeError):
+        # из реестра
+        Validator([namespace['no_raise']])
+
+    with _(TypeError):
+        # сигнатура проверяется и в доверенном режиме
+        Validator([method_with_invalid_param], trusted=True)
+
+
+def wrapped(method: Callable) -> Callable:
+    """
+    **Декоратор проверок (functools.wraps)**
+
+    :param method: метод проверки
+    :return: обертка
+    """
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return method(*args, **kwargs)
+    return wrapper
+
+
+def testn_validator_registry_wrapped() -> None:
+    """
+    **Реестр проверенных методов (проверки за одним декоратором)**
+
+    Проверки за одним и тем же декоратором делят объект кода обертки, но
+    результат проверки каждой из них свой (ключ - код исходной функции).
+
+    :return: ``None``
+    """
+    @wrapped
+    def good(obj: Any, params: VParams) -> None:                      # noqa
+        if obj is None:
+            raise ValidationError('пусто')
+
+    @wrapped
+    def no_raise(obj: Any, params: VParams) -> None:                  # noqa
+        pass
+
+    @wrapped
+    def typed(obj: int, params: VParams) -> str:                      # noqa
+        return ''
+
+    Validator([good])
+
+    with _(TypeError):
+        Validator([no_raise])
+
+    with _(TypeError):
+        Validator([typed])
+
+
+def testp_validator_compiled() -> None:
+    """
+    **Скомпилированный конвейер проверок**
+
+    1. Сообщение об ошибке содержит имя класса исключения, а исходное
+       исключение сохраняется в ``__cause__``.
+    2. Неожиданное исключение тоже сохраняется в ``__cause__``.
+    3. С обработчиком выполняются все проверки.
+
+    :return: ``None``
+    """
+    class LengthError(ValidationError):
+        ...
+
+    def too_long(obj: Any, params: VParams) -> None:
+        if len(obj) > params.get('limit', 3):
+            raise LengthError('длинно')
+
+    def broken(obj: Any, params: VParams) -> None:
+        if obj:
+            raise ValidationError('не пусто')
+        return 1 // len(obj)                                          # noqa
+
+    with _(ValidationError) as info:
+        Validator([too_long]).validate('abcd')
+    assert 'LengthError' in str(info.value)                           # noqa
+    assert isinstance(info.value.__cause__, LengthError)              # noqa
+
+    assert Validator([too_long]).validate('abcd', limit=4) == 'abcd'  # noqa
+
+    with _(Exception) as info:
+        Validator([broken]).validate('')
+    assert isinstance(info.value.__cause__, ZeroDivisionError)        # noqa
+
+    errors = []
+
+    def collect(e: Exception, obj: Any) -> None:
+        errors.append(e)
+
+    Validator([too_long, broken], collect).validate('abcd')
+    assert [type(e) for e in errors] == [LengthError, ValidationError]  # noqa
+
+
+def not_empty(obj: Any, params: VParams) -> None:                     # noqa
+    if not obj:
+        raise ValidationError('пусто')
+
+
+def not_long(obj: Any, params: VParams) -> None:                      # noqa
+    if len(obj) > params.get('limit', 3):
+        raise ValidationError('длинно')
+
+
+def testp_validate_many() -> None:
+    """
+    **Пакетная валидация**
+
+    1. Неудачи всех методов на всех объектах собираются в отчет.
+    2. Обработчик не вызывается.
+    3. В режиме fail_fast валидация прекращается на первой неудаче.
+
+    :return: ``None``
+    """
+    calls = []
+
+    def handler(e: Exception, obj: Any) -> None:
+        calls.append(e)
+
+    validator = Validator([not_empty, not_long], handler)
+    report = validator.validate_many(iter(['ab', '', 'abcd', 'abc']))
+
+    assert not report and report.total == 4                           # noqa
+    assert report.invalid == [1, 2]                                   # noqa
+    assert [(f.index, f.method, f.message) for f in report.failures] == [
+        (1, not_empty, 'пусто'), (2, not_long, 'длинно')
+    ]
+    assert report.failures[0].name == 'not_empty'                     # noqa
+    assert not calls                                                  # noqa
+
+    assert validator.validate_many(['abcd'], limit=4).ok              # noqa
+    assert validator.validate_many([]).ok                             # noqa
+
+    report = validator.validate_many(['', 'abcd', ''], fail_fast=True)
+    assert report.total == 1 and report.invalid == [0]                # noqa
+
+
+def testn_validate_many() -> None:
+    """
+    **Пакетная валидация (непредвиденные ошибки)**
+
+    Непредвиденное исключение не прерывает пакет, а попадает в отчет.
+
+    :return: ``None``
+    """
+    report = Validator([not_long]).validate_many(['abcd', None, 'a'])
+
+    assert report.total == 3 and report.invalid == [0, 1]             # noqa
+    failure = report.failures[1]
+    assert failure.message == UNKNOWN_ERR                             # noqa
+    assert isinstance(failure.error, TypeError)                       # noqa
+
+
+def testp_validator_executor() -> None:
+    """
+    **Выполнение проверок исполнителем**
+
+    1. Обработчик вызывается в основном потоке в порядке регистрации
+       методов.
+    2. Отчет пакетной валидации совпадает с последовательным (и для пула
+       потоков, и для пула процессов).
+
+    :return: ``None``
+    """
+    calls = []
+
+    def handler(e: Exception, obj: Any) -> None:
+        calls.append(str(e))
+
+    objs = ['ab', '', 'abcd', 'abc', 'abcde'] * 3
+    expected = Validator([not_empty, not_long]).validate_many(objs)
+
+    with ThreadPoolExecutor(2) as executor:
+        validator = Validator([not_long, not_empty], handler,
+                              executor=executor)
+        assert validator.validate('') == ''                           # noqa
+        assert validator.validate('abcd') == 'abcd'                   # noqa
+        assert calls == ['пусто', 'длинно']                           # noqa
+
+        with _(ValidationError):
+            Validator([not_empty], executor=executor).validate('')
+
+        validator = Validator([not_empty, not_long], executor=executor)
+        assert validator.validate_many(objs, chunk_size=4) == expected  # noqa
+        report = validator.validate_many(objs, fail_fast=True)
+        assert report.total == 2 and report.invalid == [1]            # noqa
+
+    with ProcessPoolExecutor(2) as executor:
+        validator = Validator([not_empty, not_long], executor=executor)
+        assert validator.validate_many(objs) == expected              # noqa
+
+
+def testn_validator_executor() -> None:
+    """
+    **Выполнение проверок исполнителем (непредвиденные ошибки)**
+
+    :return: ``None``
+    """
+    with ThreadPoolExecutor(2) as executor:
+        validator = Validator([not_long], executor=executor)
+
+        with _(Exception) as info:
+            validator.validate(None)
+        assert isinstance(info.value.__cause__, TypeError)            # noqa
+
+        report = validator.validate_many([None, 'a'])
+        assert report.invalid == [0]                                  # noqa
+        assert report.failures[0].message == UNKNOWN_ERR              # noqa
+
+
+async def unspent(obj: Any, params: VParams) -> None:                 # noqa
+    await sleep(params.get('delay', 0))
+    if obj in params.get('spent', ()):
+        raise ValidationError('потрачен')
+
+
+async def known(obj: Any, params: VParams) -> None:                   # noqa
+    await sleep(params.get('delay', 0))
+    if not obj:
+        raise ValidationError('неизвестен')
+
+
+def testp_async_validator() -> None:
+    """
+    **Асинхронный валидатор**
+
+    1. Сопрограммы и обычные функции проверки выполняются вместе, а
+       сопрограммы - одновременно.
+    2. Обработчик вызывается в порядке регистрации методов.
+    3. Пакетная валидация и декоратор.
+
+    :return: ``None``
+    """
+    calls = []
+
+    def handler(e: Exception, obj: Any) -> None:
+        calls.append(str(e))
+
+    async def scenario() -> None:
+        validator = AsyncValidator([unspent, known, not_long], limit=2)
+        assert await validator.validate('ab', spent=()) == 'ab'       # noqa
+
+        with _(ValidationError):
+            await validator.validate('ab', spent=('ab',))
+
+        validator = AsyncValidator([unspent, not_long, known], handler)
+        await validator.validate('', spent=('',), delay=0.01)
+        assert calls == ['потрачен', 'неизвестен']                    # noqa
+
+        report = await validator.validate_many(['a', '', 'abcd', 'b'],
+                                               spent=('b',))
+        assert report.invalid == [1, 2, 3]                            # noqa
+        report = await validator.validate_many(['a', '', 'b'],
+                                               fail_fast=True)
+        assert report.total == 2                                      # noqa
+
+        @validator.validate_with(spent=('c',))
+        async def accept(obj: Any) -> str:
+            return obj * 2
+
+        assert await accept('a') == 'aa'                              # noqa
+        await accept('c')
+        assert calls[-1] == 'потрачен'                                # noqa
+
+    run(scenario())
+    # семафор создается заново для нового цикла событий
+    run(AsyncValidator([known]).validate('a'))
+
+
+def testn_async_validator() -> None:
+    """
+    **Асинхронный валидатор (некорректные методы и непредвиденные ошибки)**
+
+    :return: ``None``
+    """
+    async def no_raise(obj: Any, params: VParams) -> None:
+        await sleep(0)
+
+    with _(TypeError):
+        AsyncValidator([no_raise])
+
+    with _(Exception) as info:
+        run(AsyncValidator([unspent]).validate('a', spent=None))
+    assert isinstance(info.value.__cause__, TypeError)                # noqa
+
+    # сопрограмма за оберткой (functools.wraps) тоже дожидается
+    with _(ValidationError):
+        run(AsyncValidator([wrapped(unspent)]).validate('a', spent='a'))
+
+
+def testp_validator_cache() -> None:
+    """
+    **Кеш результатов валидации**
+
+    1. Повторная валидация берет результат из кеша (и для неудач: с
+       обработчиком он вызывается снова).
+    2. Давно не использованные записи вытесняются.
+    3. Объекты и параметры не неизменяемых скалярных типов (в том числе
+       хешируемые кортежи и экземпляры классов) проверяются без кеша, а
+       равные значения параметров разных типов не смешиваются.
+    4. Без обработчика поиск прекращается на первой неудаче, а пакетная
+       валидация (которой нужны все неудачи) ищет их заново.
+    5. Записи с истекшим временем жизни не используются.
+
+    :return: ``None``
+    """
+    calls = []
+
+    def counted(obj: Any, params: VParams) -> None:
+        calls.append(obj)
+        not_long(obj, params)
+
+    validator = Validator([counted], trusted=True, cache_size=2)
+    assert validator.validate('ab') == 'ab'                           # noqa
+    assert validator.validate('ab') == 'ab'                           # noqa
+    assert calls == ['ab']                                            # noqa
+
+    for _i in range(2):
+        with _(ValidationError):
+            validator.validate('abcd')
+    assert calls == ['ab', 'abcd']                                    # noqa
+    assert validator.validate('abcd', limit=4) == 'abcd'              # noqa
+
+    info = validator.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 2)       # noqa
+
+    # запись для 'ab' вытеснена записями для 'abcd'
+
+    validator.validate('ab')                                          # noqa
+    assert calls[-1] == 'ab'                                          # noqa
+
+    validator.validate(['ab'])
+    validator.validate(['ab'])
+    validator.validate('a', tags=['x'])
+    assert validator.cache_info().misses == 4                         # noqa
+
+    class Box:
+        size = 'ab'
+
+        def __len__(self) -> int:
+            return len(self.size)
+
+    box = Box()
+    validator = Validator([counted], trusted=True, cache_size=8)
+    validator.validate((1,))
+    validator.validate((True,))
+    validator.validate(box)
+    box.size = 'abcd'
+    with _(ValidationError):
+        validator.validate(box)
+    validator.validate('a', limit=1)
+    validator.validate('a', limit=True)
+    assert calls[-6:] == [(1,), (True,), box, box, 'a', 'a']         # noqa
+    assert validator.cache_info().currsize == 2                       # noqa
+
+    def failing(obj: Any, params: VParams) -> None:
+        calls.append('failing')
+        raise ValidationError('неудача')
+
+    calls.clear()
+    validator = Validator([counted, failing], trusted=True, cache_size=8)
+    with _(ValidationError):
+        validator.validate('abcd')
+    assert calls == ['abcd']                                          # noqa
+
+    report = validator.validate_many(['abcd'])
+    assert len(report.failures) == 2                                  # noqa
+    assert calls == ['abcd', 'abcd', 'failing']                       # noqa
+    with _(ValidationError):
+        validator.validate('abcd')
+    assert len(validator.validate_many(['abcd']).failures) == 2       # noqa
+    assert len(calls) == 3                                            # noqa
+
+    errors = []
+
+    def handler(e: Exception, obj: Any) -> None:
+        errors.append(obj)
+
+    validator = Validator([not_long], handler, cache_size=8, cache_ttl=0)
+    validator.validate('abcd')
+    validator.validate('abcd')
+    assert errors == ['abcd', 'abcd']                                 # noqa
+    assert validator.cache_info().hits == 0                           # noqa
+
+    validator.cache_clear()
+    assert validator.cache_info().currsize == 0                       # noqa
+    assert Validator([not_long]).cache_info() is None                 # noqa
+
+
+def testn_validator_cache() -> None:
+    """
+    **Кеш результатов валидации (непредвиденные ошибки)**
+
+    Непредвиденные исключения не кешируются.
+
+    :return: ``None``
+    """
+    validator = Validator([not_long], cache_size=8)
+
+    for _i in range(2):
+        with _(Exception):
+            validator.validate(1)
+
+    assert validator.cache_info().currsize == 0                       # noqa
+
+
+def testp_validator_stats() -> None:
+    """
+    **Статистика валидатора**
+
+    1. Счетчики вызовов и неудач каждого метода проверки и вызовов
+       обработчика.
+    2. Приемник получает каждый замер.
+    3. Без сбора статистики ``stats`` возвращает ``None``.
+
+    :return: ``None``
+    """
+    events = []
+
+    def sink(method: VMethod, ns: int, er: Optional[Exception]) -> None:
+        events.append((method, er is None))
+
+    validator = Validator([not_empty, not_long], correct_handler, sink=sink)
+
+    for obj in ('ab', '', 'abcd'):
+        validator.validate(obj)
+    validator.validate_many(['abcd'])
+
+    stats = validator.stats()
+    empty, long = stats.checks
+    assert (empty.name, empty.calls) == ('not_empty', 4)              # noqa
+    assert empty.failures == 1                                        # noqa
+    assert (long.calls, long.failures) == (4, 2)                      # noqa
+    assert stats.handler_calls == 2                                   # noqa
+    assert 0 < long.p50_ns <= long.p99_ns and long.mean_ns > 0        # noqa
+    assert len(events) == 8 and events[1] == (not_long, True)         # noqa
+
+    validator = Validator([not_empty], instrument=True, cache_size=4)
+    validator.validate('a')
+    validator.validate('a')
+    assert validator.stats().checks[0].calls == 1                     # noqa
+
+    assert Validator([not_empty]).stats() is None                     # noqa
+
+
+def testn_validator_stats() -> None:
+    """
+    **Статистика валидатора (непредвиденные ошибки)**
+
+    Непредвиденное исключение тоже считается неудачей.
+
+    :return: ``None``
+    """
+    validator = Validator([not_long], instrument=True)
+
+    with _(Exception):
+        validator.validate(None)
+
+    assert validator.stats().checks[0].failures == 1                  # noqa
+
+
+def slow_check(obj: Any, params: VParams) -> None:                    # noqa
+    if sum(range(2000)) < 0:
+        raise ValidationError('никогда')
+
+
+def testp_validator_adaptive() -> None:
+    """
+    **Адаптивный порядок методов проверки**
+
+    1. Дешевая и часто отклоняющая объекты проверка переставляется вперед,
+       и дорогая перестает выполняться для некорректных объектов.
+    2. Зависимости соблюдаются при любом порядке.
+
+    :return: ``None``
+    """
+    validator = Validator([slow_check, not_long], adaptive=True,
+                          reorder_every=8)
+
+    for _i in range(32):
+        with _(ValidationError):
+            validator.validate('abcd')
+
+    slow, long = validator.stats().checks
+    assert long.calls == 32 and slow.calls < 16                       # noqa
+    assert validator.validate('ab') == 'ab'                           # noqa
+
+    report = validator.validate_many(['abcd'] * 8)
+    assert report.invalid == list(range(8))                           # noqa
+
+    validator = Validator([not_long, not_empty],
+                          depends={not_long: [not_empty]})
+
+    with _(ValidationError) as info:
+        validator.validate('')
+    assert 'пусто' in str(info.value)                                 # noqa
+
+    validator = Validator([slow_check, not_long], adaptive=True,
+                          reorder_every=4, depends={not_long: [slow_check]})
+
+    for _i in range(16):
+        with _(ValidationError):
+            validator.validate('abcd')
+    assert validator.stats().checks[0].calls == 16                    # noqa
+
+
+def testp_validator_depends_executor() -> None:
+    """
+    **Зависимости методов проверки в пуле**
+
+    Зависимый метод запускается только после завершения метода, от
+    которого он зависит, хотя оба отправляются одному исполнителю.
+
+    :return: ``None``
+    """
+    log = []
+
+    def first(obj: Any, params: VParams) -> None:                     # noqa
+        time.sleep(0.05)
+        log.append('first')
+        if obj is None:
+            raise ValidationError('пусто')
+
+    def second(obj: Any, params: VParams) -> None:                    # noqa
+        log.append('second')
+        if not obj:
+            raise ValidationError('ложно')
+
+    with ThreadPoolExecutor(2) as executor:
+        validator = Validator([second, first], executor=executor,
+                              depends={second: [first]})
+        assert validator.validate('x') == 'x'                         # noqa
+        assert log == ['first', 'second']                             # noqa
+
+        with _(ValidationError) as info:
+            validator.validate(None)
+        assert 'пусто' in str(info.value)                             # noqa
+        assert log[2:] == ['first']                                   # noqa
+
+        with _(ValidationError) as info:
+            validator.validate('')
+        assert 'ложно' in str(info.value)                             # noqa
+
+
+def testn_validator_adaptive() -> None:
+    """
+    **Адаптивный порядок методов проверки (некорректные зависимости)**
+
+    :return: ``None``
+    """
+    with _(ValueError):
+        Validator([not_long, not_empty], depends={not_long: [slow_check]})
+
+    with _(ValueError):
+        Validator([not_long, not_empty], depends={
+            not_long: [not_empty], not_empty: [not_long]
+        })
+
+
+def testp_validation_via_decorator_signature() -> None:
+    """
+    **Валидация через декоратор (параметр по сигнатуре)**
+
+    1. Объект проверки берется из позиционного или именованного аргумента,
+       а если его нет - из значения по умолчанию.
+    2. "Ложные" объекты проверяются как любые другие.
+    3. Проверяемый параметр можно указать по имени, а с помощью
+       ``validate_args`` - проверить несколько параметров.
+
+    :return: ``None``
+    """
+    validator = Validator([not_long])
+    seen = []
+
+    @validator.validate_with(limit=2)
+    def first(value: str, other: str = 'abcd') -> str:
+        return value
+
+    assert first('ab') == 'ab'                                        # noqa
+    assert first(value='') == ''                                      # noqa
+
+    with _(ValidationError):
+        first(other='ab', value='abc')
+
+    @validator.validate_with('other')
+    def second(value: Any, *, other: str = 'ab') -> None:
+        seen.append(value)
+
+    second(None)
+    second(0, other='abc')
+
+    with _(ValidationError):
+        second(1, other='abcd')
+    assert seen == [None, 0]                                          # noqa
+
+    class Field:
+        @validator.validate_args(name={'limit': 2}, alias={})
+        def __init__(self, name: str, alias: str = '') -> None:
+            self.name = name
+
+    assert Field('ab', alias='abc').name == 'ab'                      # noqa
+
+    with _(ValidationError):
+        Field('ab', 'abcd')
+
+
+def testn_validation_via_decorator_signature() -> None:
+    """
+    **Валидация через декоратор (некорректный параметр)**
+
+    Несуществующий параметр обнаруживается при декорировании.
+
+    :return: ``None``
+    """
+    validator = Validator([not_long])
+
+    with _(ValueError):
+        @validator.validate_with('missing')
+        def func(value: Any) -> None:                                 # noqa
+            ...
+
+    with _(ValueError):
+        @validator.validate_args(value={}, missing={})
+        def func(value: Any) -> None:                                 # noqa
+            ...
+
+    @validator.validate_with()
+    def func(*args: Any) -> None:                                     # noqa
+        ...
+
+    with _(ValueError):
+        func('a')
@@ -0,0 +1,117 @@
+"""
+**Тесты для схем Валидатора**
+
+Тестирование компиляции декларативных схем в функции проверки
+"""
+
+from inspect import getsource
+
+from pytest import raises as _
+
+from shared.classes.basic.abstractions.validator import *
+from shared.classes.crypto.message import Encoding, Method
+
+
+OUTPUT = Schema({
+    'amount': Field(int, min_value=0, max_value=21 * 10 ** 14),
+    'script': Field(bytes, max_length=10_000),
+}, name='output')
+
+TX = Schema({
+    'txid': Field(str, 64, 64, pattern='[0-9a-f]*'),
+    'encoding': Field(choices=Encoding),
+    'method': Field(choices=Method, required=False),
+    'output': Field(dict, schema=OUTPUT),
+    'memo': Field(required=False),
+}, name='tx')
+
+
+def record(**changes: Any) -> dict:
+    """
+    **Корректная запись транзакции (с изменениями)**
+
+    :param changes: измененные поля (``None`` - удалить поле)
+    :return: запись
+    """
+    tx = {
+        'txid': 'ab' * 32,
+        'encoding': Encoding.bnr,
+        'output': {'amount': 5, 'script': b'\x00'},
+    }
+    tx.update(changes)
+    return {key: value for key, value in tx.items() if value is not None}
+
+
+def testp_schema() -> None:
+    """
+    **Компиляция схемы**
+
+    1. Корректная запись проходит проверку одной функцией.
+    2. Исходный код функции доступен inspect.getsource.
+    3. Схема для объекта с атрибутами.
+
+    :return: ``None``
+    """
+    validator = TX.validator()
+    tx = record(method=Method.sha256, memo=[1])
+
+    assert validator.validate(tx) is tx                               # noqa
+    assert getsource(TX.check) == TX.source                           # noqa
+    assert 'def check_tx(obj: Any' in TX.source                       # noqa
+
+    class Header:
+        version = 1
+        nonce = 0
+
+    schema = Schema({'version': Field(int, min_value=1),
+                     'nonce': Field(int, min_value=0,
+                                     max_value=2 ** 32 - 1)},
+                    attrs=True, name='header')
+    schema.validator().validate(Header())
+
+
+def testn_schema() -> None:
+    """
+    **Компиляция схемы (некорректные записи)**
+
+    Сообщение об ошибке указывает путь к полю (в том числе вложенному).
+
+    :return: ``None``
+    """
+    validator = Validator([TX.check])
+    cases = [
+        (record(txid='AB' * 32), 'txid'),
+        (record(txid='ab'), 'txid'),
+        (record(txid=None), 'txid'),
+        (record(encoding='bnr'), 'encoding'),
+        (record(encoding=['bnr']), 'encoding'),
+        (record(method={Method.sha256}), 'method'),
+        (record(output={'amount': -1, 'script': b''}), 'output.amount'),
+        (record(output={'amount': 1}), 'output.script'),
+        (record(output=[]), 'output'),
+        ([], 'obj'),
+    ]
+
+    for tx, where in cases:
+        with _(ValidationError) as info:
+            validator.validate(tx)
+        assert f' {where}' in str(info.value)                         # noqa
+
+    with _(ValueError):
+        Schema({}, name='not a name')
+
+    # без объявленного типа ограничения не поднимают TypeError (значение
+    # другого типа - неудача ограничения), нехешируемые варианты допустимы
+    untyped = Validator([Schema({
+        'size': Field(min_length=1, required=False),
+        'amount': Field(min_value=0, max_value=10, required=False),
+        'txid': Field(pattern='[0-9a-f]*', required=False),
+        'tags': Field(choices=[['a'], ['b']], required=False),
+    }, name='untyped').check])
+    assert untyped.validate({'tags': ['a']}) == {'tags': ['a']}       # noqa
+
+    for tx, where in [({'size': 5}, 'size'), ({'amount': 'a'}, 'amount'),
+                      ({'txid': b'ab'}, 'txid'), ({'tags': 'a'}, 'tags')]:
+        with _(ValidationError) as info:
+            untyped.validate(tx)
+        assert f' {where}' in str(info.value)                         # noqa
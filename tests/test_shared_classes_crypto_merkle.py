@@ -0,0 +1,89 @@
+from hashlib import sha256
+
+from pytest import raises as _
+
+from shared.classes.crypto.merkle.merkle import *
+
+
+def hash2(data: bytes) -> bytes:
+    return sha256(sha256(data).digest()).digest()
+
+
+def reference_root(leaves: list) -> bytes:
+    # эталонный расчет корня "в лоб": каждый уровень строится заново
+    level = list(leaves)
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])                                   # последний узел нечетного уровня объединяется сам с собой
+        level = [hash2(level[i] + level[i + 1]) for i in range(0, len(level), 2)]
+    return level[0]
+
+
+LEAVES = [hash2(i.to_bytes(4, 'little')) for i in range(23)]          # листья (хеши "транзакций")
+
+
+def testp_merkle_tree():
+    # корень совпадает с эталонным при построении дерева целиком и при добавлении листьев по одному
+    tree = MerkleTree()
+    for i, leaf in enumerate(LEAVES):
+        tree.append(leaf)                                             # пересчитывается только путь от листа до корня
+        assert tree.root == reference_root(LEAVES[:i + 1])
+    assert MerkleTree(LEAVES).root == tree.root
+    assert len(tree) == len(LEAVES) and tree.leaf(3) == LEAVES[3]
+
+    # замена листа
+    leaves = list(LEAVES)
+    leaves[7] = bytes(32)
+    tree.replace(7, bytes(32))
+    assert tree.root == reference_root(leaves)
+
+    # добавление нескольких листьев сразу
+    tree = MerkleTree(LEAVES[:5])
+    tree.extend(LEAVES[5:])
+    assert tree.root == reference_root(LEAVES)
+
+    # дерево из исходных данных: листья - их двойные хеши
+    items = [i.to_bytes(4, 'little') for i in range(23)]
+    assert MerkleTree.from_data(items).root == reference_root(LEAVES)
+
+    # корень дерева из одного листа - сам лист
+    assert MerkleTree(LEAVES[:1]).root == LEAVES[0]
+
+    # метод хеширования можно указать строкой (как при создании сообщения)
+    tree = MerkleTree(LEAVES, method='SHA-256')
+    assert tree.root == reference_root(LEAVES)
+    assert MerkleTree.from_data(items, 'sha256').root == tree.root
+    assert MerkleTree.verify(LEAVES[5], 5, tree.proof(5), tree.root, method='sha-256')
+
+
+def testp_merkle_proof():
+    # доказательство включения проверяется для каждого листа (в т.ч. для последнего листа нечетного уровня)
+    tree = MerkleTree(LEAVES)
+    for i, leaf in enumerate(LEAVES):
+        assert MerkleTree.verify(leaf, i, tree.proof(i), tree.root)
+
+
+def testn_merkle_proof():
+    tree = MerkleTree(LEAVES)
+    proof = tree.proof(4)
+    assert not MerkleTree.verify(LEAVES[5], 4, proof, tree.root)      # чужой лист
+    assert not MerkleTree.verify(LEAVES[4], 5, proof, tree.root)      # чужой индекс
+    assert not MerkleTree.verify(LEAVES[4], 4 + 64, proof, tree.root) # индекс за пределами дерева
+
+
+def testn_merkle_tree():
+    # лист должен быть хешем нужной длины
+    with _(ValueError):
+        MerkleTree([b'short'])
+    with _(TypeError):
+        MerkleTree().append('строка')                                 # noqa
+
+    # обращение к несуществующему листу
+    with _(IndexError):
+        MerkleTree(LEAVES).replace(len(LEAVES), bytes(32))
+    with _(IndexError):
+        MerkleTree(LEAVES).proof(-1)
+
+    # у пустого дерева нет корня
+    with _(ValueError):
+        MerkleTree().root                                             # noqa
@@ -1,4 +1,4 @@
-from pytest import raises as _
+from pytest import importorskip, raises as _
 
 from shared.classes.crypto.message.message import *
 
@@ -60,12 +60,358 @@ def testn_initialization():
     with _(ValueError):
         m = Message(encoding='bmp')                                   # тестируем попытку установить в качестве кодировки "левый" формат
 
-    dx = bytearray(0x00.to_bytes(1_048_576, 'big'))    # создаем массив-заполнитель
-    d = EMPTY_MESSAGE                                                 # создаем массив данных
-    while len(d) <= MAX_LENGTH:                                       # заполняем массив данных заполнителем, пока не превысит MAX_LENGTH
-        d += dx                                                       # ... добавляем очередную порцию
-
+    d = bytes(MAX_LENGTH + 1)                                         # нулевые байты выделяются лениво (страницы памяти не заполняются)
     assert len(d) > MAX_LENGTH                                        # убедимся, что длина больше допустимой
 
     with _(ValueError):
         m = Message(d)                                                # тестируем попытку установить слишком длинные данные
+
+
+def testp_hash():
+    # хеш вычисляется реализацией по умолчанию (самой быстрой из доступных) и совпадает с эталонной реализацией на чистом Python
+    for ln in (0, 1, 55, 56, 63, 64, 65, 119, 120, 1000):             # длины по обе стороны от границ дополнения (padding)
+        d = bytes(range(256)) * 4                                     # заполнитель
+        m = Message(d[:ln])                                           # создаем сообщение нужной длины
+        assert m.hash() == m.hash('python')                           # сравниваем быструю реализацию с эталонной
+        assert m.digest() == m.hash()                                 # digest() - синоним hash()
+
+    # проверяем значения по стандартным тестовым векторам FIPS 180-4
+    assert Message(b'abc').hexdigest() == 'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+    assert Message(b'').hexdigest('python') == 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+
+    # для каждого метода хеширования есть хотя бы одна реализация, и реализацию по умолчанию можно получить через реестр
+    for method in Method:
+        assert list_backends(method)                                  # реализации зарегистрированы
+        assert get_backend(method) in list_backends(method)           # реализация по умолчанию - одна из зарегистрированных
+
+    # метод можно указать и строкой (как при создании сообщения)
+    assert get_backend('SHA-256') is get_backend(Method.sha256)
+    assert get_backend('sha256', 'python') in list_backends('sha-256')
+
+
+def testn_hash():
+    # при попытке указать незарегистрированную реализацию будет поднято исключение (ошибочное значение)
+    with _(ValueError):
+        Message(b'abc').hash('unknown')                               # тестируем попытку хешировать "левой" реализацией
+
+    # неизвестное наименование метода - ошибочное значение, а не AttributeError
+    with _(ValueError):
+        get_backend('sha-512')
+    with _(TypeError):
+        get_backend(1)                                                # noqa тестируем попытку указать метод числом
+
+
+def testp_zero_copy():
+    # данные из любого объекта с протоколом буфера сохраняются без копирования (в виде представления только для чтения)
+    d = bytearray(b'abcdef')                                          # создаем массив
+    m = Message(d)                                                    # создаем сообщение
+    assert m.data.obj is d                                            # убедимся, что сообщение ссылается на тот же самый массив
+    assert m.data.readonly                                            # и что само сообщение изменить его не может
+
+    m = Message(memoryview(b'0123456789')[::2])                       # разрывное представление придется скопировать
+    assert m.data == b'02468'                                         # проверяем, что данные взяты верно
+
+    from array import array
+    a = array('H', [1, 2, 3])                                         # типизированный массив тоже подходит
+    assert Message(a).data.nbytes == 6                                # данные представлены как байты
+
+    # копирование при записи: изменяемое представление создается по запросу, а источник при этом не меняется
+    m = Message(d)
+    w = m.mutable()                                                   # получаем изменяемое представление
+    w[0] = ord('z')                                                   # изменяем данные сообщения
+    assert m.data == b'zbcdef'                                        # сообщение изменилось
+    assert d == b'abcdef'                                             # источник - нет
+    assert m.mutable() is w                                           # повторный запрос новой копии не создает
+
+
+def testn_zero_copy():
+    # объекты, не поддерживающие протокол буфера, в качестве данных не принимаются (несоответствие типов)
+    with _(TypeError):
+        m = Message(1.5)                                              # noqa тестируем попытку установить в качестве данных число
+
+    with _(TypeError):
+        m = Message([1, 2, 3])                                        # noqa тестируем попытку установить в качестве данных список
+
+
+def testp_from_file(tmp_path):
+    # сообщение можно создать из файла: данные отображаются в память и хешируются прямо из отображения
+    d = bytes(range(256)) * 1000                                      # содержимое файла
+    path = tmp_path / 'block.dat'                                     # путь к файлу
+    path.write_bytes(d)                                               # записываем файл
+
+    with Message.from_file(path) as m:                                # отображение будет освобождено по выходу из блока
+        assert m.encoding == Encoding.bnr                             # по умолчанию файл интерпретируется как бинарные данные
+        assert m.data == d                                            # данные соответствуют содержимому файла
+        assert m.hash() == Message(d).hash()                          # и хеш тот же, что и при хешировании из памяти
+
+    assert m.data == b''                                              # после закрытия данных больше нет
+
+    path = tmp_path / 'empty.dat'                                     # пустой файл тоже допустим
+    path.write_bytes(b'')
+    assert Message.from_file(path).hash() == Message(b'').hash()
+
+
+def testp_from_file_copy(tmp_path):
+    # копия сообщения из файла остается пригодной, пока ее не удалят: закрыть исходное сообщение до этого нельзя
+    d = bytes(range(256)) * 100
+    path = tmp_path / 'block.dat'
+    path.write_bytes(d)
+
+    m = Message.from_file(path)
+    c = m.copy()
+    with _(BufferError):
+        m.close()                                                     # отображение еще используется копией
+    assert m.data == d and c.hash() == m.hash() == Message(d).hash()  # ... и оба сообщения по-прежнему пригодны
+
+    del c                                                             # после удаления копии закрытие проходит
+    m.close()
+    assert m.data == b''
+
+
+def testn_from_file(tmp_path):
+    # при попытке открыть несуществующий файл будет поднято исключение
+    with _(FileNotFoundError):
+        Message.from_file(tmp_path / 'missing.dat')
+
+    # длина файла проверяется до отображения в память (файл разреженный, поэтому места на диске он не занимает)
+    path = tmp_path / 'huge.dat'
+    with open(path, 'wb') as file:
+        file.truncate(MAX_LENGTH + 1)                                 # делаем файл длиннее допустимого
+
+    with _(ValueError):
+        Message.from_file(path)                                       # тестируем попытку хешировать слишком длинный файл
+
+
+def testp_update():
+    # в инкрементальном режиме хеш всех порций совпадает с хешем тех же данных, переданных целиком
+    d = bytes(range(256)) * 10                                        # исходные данные
+    m = Message(d[:100])                                              # начинаем с данных самого сообщения
+    for i in range(100, len(d), 77):                                  # ... и добавляем остальное порциями некратной длины
+        m.update(d[i:i + 77])
+    assert m.hash() == Message(d).hash()                              # хеш совпадает
+    assert m.length == len(d)                                         # длина учитывает все порции
+
+    # копия промежуточного состояния: общий префикс хешируется один раз
+    prefix = Message(d[:76])
+    prefix.update(b'')                                                # переводим сообщение в инкрементальный режим
+    for nonce in range(3):
+        m = prefix.copy()                                             # копируем состояние после префикса
+        m.update(nonce.to_bytes(4, 'little'))                         # добавляем только хвост
+        assert m.hash() == Message(d[:76] + nonce.to_bytes(4, 'little')).hash()
+    assert prefix.hash() == Message(d[:76]).hash()                    # сам префикс копиями не изменен
+
+    # эталонная реализация работает в инкрементальном режиме так же
+    m = Message(b'')
+    m.update(d[:10], 'python')
+    m.update(d[10:])
+    assert m.hash('python') == Message(d).hash()
+
+    # данные можно читать из потока порциями
+    from io import BytesIO
+    m = Message(b'')
+    assert m.update_from(BytesIO(d), chunk_size=100) == len(d)        # читаем поток в переиспользуемый буфер
+    assert m.hash() == Message(d).hash()
+
+
+def testn_update():
+    m = Message(b'')
+    m.update(b'abc')                                                  # переводим сообщение в инкрементальный режим
+
+    # порции, не поддерживающие протокол буфера, не принимаются (несоответствие типов)
+    with _(TypeError):
+        m.update(1)                                                   # noqa тестируем попытку добавить число
+
+    # в инкрементальном режиме нельзя получить хеш другой реализацией (порции не сохраняются)
+    with _(ValueError):
+        m.hash('python')
+
+    # превышение максимальной длины сообщения (в битах) с учетом всех порций
+    m._length = MAX_LENGTH                                            # имитируем уже полученные данные максимальной длины
+    with _(ValueError):
+        m.update(b'x')                                                # тестируем попытку превысить максимальную длину
+
+
+def testp_hash_many():
+    # пакетное хеширование дает те же хеши, что и хеширование каждого сообщения по отдельности
+    leaves = [i.to_bytes(4, 'little') for i in range(1000)]           # множество небольших сообщений
+    expected = [Message(leaf).hash() for leaf in leaves]
+    assert Message.hash_many(leaves) == expected                      # список хешей
+    assert Message.hash_many(iter(leaves), 'sha-256', OUT_BYTES) == b''.join(expected)
+    assert Message.hash_many(leaves, backend='python')[:3] == expected[:3]
+    assert Message.hash_many([]) == []                                # пустой пакет допустим
+
+    # разрывные буферы (срезы с шагом) хешируются так же, как и при создании сообщения
+    strided = memoryview(b'abcdef')[::2]
+    assert Message.hash_many([strided, b'ace']) == [Message(strided).hash()] * 2
+
+
+def testp_hash_many_numpy():
+    numpy = importorskip('numpy')                                     # NumPy - необязательная зависимость
+    leaves = [bytes([i]) for i in range(10)]
+    digests = Message.hash_many(leaves, out=OUT_NUMPY)
+    assert digests.shape == (10, 32) and digests.dtype == numpy.uint8
+    assert digests[3].tobytes() == Message(leaves[3]).hash()
+
+
+def testn_hash_many():
+    # форма результата проверяется до хеширования (ошибочное значение)
+    with _(ValueError):
+        Message.hash_many([b'a'], out='tuple')
+
+    # элементы, не поддерживающие протокол буфера, не принимаются (несоответствие типов)
+    with _(TypeError):
+        Message.hash_many([b'a', 'b'])                                # noqa тестируем попытку хешировать строку
+
+    # метод хеширования проверяется так же, как и при создании сообщения
+    with _(ValueError):
+        Message.hash_many([b'a'], 'unknown')
+
+
+def testp_lookup():
+    # строка ищется сначала по наименованию, затем по псевдониму (без учета регистра, дефисов и подчеркиваний)
+    assert Message(b'', method=DEF_METHOD).method == Method.sha256    # метод по умолчанию ('sha256') теперь находится
+    assert Message(b'', method='SHA-256').method == Method.sha256
+    assert Message(b'', encoding=DEF_ENCODING).encoding == Encoding.utf8
+    assert Message(b'', encoding='UTF8').encoding == Encoding.utf8
+    assert Message(b'', encoding='koi8r').encoding == Encoding.koi8r
+
+    # таблицы по индексу содержат все элементы перечислений
+    assert all(METHODS_BY_IDX[i.idx] is i for i in Method)
+    assert all(ENCODINGS_BY_IDX[i.idx] is i for i in Encoding)
+
+
+def testn_lookup():
+    # похожие, но неизвестные наименования по-прежнему недопустимы (ошибочное значение)
+    with _(ValueError):
+        Message(b'', method='sha-512')
+    with _(ValueError):
+        Message(b'', encoding='utf-16')
+
+
+def testp_decoders():
+    # шестнадцатеричная строка: пробелы допускаются как между байтами, так и внутри них
+    assert Message('00ff10', Encoding.hex)._data == b'\x00\xff\x10'
+    assert Message('00 ff\n10', Encoding.hex)._data == b'\x00\xff\x10'  # пробелы между байтами
+    assert Message('0 0f f\t1 0', Encoding.hex)._data == b'\x00\xff\x10'  # пробелы внутри байтов
+    assert Message('', Encoding.hex)._data == b''                     # пустая строка - пустое сообщение
+
+    # бинарная строка: количество битов кратно 8, пробелы допускаются в любом месте
+    assert Message('0000000111111111', Encoding.bin)._data == b'\x01\xff'
+    assert Message('0000 0001\n1111 1111', Encoding.bin)._data == b'\x01\xff'
+    bits = ''.join(format(i % 256, '08b') for i in range(20_000))     # больше одной порции декодирования
+    assert Message(bits, Encoding.bin)._data == bytes(i % 256 for i in range(20_000))
+
+    # строка в кодировке utf-8 (в том числе по умолчанию) и bnr кодируется в utf-8
+    assert Message('абв')._data == 'абв'.encode('utf-8')
+    assert Message('абв', Encoding.utf8)._data == 'абв'.encode('utf-8')
+    assert Message('abc', Encoding.bnr)._data == b'abc'
+
+
+def testn_decoders():
+    # некорректная шестнадцатеричная строка (ошибочное значение)
+    with _(ValueError):
+        Message('0ff', Encoding.hex)                                  # нечетное количество цифр
+    with _(ValueError):
+        Message('0g', Encoding.hex)                                   # недопустимый символ
+
+    # некорректная бинарная строка (ошибочное значение)
+    with _(ValueError):
+        Message('0101', Encoding.bin)                                 # количество битов не кратно 8
+    with _(ValueError):
+        Message('0b00000001', Encoding.bin)                           # префикс не допускается
+    with _(ValueError):
+        Message('0000000２', Encoding.bin)                             # не ASCII-символ
+
+
+def testp_from_text(tmp_path):
+    # строка в кодовых таблицах cp1251, cp866 и koi8-r кодируется соответствующим кодеком
+    for encoding in (Encoding.cp1251, Encoding.cp866, Encoding.koi8r):
+        assert Message('Привет', encoding)._data == 'Привет'.encode(encoding.nme)
+
+    # текст порциями дает те же данные и хеш, что и целая строка (в том числе без сохранения данных)
+    text = 'строка журнала\n' * 1000
+    chunks = (text[i:i + 100] for i in range(0, len(text), 100))      # генератор порций
+    m = Message.from_text(chunks, Encoding.cp1251)
+    assert m._data == text.encode('cp1251')
+    assert m.hash() == Message(text, Encoding.cp1251).hash()
+    assert Message.from_text(text, keep=False).hash() == Message(text).hash()  # строка - это одна порция
+    assert Message.from_text([], keep=False).hash() == Message(b'').hash()
+
+    # текстовый файл перекодируется в кодировку сообщения (переводы строк сохраняются)
+    path = tmp_path / 'log.txt'
+    path.write_bytes('заголовок\r\nтело\n'.encode('cp866'))
+    m = Message.from_text_file(path, Encoding.koi8r, source='cp866', chunk_size=3)
+    assert m._data == 'заголовок\r\nтело\n'.encode('koi8-r')
+    assert Message.from_text_file(path, Encoding.cp866, keep=False).hash() == Message(path.read_bytes()).hash()
+
+
+def testn_from_text(tmp_path):
+    # символы, которых нет в кодовой таблице, недопустимы (ошибочное значение)
+    with _(ValueError):
+        Message('€', Encoding.koi8r)
+    with _(ValueError):
+        Message.from_text(['abc', '€'], Encoding.cp866)
+
+    # потоковое кодирование в бинарную или шестнадцатеричную строку невозможно (ошибочное значение)
+    with _(ValueError):
+        Message.from_text('01', Encoding.bin)
+    with _(ValueError):
+        Message.from_text_file(tmp_path / 'missing.txt', Encoding.hex)  # кодировка проверяется до открытия файла
+
+    # порции должны быть строками (несоответствие типов)
+    with _(TypeError):
+        Message.from_text([b'abc'])                                   # noqa тестируем попытку передать байты
+
+
+def testp_digest_cache():
+    # хеш неизменяемых данных вычисляется один раз и далее возвращается сохраненный объект
+    m = Message(b'abc', Encoding.bnr)
+    assert not m.is_cached()
+    h = m.hash()
+    assert m.is_cached() and m.is_cached('sha-256') and m.hash() is h
+    assert m.hash('python') == h                                      # явно указанная реализация вычисляет хеш заново
+
+    # смена кодировки и новые данные сбрасывают сохраненные хеши
+    m.encoding = Encoding.hex
+    assert not m.is_cached()
+    m.hash()
+    m._set_data(b'abd')
+    assert not m.is_cached() and m.hash() != h
+
+    # копия получает свои сохраненные хеши
+    c = m.copy()
+    assert c.is_cached()
+    c._set_data(b'abc')
+    assert m.is_cached() and c.hash() == h
+
+    # хеш изменяемых данных не сохраняется: изменения источника или копии при записи сразу видны
+    d = bytearray(b'abc')
+    m = Message(d)
+    assert m.hash() == h and not m.is_cached()
+    d[2:] = b'd'
+    assert m.hash() != h
+    m = Message(b'abc')
+    m.hash()
+    m.mutable()[2] = ord('d')
+    assert not m.is_cached() and m.hash() != h
+
+    # собственный массив байтов сообщения (бинарная строка, текст) снаружи не изменить, поэтому его хеш тоже сохраняется
+    for owned in (Message('0000000111111111', Encoding.bin), Message.from_text(['ab', 'c'])):
+        digest = owned.hash()
+        assert owned.is_cached() and owned.hash() is digest
+    owned.mutable()[0] = ord('x')                                     # изменение копии при записи по-прежнему сбрасывает хеши
+    assert not owned.is_cached() and owned.hash() != digest
+
+    # в инкрементальном режиме хеш берется из состояния хеширования (сохраненные хеши не используются)
+    m = Message(b'ab')
+    m.hash()
+    m.update(b'c')
+    assert not m.is_cached() and m.hash() == h
+
+
+def testn_digest_cache():
+    # метод хеширования проверяется так же, как и при создании сообщения
+    with _(ValueError):
+        Message(b'').is_cached('sha-512')
+    with _(TypeError):
+        Message(b'').is_cached(256)                                   # noqa тестируем попытку указать метод числом
@@ -0,0 +1,48 @@
+from pytest import raises as _
+
+from shared.classes.crypto.message.frozen import *
+
+
+def testp_frozen_message():
+    # компактное сообщение не имеет словаря атрибутов и хранит данные в виде неизменяемых байтов
+    d = bytes(range(80))                                              # данные размером с заголовок блока
+    m = FrozenMessage(d)
+    assert not hasattr(m, '__dict__')                                 # атрибуты хранятся только в __slots__
+    assert m.data is d                                                # bytes сохраняются без копирования
+    assert m.method is Method.sha256                                  # ссылка на элемент перечисления, а не его копия
+    assert FrozenMessage(bytearray(d)).data == d                      # изменяемый источник копируется в bytes
+
+    # хеш вычисляется при первом обращении и далее не пересчитывается
+    assert not m.cached
+    digest = m.hash()
+    assert m.cached and m.hash() is digest
+    assert digest == Message(d).hash() and m.hexdigest() == digest.hex()
+
+    # сообщения с одинаковыми данными равны и могут использоваться в множествах
+    assert FrozenMessage(d) == FrozenMessage(bytearray(d), 'sha256')
+    assert len({FrozenMessage(d), FrozenMessage(d)}) == 1
+
+
+def testn_frozen_message():
+    # данные и метод проверяются так же, как и у Message
+    with _(TypeError):
+        FrozenMessage('строка')                                       # noqa тестируем попытку передать строку
+    with _(ValueError):
+        FrozenMessage(b'', 'unknown')
+
+    # новые атрибуты установить нельзя, как и изменить данные через свойство
+    m = FrozenMessage(b'abc')
+    with _(AttributeError):
+        m.extra = 1                                                   # noqa
+    with _(AttributeError):
+        m.data = b'xyz'                                               # noqa
+
+    # внутренние атрибуты тоже нельзя ни заменить, ни удалить (сохраненный хеш не устареет)
+    digest = m.hash()
+    with _(AttributeError):
+        m._data = b'xyz'                                              # noqa
+    with _(AttributeError):
+        m._digest = None                                              # noqa
+    with _(AttributeError):
+        del m._data                                                   # noqa
+    assert m.data == b'abc' and m.hash() is digest
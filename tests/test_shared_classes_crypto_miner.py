@@ -0,0 +1,107 @@
+from hashlib import sha256
+
+from pytest import raises as _
+
+from shared.classes.crypto.miner.miner import *
+from shared.classes.crypto.miner.pool import *
+
+EASY_BITS = 0x1F00FFFF                                                # простая цель: подходит примерно каждый 65 536-й хеш
+PREFIX = bytes(range(76))                                             # неизменная часть заголовка (80 байтов без nonce)
+
+
+def testp_compact_target():
+    # компактное представление цели разворачивается и сворачивается без потерь (для нормализованных значений)
+    assert bits_to_target(0x1D00FFFF) == 0xFFFF << 208                # цель генезис-блока биткоина
+    for bits in (0x1D00FFFF, 0x1B0404CB, 0x1F00FFFF, 0x207FFFFF, 0x03123456):
+        assert target_to_bits(bits_to_target(bits)) == bits
+
+    assert target_to_bits(0x80) == 0x02008000                         # старший бит мантиссы не должен попасть в знак
+
+
+def testn_compact_target():
+    # отрицательная (со знаковым битом), нулевая или слишком большая цель недопустима
+    for bits in (0x1D80FFFF, 0x1D000000, 0x2300FFFF, -1):
+        with _(ValueError):
+            bits_to_target(bits)
+
+    with _(ValueError):
+        target_to_bits(0)
+
+
+def testp_mine():
+    # найденный nonce действительно удовлетворяет цели, а хеш совпадает с двойным SHA-256 полного заголовка
+    miner = Miner(PREFIX, EASY_BITS)
+    result = miner.mine()
+    assert result.found
+    header = PREFIX + result.nonce.to_bytes(4, 'little')
+    assert result.digest == sha256(sha256(header).digest()).digest()
+    assert int.from_bytes(result.digest, 'little') <= miner.target
+    assert miner.check(result.nonce)
+    assert result.hashes == result.nonce + 1                          # перебор идет подряд с нуля
+    assert result.hashrate > 0
+
+    # эталонная реализация дает тот же хеш (состояние после префикса сохраняется и в ней)
+    assert Miner(PREFIX, EASY_BITS, backend='python').hash(result.nonce) == result.digest
+
+    # в диапазоне до найденного nonce решения нет
+    assert not miner.mine(0, result.nonce).found
+
+    # метод хеширования можно указать строкой (как при создании сообщения)
+    assert Miner(PREFIX, EASY_BITS, 'SHA-256').hash(result.nonce) == result.digest
+
+
+def testn_mine():
+    # неизменная часть заголовка должна поддерживать протокол буфера
+    with _(TypeError):
+        Miner('заголовок', EASY_BITS)                                 # noqa тестируем попытку передать строку
+
+    # диапазон nonce должен лежать в пределах 32-битного пространства
+    miner = Miner(PREFIX, EASY_BITS)
+    with _(ValueError):
+        miner.mine(10, 5)
+    with _(ValueError):
+        miner.mine(0, NONCE_LIMIT + 1)
+
+    # размер пачки перебора проверяется сразу, а не посередине перебора
+    for batch in (0, -1):
+        with _(ValueError):
+            Miner(PREFIX, EASY_BITS, batch=batch)
+
+    # перебор прекращается по признаку остановки (между пачками)
+    result = Miner(PREFIX, 0x1D00FFFF, batch=100).mine(should_stop=lambda: True)
+    assert not result.found and result.hashes == 100
+
+
+def testp_pool():
+    # несколько процессов находят nonce, удовлетворяющий цели; остальные процессы отменяются (метод можно указать строкой)
+    result = MinerPool(PREFIX, EASY_BITS, 'sha-256', workers=2).mine()
+    assert result.found and result.workers == 2
+    assert result.extra_nonce is None                                 # extra-nonce не используется
+    assert result.digest == Miner(PREFIX, EASY_BITS).hash(result.nonce)
+    assert result.hashes > 0
+
+    # extra-nonce записывается в шаблон по указанному смещению
+    result = MinerPool(PREFIX, EASY_BITS, workers=2, extra_nonce_offset=0).mine(extra_start=7, extra_stop=8)
+    assert result.found and result.extra_nonce == 7
+    prefix = (7).to_bytes(4, 'little') + PREFIX[4:]
+    assert result.digest == Miner(prefix, EASY_BITS).hash(result.nonce)
+
+
+def testn_pool():
+    # extra-nonce должен целиком помещаться в шаблон
+    with _(ValueError):
+        MinerPool(PREFIX, EASY_BITS, extra_nonce_offset=len(PREFIX) - 2)
+
+    # без смещения extra-nonce диапазон extra-nonce из нескольких значений недопустим (перебор повторялся бы)
+    with _(ValueError):
+        MinerPool(PREFIX, EASY_BITS, workers=2).mine(extra_start=0, extra_stop=2)
+
+    # некорректная цель и неизвестный метод обнаруживаются сразу, а не в дочерних процессах
+    with _(ValueError):
+        MinerPool(PREFIX, 0x1D80FFFF)
+    with _(ValueError):
+        MinerPool(PREFIX, EASY_BITS, 'sha-512')
+
+    # по истечении времени перебор прекращается без результата
+    result = MinerPool(PREFIX, 0x1D00FFFF, workers=2).mine(timeout=0.2)
+    assert not result.found and result.hashes > 0